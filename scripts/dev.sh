@@ -83,7 +83,7 @@ run_tests() {
             ;;
         integration)
             echo "🔗 Running integration tests..."
-            uv run pytest tests/integration/ -v
+            uv run pytest tests/integration/ -v -m "" -n auto --dist loadfile
             ;;
         unit)
             echo "🔬 Running unit tests..."
@@ -91,7 +91,7 @@ run_tests() {
             ;;
         semaphore)
             echo "🤖 Running Semaphore-specific tests..."
-            uv run pytest tests/contract/test_contract_semaphore.py tests/integration/test_semaphore_startup.py tests/integration/test_semaphore_shutdown.py -v
+            uv run pytest tests/contract/test_contract_semaphore.py tests/integration/test_semaphore_startup.py tests/integration/test_semaphore_shutdown.py -v -m "" -n auto --dist loadfile
             ;;
         coverage)
             echo "📊 Running tests with coverage..."
@@ -99,8 +99,8 @@ run_tests() {
             print_success "Coverage report generated in htmlcov/"
             ;;
         all)
-            echo "🔍 Running all tests..."
-            uv run pytest -v
+            echo "🔍 Running all tests (including integration)..."
+            uv run pytest -v -m "" -n auto --dist loadfile
             ;;
         *)
             echo "❓ Running specific test: $2"
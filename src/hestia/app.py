@@ -1,6 +1,8 @@
 import asyncio
 import json
+import threading
 import time
+from dataclasses import dataclass, field
 from typing import Optional, Any
 from urllib.parse import urljoin
 
@@ -8,6 +10,7 @@ import httpx
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import StreamingResponse
 
+from hestia import clock
 from hestia.config import load_config
 from hestia.logging import EventType, LogLevel, configure_logging, get_logger
 from hestia.metrics import get_metrics
@@ -16,7 +19,7 @@ from hestia.models.gateway import GatewayRequest, GatewayResponse, ServiceStatus
 from hestia.persistence import init_database
 from hestia.request_queue import RequestQueue
 from hestia.semaphore_client import get_semaphore_client
-from hestia.strategy_loader import StrategyRegistry, load_strategies
+from hestia.strategy_loader import get_registry, load_strategies
 
 app = FastAPI(title="Hestia API")
 
@@ -31,18 +34,34 @@ add_logging_middleware(app, exclude_paths=["/health", "/metrics", "/favicon.ico"
 # Initialize database on startup
 init_database()
 
-# Initialize request queue
-_request_queue = RequestQueue()
 
-# In-memory minimal state for readiness/idle tracking (per-service)
-_services: dict[str, dict] = {}
+@dataclass
+class AppState:
+    """Mutable gateway state, held in one object so it can be replaced atomically."""
+
+    # In-memory minimal state for readiness/idle tracking (per-service)
+    services: dict[str, dict] = field(default_factory=dict)
+    request_queue: RequestQueue = field(default_factory=RequestQueue)
+
+
+_state = AppState()
+
+
+def get_state() -> AppState:
+    """Return the current gateway state."""
+    return _state
+
+
 _IDLE_THREAD_STARTED = False
 
 # Global reference to the main asyncio event loop for thread-safe coroutine scheduling
 _MAIN_LOOP: Optional[asyncio.AbstractEventLoop] = None
 
+# Upstream client shared by all proxied requests so connections are kept alive
+_UPSTREAM_CLIENT: Optional[httpx.AsyncClient] = None
+
 # Load strategies and keep instances cache
-_strategy_registry = StrategyRegistry()
+_strategy_registry = get_registry()
 load_strategies("strategies")
 _strategy_instances: dict[str, Any] = {}
 
@@ -58,11 +77,44 @@ async def capture_main_event_loop():
     logger.info("Main event loop captured for Semaphore shutdown threading")
 
 
+@app.on_event("shutdown")
+async def close_upstream_client():
+    """Close the shared upstream client and its pooled connections."""
+    global _UPSTREAM_CLIENT
+    if _UPSTREAM_CLIENT is not None:
+        await _UPSTREAM_CLIENT.aclose()
+        _UPSTREAM_CLIENT = None
+
+
+@app.on_event("shutdown")
+async def close_strategy_instances():
+    """Let strategy instances that hold resources (e.g. HTTP clients) release them."""
+    for instance in list(_strategy_instances.values()):
+        aclose = getattr(instance, "aclose", None)
+        if aclose is None:
+            continue
+        try:
+            await aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close strategy instance: {e}")
+
+
 def _get_config():
     """Get current config (reloads to pick up env changes in tests)"""
     return load_config()
 
 
+def _upstream_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client used to forward requests to upstream services."""
+    global _UPSTREAM_CLIENT
+    if _UPSTREAM_CLIENT is None or _UPSTREAM_CLIENT.is_closed:
+        _UPSTREAM_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _UPSTREAM_CLIENT
+
+
 def _get_strategy_instance(name: str):
     """Get or create a strategy instance by name from registry."""
     try:
@@ -185,7 +237,7 @@ async def dispatch_request(gateway_request: GatewayRequest) -> GatewayResponse:
     service_config = _get_config().services.get(service_id, _get_config().services["ollama"])
 
     # Check if service is ready
-    service_state = _services.get(service_id, {})
+    service_state = _state.services.get(service_id, {})
     is_service_ready = (
         service_state.get("state") == "hot" and service_state.get("readiness") == "ready"
     )
@@ -193,9 +245,9 @@ async def dispatch_request(gateway_request: GatewayRequest) -> GatewayResponse:
     # If service is cold, queue the request and start the service
     if not is_service_ready:
         # Check if service startup is already in progress
-        if not _request_queue.is_service_starting(service_id):
+        if not _state.request_queue.is_service_starting(service_id):
             # Mark service as starting to prevent duplicate startup attempts
-            if _request_queue.mark_service_starting(service_id):
+            if _state.request_queue.mark_service_starting(service_id):
                 # Start service asynchronously
                 asyncio.create_task(_start_service_async(service_id, service_config))
 
@@ -209,7 +261,7 @@ async def dispatch_request(gateway_request: GatewayRequest) -> GatewayResponse:
 
         try:
             # Queue the request and wait for service to be ready
-            await _request_queue.queue_request(
+            await _state.request_queue.queue_request(
                 service_id=service_id,
                 request_data=request_data,
                 timeout_seconds=service_config.request_timeout_seconds,
@@ -309,131 +361,129 @@ async def _perform_gateway_request(
     if fallback:
         attempted_urls.append(fallback)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Try primary endpoint with retries
-        for attempt in range(total_attempts):
-            try:
-                upstream_response = await client.request(
-                    method=method, url=target, headers=headers, content=body, follow_redirects=False
-                )
+    client = _upstream_client()
+    # Try primary endpoint with retries
+    for attempt in range(total_attempts):
+        try:
+            upstream_response = await client.request(
+                method=method, url=target, headers=headers, content=body, follow_redirects=False
+            )
 
-                # Mark activity for idle tracking
-                _touch(gateway_request.service_id)
+            # Mark activity for idle tracking
+            _touch(gateway_request.service_id)
 
-                # Check if response indicates a healthy service (2xx-4xx) vs unhealthy (5xx)
-                if 200 <= upstream_response.status_code < 500:
-                    # Mark instance as healthy for successful responses (including 4xx client errors)
-                    _mark_instance_healthy_on_success(gateway_request.service_id, base)
-                else:
-                    # Mark instance as unhealthy for 5xx server errors
-                    _mark_instance_unhealthy_on_error(
-                        gateway_request.service_id,
-                        base,
-                        Exception(f"HTTP {upstream_response.status_code}"),
-                    )
+            # Check if response indicates a healthy service (2xx-4xx) vs unhealthy (5xx)
+            if 200 <= upstream_response.status_code < 500:
+                # Mark instance as healthy for successful responses (including 4xx client errors)
+                _mark_instance_healthy_on_success(gateway_request.service_id, base)
+            else:
+                # Mark instance as unhealthy for 5xx server errors
+                _mark_instance_unhealthy_on_error(
+                    gateway_request.service_id,
+                    base,
+                    Exception(f"HTTP {upstream_response.status_code}"),
+                )
 
-                # Prepare response headers
-                response_headers = dict(upstream_response.headers)
-                # Remove hop-by-hop headers from response
-                response_headers = {
-                    k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
-                }
+            # Prepare response headers
+            response_headers = dict(upstream_response.headers)
+            # Remove hop-by-hop headers from response
+            response_headers = {
+                k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
+            }
 
-                # Parse response body
-                response_body = None
-                content_type = upstream_response.headers.get("content-type", "").lower()
+            # Parse response body
+            response_body = None
+            content_type = upstream_response.headers.get("content-type", "").lower()
 
-                if "application/json" in content_type:
-                    try:
-                        response_body = upstream_response.json()
-                    except Exception:
-                        response_body = upstream_response.text
-                else:
+            if "application/json" in content_type:
+                try:
+                    response_body = upstream_response.json()
+                except Exception:
                     response_body = upstream_response.text
+            else:
+                response_body = upstream_response.text
 
-                # For 5xx errors, continue to retry/fallback instead of returning immediately
-                if upstream_response.status_code >= 500:
-                    if attempt < (total_attempts - 1):
-                        if retry_delay_ms > 0:
-                            await asyncio.sleep(retry_delay_ms / 1000.0)
-                        continue
-                    # If last attempt, will fall through to fallback logic
-
-                return GatewayResponse(
-                    status=upstream_response.status_code,
-                    headers=response_headers,
-                    body=response_body,
-                )
-
-            except Exception as e:
-                # Mark instance as unhealthy if using load balancer
-                _mark_instance_unhealthy_on_error(gateway_request.service_id, base, e)
-
-                # If not last attempt, honor delay and retry
+            # For 5xx errors, continue to retry/fallback instead of returning immediately
+            if upstream_response.status_code >= 500:
                 if attempt < (total_attempts - 1):
-                    # Log retry attempt
-                    logger.log_proxy_retry(
-                        gateway_request.service_id,
-                        target,
-                        attempt,
-                        total_attempts,
-                        str(e),
-                    )
                     if retry_delay_ms > 0:
-                        await asyncio.sleep(retry_delay_ms / 1000.0)
+                        await clock.delay(retry_delay_ms / 1000.0)
                     continue
-                # else exit loop to try fallback (if any)
-                break
-
-        # Try fallback once if available
-        if fallback:
-            # Log fallback attempt
-            logger.log_proxy_fallback(
-                gateway_request.service_id,
-                base,
-                fallback,
+                # If last attempt, will fall through to fallback logic
+
+            return GatewayResponse(
+                status=upstream_response.status_code,
+                headers=response_headers,
+                body=response_body,
             )
 
-            try:
-                fallback_target = urljoin(
-                    fallback.rstrip("/") + "/", gateway_request.path.lstrip("/")
+        except Exception as e:
+            # Mark instance as unhealthy if using load balancer
+            _mark_instance_unhealthy_on_error(gateway_request.service_id, base, e)
+
+            # If not last attempt, honor delay and retry
+            if attempt < (total_attempts - 1):
+                # Log retry attempt
+                logger.log_proxy_retry(
+                    gateway_request.service_id,
+                    target,
+                    attempt,
+                    total_attempts,
+                    str(e),
                 )
+                if retry_delay_ms > 0:
+                    await clock.delay(retry_delay_ms / 1000.0)
+                continue
+            # else exit loop to try fallback (if any)
+            break
 
-                upstream_response = await client.request(
-                    method=method,
-                    url=fallback_target,
-                    headers=headers,
-                    content=body,
-                    follow_redirects=False,
-                )
+    # Try fallback once if available
+    if fallback:
+        # Log fallback attempt
+        logger.log_proxy_fallback(
+            gateway_request.service_id,
+            base,
+            fallback,
+        )
+
+        try:
+            fallback_target = urljoin(fallback.rstrip("/") + "/", gateway_request.path.lstrip("/"))
+
+            upstream_response = await client.request(
+                method=method,
+                url=fallback_target,
+                headers=headers,
+                content=body,
+                follow_redirects=False,
+            )
 
-                _touch(gateway_request.service_id)
+            _touch(gateway_request.service_id)
 
-                response_headers = dict(upstream_response.headers)
-                response_headers = {
-                    k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
-                }
+            response_headers = dict(upstream_response.headers)
+            response_headers = {
+                k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
+            }
 
-                # Parse response body
-                response_body = None
-                content_type = upstream_response.headers.get("content-type", "").lower()
+            # Parse response body
+            response_body = None
+            content_type = upstream_response.headers.get("content-type", "").lower()
 
-                if "application/json" in content_type:
-                    try:
-                        response_body = upstream_response.json()
-                    except Exception:
-                        response_body = upstream_response.text
-                else:
+            if "application/json" in content_type:
+                try:
+                    response_body = upstream_response.json()
+                except Exception:
                     response_body = upstream_response.text
+            else:
+                response_body = upstream_response.text
 
-                return GatewayResponse(
-                    status=upstream_response.status_code,
-                    headers=response_headers,
-                    body=response_body,
-                )
+            return GatewayResponse(
+                status=upstream_response.status_code,
+                headers=response_headers,
+                body=response_body,
+            )
 
-            except Exception:
-                pass
+        except Exception:
+            pass
 
     # All attempts failed - log terminal error
     attempted_urls = [base]
@@ -459,7 +509,7 @@ def get_service_status(serviceId: str) -> ServiceStatus:
     service_config = _get_config().services.get(serviceId, _get_config().services["ollama"])
 
     # Get service state from in-memory store
-    service_state = _services.get(serviceId, {})
+    service_state = _state.services.get(serviceId, {})
     state = service_state.get("state", "cold")
     readiness = service_state.get("readiness", "not_ready")
 
@@ -470,17 +520,13 @@ def get_service_status(serviceId: str) -> ServiceStatus:
             resp = httpx.get(service_config.health_url, timeout=2.0)
             if resp.status_code == 200:
                 # Mark service as hot/ready
-                now_ms = int(time.time() * 1000)
-                svc = _services.setdefault(serviceId, {})
-                svc["state"] = "hot"
-                svc["readiness"] = "ready"
-                svc["last_used_ms"] = now_ms
+                _mark_service_hot(serviceId)
                 state = "hot"
                 readiness = "ready"
 
                 # Clear any starting flag in the queue since service is effectively ready
-                if _request_queue.is_service_starting(serviceId):
-                    _request_queue.mark_service_ready(serviceId)
+                if _state.request_queue.is_service_starting(serviceId):
+                    _state.request_queue.mark_service_ready(serviceId)
 
                 # Log detection of ready state
                 logger.log_service_ready(serviceId)
@@ -489,11 +535,11 @@ def get_service_status(serviceId: str) -> ServiceStatus:
             pass
 
     # Get queue information
-    queue_status = _request_queue.get_queue_status(serviceId)
+    queue_status = _state.request_queue.get_queue_status(serviceId)
 
     # Only override state to "starting" if service is not already hot/ready
     # and queue indicates startup is in progress
-    if _request_queue.is_service_starting(serviceId) and not (
+    if _state.request_queue.is_service_starting(serviceId) and not (
         state == "hot" and readiness == "ready"
     ):
         state = "starting"
@@ -570,7 +616,7 @@ async def start_service_proactively(serviceId: str) -> Response:
     _ensure_idle_monitor_started()
 
     # Check current service state
-    service_state = _services.get(serviceId, {})
+    service_state = _state.services.get(serviceId, {})
     current_state = service_state.get("state", "cold")
     current_readiness = service_state.get("readiness", "not_ready")
 
@@ -583,7 +629,7 @@ async def start_service_proactively(serviceId: str) -> Response:
         )
 
     # If service is already starting, return 409 Conflict
-    if _request_queue.is_service_starting(serviceId):
+    if _state.request_queue.is_service_starting(serviceId):
         return Response(
             status_code=409,
             content='{"message": "Service is already starting"}',
@@ -594,7 +640,7 @@ async def start_service_proactively(serviceId: str) -> Response:
     service_config = _get_config().services.get(serviceId, _get_config().services["ollama"])
 
     # Mark service as starting
-    if _request_queue.mark_service_starting(serviceId):
+    if _state.request_queue.mark_service_starting(serviceId):
         # Log service start
         start_time = time.time()
         logger.log_service_start(serviceId, metadata={"config": service_config.__dict__})
@@ -606,15 +652,12 @@ async def start_service_proactively(serviceId: str) -> Response:
             # Synchronous startup for fast tests
             try:
                 if service_config.warmup_ms > 0:
-                    time.sleep(service_config.warmup_ms / 1000.0)
+                    clock.delay_blocking(service_config.warmup_ms / 1000.0)
 
-                now_ms = int(time.time() * 1000)
-                _services.setdefault(serviceId, {})["readiness"] = "ready"
-                _services[serviceId]["state"] = "hot"
-                _services[serviceId]["last_used_ms"] = now_ms  # Set initial timestamp
+                _mark_service_hot(serviceId)
 
-                _request_queue.mark_service_ready(serviceId)
-                _request_queue.process_all_requests(serviceId, {"service_ready": True})
+                _state.request_queue.mark_service_ready(serviceId)
+                _state.request_queue.process_all_requests(serviceId, {"service_ready": True})
 
                 # Log service ready
                 startup_duration_ms = (time.time() - start_time) * 1000
@@ -626,8 +669,8 @@ async def start_service_proactively(serviceId: str) -> Response:
             except Exception as e:
                 logger.log_service_error(serviceId, f"Synchronous startup failed: {e}")
                 metrics.increment_counter("service_errors_total", service_id=serviceId)
-                _request_queue.clear_queue(serviceId)
-                _request_queue.mark_service_ready(serviceId)
+                _state.request_queue.clear_queue(serviceId)
+                _state.request_queue.mark_service_ready(serviceId)
         else:
             # Asynchronous startup for normal operation
             asyncio.create_task(_start_service_async(serviceId, service_config, start_time))
@@ -658,7 +701,7 @@ async def transparent_proxy(request: Request, serviceId: str, proxyPath: str) ->
     service_config = _get_config().services.get(serviceId, _get_config().services["ollama"])
 
     # Check if service is ready
-    service_state = _services.get(serviceId, {})
+    service_state = _state.services.get(serviceId, {})
     is_service_ready = (
         service_state.get("state") == "hot" and service_state.get("readiness") == "ready"
     )
@@ -666,9 +709,9 @@ async def transparent_proxy(request: Request, serviceId: str, proxyPath: str) ->
     # If service is cold, queue the request and start the service
     if not is_service_ready:
         # Check if service startup is already in progress
-        if not _request_queue.is_service_starting(serviceId):
+        if not _state.request_queue.is_service_starting(serviceId):
             # Mark service as starting to prevent duplicate startup attempts
-            if _request_queue.mark_service_starting(serviceId):
+            if _state.request_queue.mark_service_starting(serviceId):
                 # Start service asynchronously
                 asyncio.create_task(_start_service_async(serviceId, service_config))
 
@@ -683,7 +726,7 @@ async def transparent_proxy(request: Request, serviceId: str, proxyPath: str) ->
 
         try:
             # Queue the request and wait for service to be ready
-            await _request_queue.queue_request(
+            await _state.request_queue.queue_request(
                 service_id=serviceId,
                 request_data=request_data,
                 timeout_seconds=service_config.request_timeout_seconds,
@@ -768,142 +811,142 @@ async def _perform_proxy_request(
     retry_delay_ms = service_config.retry_delay_ms
     fallback = service_config.fallback_url
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Try primary endpoint with retries
-        for attempt in range(total_attempts):
-            try:
-                upstream_response = await client.request(
-                    method=method, url=target, headers=headers, content=body, follow_redirects=False
-                )
-
-                # Mark activity for idle tracking
-                _touch(serviceId)
+    client = _upstream_client()
+    # Try primary endpoint with retries
+    for attempt in range(total_attempts):
+        try:
+            upstream_response = await client.request(
+                method=method, url=target, headers=headers, content=body, follow_redirects=False
+            )
 
-                # Check if response indicates a healthy service (2xx-4xx) vs unhealthy (5xx)
-                if 200 <= upstream_response.status_code < 500:
-                    # Mark instance as healthy for successful responses (including 4xx client errors)
-                    _mark_instance_healthy_on_success(serviceId, base)
-                else:
-                    # Mark instance as unhealthy for 5xx server errors
-                    _mark_instance_unhealthy_on_error(
-                        serviceId, base, Exception(f"HTTP {upstream_response.status_code}")
-                    )
+            # Mark activity for idle tracking
+            _touch(serviceId)
 
-                # Calculate proxy duration and log
-                duration_ms = (time.time() - start_time) * 1000
-                logger.log_proxy_end(serviceId, target, upstream_response.status_code, duration_ms)
-                metrics.record_timer(
-                    "proxy_duration_ms",
-                    duration_ms,
-                    service_id=serviceId,
-                    labels={"method": method, "status": str(upstream_response.status_code)},
+            # Check if response indicates a healthy service (2xx-4xx) vs unhealthy (5xx)
+            if 200 <= upstream_response.status_code < 500:
+                # Mark instance as healthy for successful responses (including 4xx client errors)
+                _mark_instance_healthy_on_success(serviceId, base)
+            else:
+                # Mark instance as unhealthy for 5xx server errors
+                _mark_instance_unhealthy_on_error(
+                    serviceId, base, Exception(f"HTTP {upstream_response.status_code}")
                 )
 
-                # Prepare response headers
-                response_headers = dict(upstream_response.headers)
-                # Remove hop-by-hop headers from response
-                response_headers = {
-                    k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
-                }
-
-                # For 5xx errors, continue to retry/fallback instead of returning immediately
-                if upstream_response.status_code >= 500:
-                    if attempt < (total_attempts - 1):
-                        # Log retry attempt for 5xx errors
-                        logger.log_proxy_retry(
-                            serviceId,
-                            target,
-                            attempt,
-                            total_attempts,
-                            f"HTTP {upstream_response.status_code}",
-                        )
-                        if retry_delay_ms > 0:
-                            await asyncio.sleep(retry_delay_ms / 1000.0)
-                        continue
-                    # If last attempt, will fall through to fallback logic
-
-                # Handle streaming responses
-                if _should_stream_response(upstream_response):
-                    return StreamingResponse(
-                        content=upstream_response.iter_bytes(chunk_size=8192),
-                        status_code=upstream_response.status_code,
-                        headers=response_headers,
-                        media_type=upstream_response.headers.get("content-type"),
-                    )
-                else:
-                    return Response(
-                        content=upstream_response.content,
-                        status_code=upstream_response.status_code,
-                        headers=response_headers,
-                        media_type=upstream_response.headers.get("content-type"),
-                    )
+            # Calculate proxy duration and log
+            duration_ms = (time.time() - start_time) * 1000
+            logger.log_proxy_end(serviceId, target, upstream_response.status_code, duration_ms)
+            metrics.record_timer(
+                "proxy_duration_ms",
+                duration_ms,
+                service_id=serviceId,
+                labels={"method": method, "status": str(upstream_response.status_code)},
+            )
 
-            except Exception as e:
-                # Mark instance as unhealthy if using load balancer
-                _mark_instance_unhealthy_on_error(serviceId, base, e)
+            # Prepare response headers
+            response_headers = dict(upstream_response.headers)
+            # Remove hop-by-hop headers from response
+            response_headers = {
+                k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
+            }
 
-                # If not last attempt, honor delay and retry
+            # For 5xx errors, continue to retry/fallback instead of returning immediately
+            if upstream_response.status_code >= 500:
                 if attempt < (total_attempts - 1):
-                    # Log retry attempt
+                    # Log retry attempt for 5xx errors
                     logger.log_proxy_retry(
                         serviceId,
                         target,
                         attempt,
                         total_attempts,
-                        str(e),
+                        f"HTTP {upstream_response.status_code}",
                     )
                     if retry_delay_ms > 0:
-                        await asyncio.sleep(retry_delay_ms / 1000.0)
+                        await clock.delay(retry_delay_ms / 1000.0)
                     continue
-                # else exit loop to try fallback (if any)
-                break
-
-        # Try fallback once if available
-        if fallback:
-            # Log fallback attempt
-            logger.log_proxy_fallback(
-                serviceId,
-                base,
-                fallback,
-            )
+                # If last attempt, will fall through to fallback logic
 
-            try:
-                fallback_target = urljoin(fallback.rstrip("/") + "/", proxyPath)
-                if query_params:
-                    fallback_target = f"{fallback_target}?{query_params}"
-
-                upstream_response = await client.request(
-                    method=method,
-                    url=fallback_target,
-                    headers=headers,
-                    content=body,
-                    follow_redirects=False,
+            # Handle streaming responses
+            if _should_stream_response(upstream_response):
+                return StreamingResponse(
+                    content=upstream_response.iter_bytes(chunk_size=8192),
+                    status_code=upstream_response.status_code,
+                    headers=response_headers,
+                    media_type=upstream_response.headers.get("content-type"),
+                )
+            else:
+                return Response(
+                    content=upstream_response.content,
+                    status_code=upstream_response.status_code,
+                    headers=response_headers,
+                    media_type=upstream_response.headers.get("content-type"),
                 )
 
-                _touch(serviceId)
+        except Exception as e:
+            # Mark instance as unhealthy if using load balancer
+            _mark_instance_unhealthy_on_error(serviceId, base, e)
+
+            # If not last attempt, honor delay and retry
+            if attempt < (total_attempts - 1):
+                # Log retry attempt
+                logger.log_proxy_retry(
+                    serviceId,
+                    target,
+                    attempt,
+                    total_attempts,
+                    str(e),
+                )
+                if retry_delay_ms > 0:
+                    await clock.delay(retry_delay_ms / 1000.0)
+                continue
+            # else exit loop to try fallback (if any)
+            break
 
-                response_headers = dict(upstream_response.headers)
-                response_headers = {
-                    k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
-                }
+    # Try fallback once if available
+    if fallback:
+        # Log fallback attempt
+        logger.log_proxy_fallback(
+            serviceId,
+            base,
+            fallback,
+        )
 
-                if _should_stream_response(upstream_response):
-                    return StreamingResponse(
-                        content=upstream_response.iter_bytes(chunk_size=8192),
-                        status_code=upstream_response.status_code,
-                        headers=response_headers,
-                        media_type=upstream_response.headers.get("content-type"),
-                    )
-                else:
-                    return Response(
-                        content=upstream_response.content,
-                        status_code=upstream_response.status_code,
-                        headers=response_headers,
-                        media_type=upstream_response.headers.get("content-type"),
-                    )
+        try:
+            fallback_target = urljoin(fallback.rstrip("/") + "/", proxyPath)
+            if query_params:
+                fallback_target = f"{fallback_target}?{query_params}"
+
+            upstream_response = await client.request(
+                method=method,
+                url=fallback_target,
+                headers=headers,
+                content=body,
+                follow_redirects=False,
+            )
 
-            except Exception:
-                pass
+            _touch(serviceId)
+
+            response_headers = dict(upstream_response.headers)
+            response_headers = {
+                k: v for k, v in response_headers.items() if k.lower() not in hop_by_hop_headers
+            }
+
+            if _should_stream_response(upstream_response):
+                return StreamingResponse(
+                    content=upstream_response.iter_bytes(chunk_size=8192),
+                    status_code=upstream_response.status_code,
+                    headers=response_headers,
+                    media_type=upstream_response.headers.get("content-type"),
+                )
+            else:
+                return Response(
+                    content=upstream_response.content,
+                    status_code=upstream_response.status_code,
+                    headers=response_headers,
+                    media_type=upstream_response.headers.get("content-type"),
+                )
+
+        except Exception:
+            pass
 
     # All attempts failed - log terminal error
     attempted_urls = [base]
@@ -974,8 +1017,8 @@ async def _start_service_async(
         # Service startup failed, clear the queue and mark as not starting
         logger.log_service_error(service_id, f"Async startup failed: {e}")
         metrics.increment_counter("service_errors_total", service_id=service_id)
-        _request_queue.clear_queue(service_id)
-        _request_queue.mark_service_ready(service_id)  # Reset starting flag
+        _state.request_queue.clear_queue(service_id)
+        _state.request_queue.mark_service_ready(service_id)  # Reset starting flag
 
 
 async def _start_service_with_semaphore(
@@ -1036,14 +1079,11 @@ async def _start_service_with_semaphore(
         return
 
     # Mark service as ready
-    now_ms = int(time.time() * 1000)
-    _services.setdefault(service_id, {})["readiness"] = "ready"
-    _services[service_id]["state"] = "hot"
-    _services[service_id]["last_used_ms"] = now_ms
+    _mark_service_hot(service_id)
 
     # Mark service as ready and process all queued requests
-    _request_queue.mark_service_ready(service_id)
-    _request_queue.process_all_requests(service_id, {"service_ready": True})
+    _state.request_queue.mark_service_ready(service_id)
+    _state.request_queue.process_all_requests(service_id, {"service_ready": True})
 
     # Log service ready with timing
     if start_time:
@@ -1074,38 +1114,26 @@ async def _start_service_traditional(
             async with httpx.AsyncClient(timeout=10.0) as client:
                 resp = await client.get(health_url)
                 if resp.status_code == 200:
-                    now_ms = int(time.time() * 1000)
-                    _services.setdefault(service_id, {})["readiness"] = "ready"
-                    _services[service_id]["state"] = "hot"
-                    _services[service_id]["last_used_ms"] = now_ms
+                    _mark_service_hot(service_id)
                 else:
                     # Fallback to warmup delay
                     if warmup_ms > 0:
-                        await asyncio.sleep(warmup_ms / 1000.0)
-                    now_ms = int(time.time() * 1000)
-                    _services.setdefault(service_id, {})["readiness"] = "ready"
-                    _services[service_id]["state"] = "hot"
-                    _services[service_id]["last_used_ms"] = now_ms
+                        await clock.delay(warmup_ms / 1000.0)
+                    _mark_service_hot(service_id)
         except Exception:
             # Fallback to warmup delay
             if warmup_ms > 0:
-                await asyncio.sleep(warmup_ms / 1000.0)
-            now_ms = int(time.time() * 1000)
-            _services.setdefault(service_id, {})["readiness"] = "ready"
-            _services[service_id]["state"] = "hot"
-            _services[service_id]["last_used_ms"] = now_ms
+                await clock.delay(warmup_ms / 1000.0)
+            _mark_service_hot(service_id)
     else:
         # Use warmup delay
         if warmup_ms > 0:
-            await asyncio.sleep(warmup_ms / 1000.0)
-        now_ms = int(time.time() * 1000)
-        _services.setdefault(service_id, {})["readiness"] = "ready"
-        _services[service_id]["state"] = "hot"
-        _services[service_id]["last_used_ms"] = now_ms
+            await clock.delay(warmup_ms / 1000.0)
+        _mark_service_hot(service_id)
 
     # Mark service as ready and process all queued requests
-    _request_queue.mark_service_ready(service_id)
-    _request_queue.process_all_requests(service_id, {"service_ready": True})
+    _state.request_queue.mark_service_ready(service_id)
+    _state.request_queue.process_all_requests(service_id, {"service_ready": True})
 
     # Log service ready with timing
     if start_time:
@@ -1180,64 +1208,94 @@ def _json(payload: dict) -> Response:
 
 
 def _touch(service_id: str) -> None:
-    now_ms = int(time.time() * 1000)
-    svc = _services.setdefault(
-        service_id, {"state": "hot", "readiness": "ready", "last_used_ms": now_ms}
-    )
+    now_ms = clock.monotonic_ms()
+    svc = _state.services.get(service_id)
+    if svc is None:
+        _state.services[service_id] = {"state": "hot", "readiness": "ready", "last_used_ms": now_ms}
+        # A new hot service may expire before the idle monitor's next deadline
+        clock.idle_wakeup.set()
+        return
+    # Using a service only pushes its idle deadline later, so the monitor needn't wake
     svc["last_used_ms"] = now_ms
 
 
-def _idle_monitor_loop():
-    check_interval_ms = 25
-    while True:
-        now_ms = int(time.time() * 1000)
-        for sid, svc in list(_services.items()):
-            idle_ms = _get_idle_timeout_ms(sid)
-            if idle_ms <= 0:
-                continue
-            last = svc.get("last_used_ms", now_ms)
-            # Only flip hot services that have exceeded idle timeout
-            if svc.get("state") == "hot" and (now_ms - last) >= idle_ms:
-                old_state = svc.get("state", "unknown")
-                svc["state"] = "cold"
-                svc["readiness"] = "not_ready"
-
-                # Log state change
-                logger.log_service_state_change(
-                    sid, old_state, "cold", metadata={"reason": "idle_timeout", "idle_ms": idle_ms}
-                )
-                metrics.increment_counter(
-                    "service_state_changes_total",
-                    service_id=sid,
-                    labels={"from": old_state, "to": "cold", "reason": "idle_timeout"},
+def _mark_service_hot(service_id: str) -> None:
+    """Record a service as hot and ready, as of now."""
+    svc = _state.services.setdefault(service_id, {})
+    svc["readiness"] = "ready"
+    svc["state"] = "hot"
+    svc["last_used_ms"] = clock.monotonic_ms()
+    clock.idle_wakeup.set()
+
+
+def _reap_idle_services() -> Optional[int]:
+    """Flip hot services that have exceeded their idle timeout to cold.
+
+    Returns the milliseconds until the next hot service would go idle, or None if
+    no hot service has an idle timeout.
+    """
+    now_ms = clock.monotonic_ms()
+    next_expiry_ms = None
+    for sid, svc in list(_state.services.items()):
+        if svc.get("state") != "hot":
+            continue
+        idle_ms = _get_idle_timeout_ms(sid)
+        if idle_ms <= 0:
+            continue
+        remaining_ms = svc.get("last_used_ms", now_ms) + idle_ms - now_ms
+        if remaining_ms > 0:
+            if next_expiry_ms is None or remaining_ms < next_expiry_ms:
+                next_expiry_ms = remaining_ms
+            continue
+
+        # Idle timeout exceeded: flip the service cold
+        old_state = svc.get("state", "unknown")
+        svc["state"] = "cold"
+        svc["readiness"] = "not_ready"
+
+        # Log state change
+        logger.log_service_state_change(
+            sid, old_state, "cold", metadata={"reason": "idle_timeout", "idle_ms": idle_ms}
+        )
+        metrics.increment_counter(
+            "service_state_changes_total",
+            service_id=sid,
+            labels={"from": old_state, "to": "cold", "reason": "idle_timeout"},
+        )
+
+        # Trigger Semaphore shutdown if enabled
+        service_config = _get_config().services.get(sid, _get_config().services["ollama"])
+        if getattr(service_config, "semaphore_enabled", False):
+            # Schedule shutdown task on main loop in thread-safe way
+            if _MAIN_LOOP and not _MAIN_LOOP.is_closed():
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        _shutdown_service_with_semaphore(sid, service_config), _MAIN_LOOP
+                    )
+                except Exception as e:
+                    logger.log_service_error(sid, f"Failed to schedule Semaphore shutdown: {e}")
+            else:
+                logger.log_service_error(
+                    sid, "Main event loop not available for Semaphore shutdown"
                 )
 
-                # Trigger Semaphore shutdown if enabled
-                service_config = _get_config().services.get(sid, _get_config().services["ollama"])
-                if getattr(service_config, "semaphore_enabled", False):
-                    # Schedule shutdown task on main loop in thread-safe way
-                    if _MAIN_LOOP and not _MAIN_LOOP.is_closed():
-                        try:
-                            asyncio.run_coroutine_threadsafe(
-                                _shutdown_service_with_semaphore(sid, service_config), _MAIN_LOOP
-                            )
-                        except Exception as e:
-                            logger.log_service_error(
-                                sid, f"Failed to schedule Semaphore shutdown: {e}"
-                            )
-                    else:
-                        logger.log_service_error(
-                            sid, "Main event loop not available for Semaphore shutdown"
-                        )
-
-        time.sleep(check_interval_ms / 1000.0)
+    return next_expiry_ms
+
+
+def _idle_monitor_loop():
+    # Sleep until the earliest idle deadline; services turning hot wake the loop early.
+    # The cap bounds how long an idle-timeout config change can go unnoticed.
+    max_wait_ms = 1000
+    while True:
+        next_expiry_ms = _reap_idle_services()
+        wait_ms = max_wait_ms if next_expiry_ms is None else min(next_expiry_ms, max_wait_ms)
+        clock.sleep(wait_ms / 1000.0)
 
 
 def _ensure_idle_monitor_started() -> None:
     global _IDLE_THREAD_STARTED
     if _IDLE_THREAD_STARTED:
         return
-    import threading
 
     t = threading.Thread(target=_idle_monitor_loop, name="hestia-idle-monitor", daemon=True)
     t.start()
@@ -0,0 +1,35 @@
+"""
+Monotonic clock and delays used for idle-timeout bookkeeping and startup waits.
+
+Idle tracking reads time, and warmup/retry/poll waits sleep, through this module
+so tests can substitute a virtual clock and advance it explicitly instead of
+sleeping.
+"""
+
+import asyncio
+import threading
+import time
+
+# Set to wake the idle monitor before its next scheduled check
+idle_wakeup = threading.Event()
+
+
+def monotonic_ms() -> int:
+    """Current monotonic time in whole milliseconds."""
+    return time.monotonic_ns() // 1_000_000
+
+
+def sleep(seconds: float) -> None:
+    """Block for up to ``seconds``, returning early if ``idle_wakeup`` is set."""
+    if idle_wakeup.wait(seconds):
+        idle_wakeup.clear()
+
+
+async def delay(seconds: float) -> None:
+    """Suspend the calling task for ``seconds`` (warmup, retry and poll delays)."""
+    await asyncio.sleep(seconds)
+
+
+def delay_blocking(seconds: float) -> None:
+    """Block the calling thread for ``seconds`` (synchronous warmup)."""
+    time.sleep(seconds)
@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
@@ -89,6 +89,20 @@ class HestiaConfig(BaseModel):
             self.services["ollama"] = ServiceConfig()
 
 
+# Services registered in-process; these take precedence over YAML and environment
+_registered_services: Dict[str, ServiceConfig] = {}
+
+
+def register_service(service_id: str, service_config: ServiceConfig) -> None:
+    """Register a service configuration directly, bypassing YAML/environment parsing."""
+    _registered_services[service_id] = service_config
+
+
+def unregister_service(service_id: str) -> None:
+    """Remove a service previously added with ``register_service``."""
+    _registered_services.pop(service_id, None)
+
+
 def load_config(config_path: str = "hestia_config.yml") -> HestiaConfig:
     """Load configuration from YAML file with environment variable overrides."""
     config_data = {}
@@ -140,31 +154,59 @@ def load_config(config_path: str = "hestia_config.yml") -> HestiaConfig:
     # Format: <SERVICE_ID>_<CONFIG_KEY> = value
     _load_services_from_environment(config_data["services"])
 
-    return HestiaConfig(**config_data)
+    config = HestiaConfig(**config_data)
+    config.services.update(_registered_services)
+    return config
+
+
+# Standard field mappings for all services: env suffix -> (config field, type)
+_SERVICE_ENV_FIELDS = {
+    "BASE_URL": ("base_url", str),
+    "RETRY_COUNT": ("retry_count", int),
+    "RETRY_DELAY_MS": ("retry_delay_ms", int),
+    "HEALTH_URL": ("health_url", str),
+    "WARMUP_MS": ("warmup_ms", int),
+    "IDLE_TIMEOUT_MS": ("idle_timeout_ms", int),
+    "FALLBACK_URL": ("fallback_url", str),
+    "QUEUE_SIZE": ("queue_size", int),
+    "REQUEST_TIMEOUT_SECONDS": ("request_timeout_seconds", int),
+    # Semaphore fields
+    "SEMAPHORE_ENABLED": ("semaphore_enabled", bool),
+    "SEMAPHORE_MACHINE_ID": ("semaphore_machine_id", str),
+    "SEMAPHORE_START_TEMPLATE_ID": ("semaphore_start_template_id", int),
+    "SEMAPHORE_STOP_TEMPLATE_ID": ("semaphore_stop_template_id", int),
+    "SEMAPHORE_TASK_TIMEOUT": ("semaphore_task_timeout", int),
+    "SEMAPHORE_POLL_INTERVAL": ("semaphore_poll_interval", float),
+}
+_SERVICE_ENV_SUFFIXES = tuple((f"_{name}", name) for name in _SERVICE_ENV_FIELDS)
+
+# Env var name -> (service_id, field name), or None if it isn't a service setting.
+# Config is reloaded per request, so each variable name is only parsed once.
+_service_env_keys: Dict[str, Optional[Tuple[str, str]]] = {}
+
+
+def _parse_service_env_key(env_key: str) -> Optional[Tuple[str, str]]:
+    """Split ``<SERVICE_ID>_<FIELD_NAME>`` into ``(service-id, FIELD_NAME)``."""
+    try:
+        return _service_env_keys[env_key]
+    except KeyError:
+        pass
+
+    parsed = None
+    for suffix, field_name in _SERVICE_ENV_SUFFIXES:
+        if env_key.endswith(suffix):
+            service_id = env_key[: -len(suffix)].lower().replace("_", "-")
+            if service_id:
+                parsed = (service_id, field_name)
+            break
+
+    _service_env_keys[env_key] = parsed
+    return parsed
 
 
 def _load_services_from_environment(services_config: Dict[str, Any]):
     """Load service configurations from environment variables."""
-
-    # Standard field mappings for all services
-    field_mappings = {
-        "BASE_URL": ("base_url", str),
-        "RETRY_COUNT": ("retry_count", int),
-        "RETRY_DELAY_MS": ("retry_delay_ms", int),
-        "HEALTH_URL": ("health_url", str),
-        "WARMUP_MS": ("warmup_ms", int),
-        "IDLE_TIMEOUT_MS": ("idle_timeout_ms", int),
-        "FALLBACK_URL": ("fallback_url", str),
-        "QUEUE_SIZE": ("queue_size", int),
-        "REQUEST_TIMEOUT_SECONDS": ("request_timeout_seconds", int),
-        # Semaphore fields
-        "SEMAPHORE_ENABLED": ("semaphore_enabled", bool),
-        "SEMAPHORE_MACHINE_ID": ("semaphore_machine_id", str),
-        "SEMAPHORE_START_TEMPLATE_ID": ("semaphore_start_template_id", int),
-        "SEMAPHORE_STOP_TEMPLATE_ID": ("semaphore_stop_template_id", int),
-        "SEMAPHORE_TASK_TIMEOUT": ("semaphore_task_timeout", int),
-        "SEMAPHORE_POLL_INTERVAL": ("semaphore_poll_interval", float),
-    }
+    field_mappings = _SERVICE_ENV_FIELDS
 
     # Collect all environment variables that match service patterns
     service_env_vars = {}
@@ -173,17 +215,9 @@ def _load_services_from_environment(services_config: Dict[str, Any]):
             continue
 
         # Look for pattern: <SERVICE_ID>_<FIELD_NAME>
-        found_field = None
-        service_id = None
-
-        for field_name in field_mappings.keys():
-            if env_key.endswith(f"_{field_name}"):
-                # Extract service ID
-                service_id = env_key[: -len(f"_{field_name}")].lower().replace("_", "-")
-                found_field = field_name
-                break
-
-        if found_field and service_id:
+        parsed = _parse_service_env_key(env_key)
+        if parsed:
+            service_id, found_field = parsed
             if service_id not in service_env_vars:
                 service_env_vars[service_id] = {}
             service_env_vars[service_id][found_field] = env_value
@@ -11,6 +11,7 @@ from typing import Dict, Optional, Any
 import httpx
 from pydantic import BaseModel
 
+from . import clock
 from .logging import get_logger
 
 
@@ -297,7 +298,7 @@ class SemaphoreClient:
                 return status_response
 
             # Wait before next poll
-            await asyncio.sleep(poll_interval)
+            await clock.delay(poll_interval)
 
 
 # Global client instance
@@ -1,28 +1,32 @@
 import threading
-from typing import Dict, Callable, List
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Dict, Callable, List, Optional, Tuple
+import hashlib
+import importlib.machinery
 import importlib.util
 import os
 import sys
 
 
 class StrategyRegistry:
-    """Thread-safe singleton registry for strategy plugins."""
+    """Thread-safe singleton registry for strategy plugins.
 
-    _instance = None
-    _lock = threading.Lock()
+    The single instance is created eagerly at import time; use ``get_registry()``
+    to obtain it. ``StrategyRegistry()`` is kept for backward compatibility and
+    returns the same instance.
+    """
 
     def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._init_registry()
-        return cls._instance
+        return _REGISTRY
 
     def _init_registry(self):
         """Initialize the registry data structures."""
         self._strategies: Dict[str, Callable] = {}
-        self._registry_lock = threading.RLock()
+        # Only writers take the lock; single dict reads are atomic under the GIL
+        self._registry_lock = threading.Lock()
+        # Loaded plugin modules keyed by file path, with the mtime they were loaded at
+        self._module_cache: Dict[str, Tuple[int, ModuleType]] = {}
 
     def register(self, name: str, strategy: Callable) -> None:
         """Register a strategy with the given name."""
@@ -33,15 +37,14 @@ class StrategyRegistry:
 
     def get_strategy(self, name: str) -> Callable:
         """Get a strategy by name."""
-        with self._registry_lock:
-            if name not in self._strategies:
-                raise KeyError(f"Strategy '{name}' not found")
-            return self._strategies[name]
+        strategy = self._strategies.get(name)
+        if strategy is None:
+            raise KeyError(f"Strategy '{name}' not found")
+        return strategy
 
     def list_strategies(self) -> List[str]:
         """List all registered strategy names."""
-        with self._registry_lock:
-            return list(self._strategies.keys())
+        return list(self._strategies)
 
     def clear(self) -> None:
         """Clear all registered strategies (mainly for testing)."""
@@ -49,57 +52,136 @@ class StrategyRegistry:
             self._strategies.clear()
 
 
-def load_strategies(strategies_dir: str) -> None:
-    """Load strategy plugins from a directory."""
-    registry = StrategyRegistry()
+_REGISTRY = object.__new__(StrategyRegistry)
+_REGISTRY._init_registry()
 
-    if not os.path.exists(strategies_dir):
-        return
 
-    if not os.path.isdir(strategies_dir):
-        return
+def get_registry() -> StrategyRegistry:
+    """Return the process-wide strategy registry."""
+    return _REGISTRY
 
-    # Add the parent directory to sys.path temporarily
-    parent_dir = os.path.dirname(strategies_dir)
-    strategies_package_name = os.path.basename(strategies_dir)
 
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-        path_added = True
-    else:
-        path_added = False
+def _plugin_package_name(strategies_dir: str) -> str:
+    """Return the private package name plugins in ``strategies_dir`` load under.
 
-    try:
-        # Scan for Python files in the strategies directory
-        for filename in os.listdir(strategies_dir):
-            if not filename.endswith(".py") or filename.startswith("__"):
-                continue
+    The name is derived from the absolute path, so it never shadows a real
+    module (``load_strategies("plugins/logging")`` must not replace the stdlib
+    ``logging``) and two directories with the same basename never collide.
+    """
+    digest = hashlib.sha1(strategies_dir.encode()).hexdigest()[:12]
+    return f"_hestia_strategies_{digest}"
 
-            module_name = filename[:-3]  # Remove .py extension
-            full_module_name = f"{strategies_package_name}.{module_name}"
-            module_path = os.path.join(strategies_dir, filename)
 
-            try:
-                # Load the module
-                spec = importlib.util.spec_from_file_location(full_module_name, module_path)
-                if spec is None or spec.loader is None:
-                    continue
+def _ensure_parent_package(package_name: str, package_dir: str) -> bool:
+    """Register the plugin directory as a package so plugins import through it.
 
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+    Returns False, leaving ``sys.modules`` untouched, if the name is already
+    taken by a module that does not point at ``package_dir``.
+    """
+    existing = sys.modules.get(package_name)
+    if existing is not None:
+        return list(getattr(existing, "__path__", ())) == [package_dir]
 
-                # Check if the module has a register_strategy function
-                if hasattr(module, "register_strategy"):
-                    try:
-                        module.register_strategy(registry)
-                    except Exception as e:
-                        print(f"Warning: Failed to register strategies from {filename}: {e}")
+    spec = importlib.machinery.ModuleSpec(package_name, None, is_package=True)
+    spec.submodule_search_locations = [package_dir]
+    sys.modules[package_name] = importlib.util.module_from_spec(spec)
+    return True
 
-            except Exception as e:
-                print(f"Warning: Failed to load strategy module {filename}: {e}")
+
+def _load_module(full_module_name: str) -> ModuleType:
+    """Import a plugin module through its parent package.
+
+    The import system publishes the module in ``sys.modules`` under a per-module
+    lock, so a plugin that imports a sibling still being loaded by another
+    worker waits for it to finish executing instead of seeing it half-built.
+    """
+    return importlib.import_module(full_module_name)
+
+
+def load_strategies(strategies_dir: str) -> None:
+    """Load strategy plugins from a directory.
+
+    Modules that changed since the last load are executed concurrently;
+    ``register_strategy`` hooks then run serially in directory order.
+    """
+    registry = get_registry()
+    # Normalized so that e.g. "plugins/" and "plugins" share one package
+    strategies_dir = os.path.abspath(os.path.normpath(strategies_dir))
+
+    try:
+        entries = os.scandir(strategies_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    strategies_package_name = _plugin_package_name(strategies_dir)
+
+    # Scan for Python files in the strategies directory
+    candidates: List[Tuple[str, str, int]] = []
+    with entries:
+        for entry in entries:
+            filename = entry.name
+            if (
+                not filename.endswith(".py")
+                or filename.startswith("__")
+                or not entry.is_file(follow_symlinks=False)
+            ):
                 continue
+            try:
+                candidates.append((filename, entry.path, entry.stat().st_mtime_ns))
+            except OSError as e:
+                print(f"Warning: Failed to load strategy module {filename}: {e}")
 
-    finally:
-        # Remove the parent directory from sys.path if we added it
-        if path_added:
-            sys.path.remove(parent_dir)
+    # Reuse previously loaded modules whose files are unchanged
+    modules: Dict[str, Optional[ModuleType]] = {}
+    pending: List[Tuple[str, str, int]] = []
+    for filename, module_path, mtime in candidates:
+        cached = registry._module_cache.get(module_path)
+        if cached is not None and cached[0] == mtime:
+            modules[filename] = cached[1]
+        else:
+            pending.append((filename, module_path, mtime))
+
+    # Execute new or changed modules in parallel
+    if pending and not _ensure_parent_package(strategies_package_name, strategies_dir):
+        print(
+            f"Warning: Failed to load strategy modules from {strategies_dir}: "
+            f"module name {strategies_package_name} is already in use"
+        )
+        pending = []
+    if pending:
+        # Files may have been added or edited since the import system last looked
+        importlib.invalidate_caches()
+        module_names = {
+            filename: f"{strategies_package_name}.{filename[:-3]}" for filename, _, _ in pending
+        }
+        # Forget stale copies first, so changed files are executed again
+        for module_name in module_names.values():
+            sys.modules.pop(module_name, None)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            futures = {
+                executor.submit(_load_module, module_names[filename]): (
+                    filename,
+                    module_path,
+                    mtime,
+                )
+                for filename, module_path, mtime in pending
+            }
+            for future, (filename, module_path, mtime) in futures.items():
+                try:
+                    module = future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to load strategy module {filename}: {e}")
+                    continue
+                registry._module_cache[module_path] = (mtime, module)
+                modules[filename] = module
+
+    # Register strategies serially, in directory scan order
+    for filename, _, _ in candidates:
+        module = modules.get(filename)
+        # Check if the module has a register_strategy function
+        if module is not None and hasattr(module, "register_strategy"):
+            try:
+                module.register_strategy(registry)
+            except Exception as e:
+                print(f"Warning: Failed to register strategies from {filename}: {e}")
@@ -5,11 +5,68 @@ This strategy demonstrates how to implement custom routing logic
 based on request characteristics, user attributes, or business rules.
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional
+import bisect
 import hashlib
+import operator
+import re
+import sys
 import time
 
 
+def _default_fallback() -> Dict[str, Any]:
+    """Decision returned when a service has no custom routing configured."""
+    return {
+        "target_url": "http://localhost:11434",  # Default
+        "routing_strategy": "default_fallback",
+        "metadata": {"reason": "No custom rules defined"},
+    }
+
+
+def _ab_test_inactive() -> Dict[str, Any]:
+    """Decision returned while an A/B test is outside its active window."""
+    return {
+        "target_url": "http://localhost:11434",
+        "routing_strategy": "ab_test_inactive",
+        "metadata": {"reason": "A/B test not currently active"},
+    }
+
+
+@lru_cache(maxsize=100_000)
+def _hash_bucket(user_id: str, salt: bytes) -> int:
+    """Consistent 0-99 bucket for a user and service salt (memoized for repeat users)."""
+    hash_value = int(hashlib.md5(user_id.encode() + salt).hexdigest(), 16)
+    return hash_value % 100
+
+
+def _as_str(value: Any) -> str:
+    """Return value as a string, skipping the conversion when it already is one."""
+    return value if type(value) is str else str(value)
+
+
+# Comparison operators for complex conditions: op(context_value, expected) -> bool
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "contains": lambda value, expected: expected in _as_str(value),
+    "regex": lambda value, expected: bool(re.match(expected, _as_str(value))),
+}
+
+
+@dataclass(slots=True)
+class ServiceRoutingState:
+    """Precompiled routing rules and A/B test configuration for a single service."""
+
+    rules: Optional[List[Dict[str, Any]]] = None
+    ab_test: Optional[Dict[str, Any]] = None
+
+
 class CustomRoutingStrategy:
     """
     Custom routing strategy with multiple routing algorithms.
@@ -23,11 +80,32 @@ class CustomRoutingStrategy:
         self.description = "Flexible routing with multiple algorithms"
         self.version = "1.0.0"
 
-        # Routing rules and configurations
-        self.routing_rules: Dict[str, List[Dict[str, Any]]] = {}
-        self.ab_test_configs: Dict[str, Dict[str, Any]] = {}
+        # Routing rules and A/B test configurations, keyed by service
+        self._service_state: Dict[str, ServiceRoutingState] = {}
         self.user_preferences: Dict[str, Dict[str, str]] = {}
 
+        # Configurations as registered; exposed through read-only views
+        self._routing_rules: Dict[str, List[Dict[str, Any]]] = {}
+        self._ab_test_configs: Dict[str, Dict[str, Any]] = {}
+        self._routing_rules_view = MappingProxyType(self._routing_rules)
+        self._ab_test_configs_view = MappingProxyType(self._ab_test_configs)
+
+    @property
+    def routing_rules(self) -> Mapping[str, List[Dict[str, Any]]]:
+        """Registered routing rules per service (read-only view).
+
+        Use ``register_routing_rules`` to change them.
+        """
+        return self._routing_rules_view
+
+    @property
+    def ab_test_configs(self) -> Mapping[str, Dict[str, Any]]:
+        """Registered A/B test configurations per service (read-only view).
+
+        Use ``setup_ab_test`` to change them.
+        """
+        return self._ab_test_configs_view
+
     def register_routing_rules(self, service_id: str, rules: List[Dict[str, Any]]):
         """
         Register routing rules for a service.
@@ -64,7 +142,25 @@ class CustomRoutingStrategy:
                 }
             ]
         """
-        self.routing_rules[service_id] = rules
+        self._routing_rules[service_id] = rules
+        state = self._service_state.setdefault(service_id, ServiceRoutingState())
+        state.rules = [self._compile_rule(rule) for rule in rules]
+
+    @staticmethod
+    def _compile_rule(rule: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute a batch getter for rules whose condition is pure scalar equality."""
+        condition = rule["condition"]
+        if not condition or any(isinstance(v, (list, dict)) for v in condition.values()):
+            return rule
+
+        keys = [sys.intern(key) for key in condition]
+        values = tuple(condition.values())
+        return {
+            **rule,
+            "_getter": operator.itemgetter(*keys),
+            # itemgetter returns a bare value for a single key, a tuple otherwise
+            "_expected": values[0] if len(values) == 1 else values,
+        }
 
     def setup_ab_test(self, service_id: str, test_config: Dict[str, Any]):
         """
@@ -87,7 +183,20 @@ class CustomRoutingStrategy:
                 "metrics": ["response_time", "user_satisfaction"]
             }
         """
-        self.ab_test_configs[service_id] = test_config
+        variants = test_config["variants"]
+        self._ab_test_configs[service_id] = test_config
+        state = self._service_state.setdefault(service_id, ServiceRoutingState())
+        state.ab_test = {
+            **test_config,
+            # Active window normalized once so the hot path can index directly
+            "_start": float(test_config.get("start_time", 0)),
+            "_end": float(test_config.get("end_time", float("inf"))),
+            # Cumulative traffic boundaries for O(log n) variant selection
+            "_cum": list(accumulate(variant["traffic"] for variant in variants)),
+            "_variants": [(variant["target"], variant["name"]) for variant in variants],
+            # Encoded once; hash input is user_id + "_" + service_id
+            "_salt_bytes": f"_{service_id}".encode(),
+        }
 
     def route_request(self, service_id: str, request_context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -100,41 +209,34 @@ class CustomRoutingStrategy:
         Returns:
             Routing decision with target URL and metadata
         """
+        state = self._service_state.get(service_id)
+        if state is None:
+            # Fallback to default routing
+            return _default_fallback()
+
         # Check for active A/B tests first
-        if service_id in self.ab_test_configs:
-            ab_result = self._route_ab_test(service_id, request_context)
+        if state.ab_test is not None:
+            ab_result = self._route_ab_test(state.ab_test, request_context)
             if ab_result["routing_strategy"].startswith("ab_test") and not ab_result[
                 "routing_strategy"
             ].endswith("_inactive"):
                 return ab_result
 
         # Apply custom routing rules
-        if service_id in self.routing_rules:
-            return self._route_by_rules(service_id, request_context)
+        if state.rules is not None:
+            return self._route_by_rules(state.rules, request_context)
 
-        # Fallback to default routing
-        return {
-            "target_url": "http://localhost:11434",  # Default
-            "routing_strategy": "default_fallback",
-            "metadata": {"reason": "No custom rules defined"},
-        }
+        return _default_fallback()
 
-    def _route_ab_test(self, service_id: str, request_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _route_ab_test(
+        self, test_config: Dict[str, Any], request_context: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Route request based on A/B test configuration."""
-        test_config = self.ab_test_configs[service_id]
         current_time = time.time()
 
         # Check if test is active
-        if not (
-            test_config.get("start_time", 0)
-            <= current_time
-            <= test_config.get("end_time", float("inf"))
-        ):
-            return {
-                "target_url": "http://localhost:11434",
-                "routing_strategy": "ab_test_inactive",
-                "metadata": {"reason": "A/B test not currently active"},
-            }
+        if not (test_config["_start"] <= current_time <= test_config["_end"]):
+            return _ab_test_inactive()
 
         # Determine user assignment
         user_id = request_context.get("user_id", "anonymous")
@@ -142,26 +244,26 @@ class CustomRoutingStrategy:
 
         if assignment_method == "hash_based":
             # Consistent assignment based on user ID
-            hash_value = int(hashlib.md5(f"{user_id}_{service_id}".encode()).hexdigest(), 16)
-            assignment_value = hash_value % 100
+            if type(user_id) is not str:
+                user_id = str(user_id)
+            assignment_value = _hash_bucket(user_id, test_config["_salt_bytes"])
         else:
             # Random assignment (note: not truly random without seed management)
             assignment_value = hash(user_id) % 100
 
         # Select variant based on traffic allocation
-        cumulative_traffic = 0
-        for variant in test_config["variants"]:
-            cumulative_traffic += variant["traffic"]
-            if assignment_value < cumulative_traffic:
-                return {
-                    "target_url": variant["target"],
-                    "routing_strategy": "ab_test",
-                    "metadata": {
-                        "test_name": test_config["name"],
-                        "variant": variant["name"],
-                        "assignment_value": assignment_value,
-                    },
-                }
+        idx = bisect.bisect_right(test_config["_cum"], assignment_value)
+        if idx < len(test_config["_variants"]):
+            target, variant_name = test_config["_variants"][idx]
+            return {
+                "target_url": target,
+                "routing_strategy": "ab_test",
+                "metadata": {
+                    "test_name": test_config["name"],
+                    "variant": variant_name,
+                    "assignment_value": assignment_value,
+                },
+            }
 
         # Should not reach here with proper configuration
         return {
@@ -170,13 +272,23 @@ class CustomRoutingStrategy:
             "metadata": {"reason": "No variant matched traffic allocation"},
         }
 
-    def _route_by_rules(self, service_id: str, request_context: Dict[str, Any]) -> Dict[str, Any]:
+    def _route_by_rules(
+        self, rules: List[Dict[str, Any]], request_context: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Route request based on custom rules."""
-        rules = self.routing_rules[service_id]
-
         # Evaluate rules in order
         for rule in rules:
-            if self._evaluate_condition(rule["condition"], request_context):
+            getter = rule.get("_getter")
+            if getter is not None:
+                try:
+                    matched = getter(request_context) == rule["_expected"]
+                except KeyError:
+                    # Missing keys compare as None; defer to the general evaluator
+                    matched = self._evaluate_condition(rule["condition"], request_context)
+            else:
+                matched = self._evaluate_condition(rule["condition"], request_context)
+
+            if matched:
                 return {
                     "target_url": rule["target"],
                     "routing_strategy": "rule_based",
@@ -224,23 +336,9 @@ class CustomRoutingStrategy:
             return min_val <= value <= max_val
 
         if "operator" in condition:
-            op = condition["operator"]
-            expected = condition["value"]
-
-            if op == "gt":
-                return value > expected
-            elif op == "gte":
-                return value >= expected
-            elif op == "lt":
-                return value < expected
-            elif op == "lte":
-                return value <= expected
-            elif op == "contains":
-                return expected in str(value)
-            elif op == "regex":
-                import re
-
-                return bool(re.match(expected, str(value)))
+            op_func = _OPERATORS.get(condition["operator"])
+            if op_func is not None:
+                return op_func(value, condition["value"])
 
         return False
 
@@ -310,9 +408,12 @@ def register_strategy(registry):
     This function is called by Hestia's strategy loader.
     Register your strategy with the provided registry.
     """
+    # One shared router per registration; rules and A/B tests are configured
+    # once at startup, so every lookup can reuse the same instance.
+    shared_router = CustomRoutingStrategy()
 
     def create_custom_routing():
-        return CustomRoutingStrategy()
+        return shared_router
 
     registry.register("custom_routing", create_custom_routing)
 
@@ -6,12 +6,16 @@ logic for monitoring service health and automatically triggering
 recovery actions.
 """
 
-from typing import Dict, Any, List
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple
+import logging
 import time
 import asyncio
 import httpx
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class HealthStatus(Enum):
     """Health status enumeration."""
@@ -22,6 +26,33 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# Severity used to combine endpoint statuses (worst wins). UNKNOWN ranks below
+# HEALTHY so that an unknown endpoint never worsens the overall status.
+_SEVERITY: Dict[HealthStatus, int] = {
+    HealthStatus.UNKNOWN: -1,
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNHEALTHY: 2,
+}
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a health result along with its small nested containers.
+
+    Cheaper than a deepcopy: the nesting is fixed and shallow, and the leaves
+    are immutable strings and numbers.
+    """
+    copy = dict(result)
+    copy["endpoints"] = [dict(endpoint) for endpoint in result["endpoints"]]
+    copy["circuit_breaker"] = dict(result["circuit_breaker"])
+    copy["recommendations"] = list(result["recommendations"])
+    validation = dict(result["validation"])
+    if "over_threshold" in validation:
+        validation["over_threshold"] = list(validation["over_threshold"])
+    copy["validation"] = validation
+    return copy
+
+
 class HealthCheckerStrategy:
     """
     Advanced health checker with multiple check types and recovery actions.
@@ -30,21 +61,78 @@ class HealthCheckerStrategy:
     and automatic recovery triggers.
     """
 
+    __slots__ = (
+        "_breaker_opened_at",
+        "_cached_result",
+        "_check_locks",
+        "_active_rounds",
+        "_check_semaphore",
+        "_check_semaphore_limit",
+        "_client",
+        "_healthy_recent",
+        "_pending_tasks",
+        "_recent",
+        "_service_configs",
+        "_strategy_info",
+        "check_interval",
+        "circuit_breaker_cooldown",
+        "circuit_breakers",
+        "description",
+        "failure_threshold",
+        "health_history",
+        "max_concurrent_checks",
+        "name",
+        "recovery_threshold",
+        "timeout_seconds",
+        "version",
+    )
+
     def __init__(self):
         self.name = "health_checker"
         self.description = "Advanced health monitoring with recovery actions"
         self.version = "1.0.0"
 
         # Health tracking
-        self.health_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.health_history: Dict[str, Deque[Dict[str, Any]]] = {}
         self.circuit_breakers: Dict[str, Dict[str, Any]] = {}
-        self.last_check_time: Dict[str, float] = {}
+        # Monotonic time each breaker last opened, used for the cooldown
+        # (last_failure_time stays wall-clock for reporting)
+        self._breaker_opened_at: Dict[str, float] = {}
+        # Healthy flags of the last 10 checks and how many of them are healthy,
+        # maintained by _add_to_history
+        self._recent: Dict[str, Deque[bool]] = {}
+        self._healthy_recent: Dict[str, int] = {}
 
         # Configuration
         self.check_interval = 30  # seconds
         self.failure_threshold = 3
         self.recovery_threshold = 2
         self.timeout_seconds = 5
+        # Sizes _check_semaphore; changes apply from the next check round
+        self.max_concurrent_checks = 10
+        self.circuit_breaker_cooldown = 60  # seconds an open breaker skips probes
+
+        # Health check configuration per registered service
+        self._service_configs: Dict[str, Dict[str, Any]] = {}
+
+        # Shared HTTP client (created lazily) so probes reuse pooled connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Probe limit shared by all services, created inside the running loop by
+        # _probe_semaphore, and the number of check rounds currently using it
+        self._check_semaphore: Optional[asyncio.Semaphore] = None
+        self._check_semaphore_limit = 0
+        self._active_rounds = 0
+
+        # Most recent (monotonic check time, result) per service and per-service probe locks
+        self._cached_result: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._check_locks: Dict[str, asyncio.Lock] = {}
+
+        # Background recovery-action tasks (strong refs until they finish)
+        self._pending_tasks: Set[asyncio.Task] = set()
+
+        # (settings key, info) memo for get_strategy_info
+        self._strategy_info: Optional[Tuple[tuple, Dict[str, Any]]] = None
 
     def register_service(self, service_id: str, health_config: Dict[str, Any]):
         """
@@ -72,20 +160,53 @@ class HealthCheckerStrategy:
                 }
             }
         """
-        self.health_history[service_id] = []
+        self.health_history[service_id] = deque(maxlen=100)
+        self._recent[service_id] = deque(maxlen=10)
+        self._healthy_recent[service_id] = 0
         self.circuit_breakers[service_id] = {
             "state": "closed",  # closed, open, half_open
             "failure_count": 0,
             "last_failure_time": 0,
             "last_success_time": time.time(),
         }
-        self.last_check_time[service_id] = 0
+        self._breaker_opened_at.pop(service_id, None)
+        self._cached_result.pop(service_id, None)
 
         # Store configuration for this service
-        if not hasattr(self, "_service_configs"):
-            self._service_configs = {}
         self._service_configs[service_id] = health_config
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        # No await between the check and the assignment, so concurrent callers
+        # on the loop can't both create a client
+        if self._client is None:
+            # Timeouts are passed per request so timeout_seconds changes apply
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            )
+        return self._client
+
+    def _probe_semaphore(self) -> asyncio.Semaphore:
+        """Return the probe semaphore, sized to max_concurrent_checks.
+
+        A changed limit only takes effect once no check round is in flight, so
+        probes admitted by an old semaphore never run alongside a new one.
+        """
+        limit = self.max_concurrent_checks
+        semaphore = self._check_semaphore
+        if semaphore is None or (self._check_semaphore_limit != limit and not self._active_rounds):
+            semaphore = self._check_semaphore = asyncio.Semaphore(limit)
+            self._check_semaphore_limit = limit
+        return semaphore
+
+    async def aclose(self):
+        """Wait for pending recovery actions, then close the shared HTTP client."""
+        if self._pending_tasks:
+            await asyncio.gather(*self._pending_tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def check_service_health(self, service_id: str) -> Dict[str, Any]:
         """
         Perform comprehensive health check for a service.
@@ -100,34 +221,99 @@ class HealthCheckerStrategy:
                 "timestamp": time.time(),
             }
 
-        config = self._service_configs[service_id]
-        start_time = time.time()
-
-        # Skip check if too recent
-        if (start_time - self.last_check_time.get(service_id, 0)) < self.check_interval:
-            return self._get_last_health_result(service_id)
+        # Serve the cached result while it is fresh. Callers get their own copy
+        # (see _copy_result) so mutating a result can't corrupt the cache or
+        # the history.
+        cached = self._cached_result.get(service_id)
+        if cached is not None and (time.monotonic() - cached[0]) < self.check_interval:
+            return _copy_result(cached[1])
+
+        lock = self._check_locks.get(service_id)
+        if lock is None:
+            lock = self._check_locks.setdefault(service_id, asyncio.Lock())
+
+        async with lock:
+            # Another caller may have refreshed the result while we waited
+            cached = self._cached_result.get(service_id)
+            if cached is not None and (time.monotonic() - cached[0]) < self.check_interval:
+                return _copy_result(cached[1])
+
+            # An open breaker skips probing until the cooldown has elapsed,
+            # then lets a single half-open probe decide whether to close it
+            cb = self.circuit_breakers[service_id]
+            if cb["state"] == "open":
+                opened_at = self._breaker_opened_at.get(service_id, 0.0)
+                if (time.monotonic() - opened_at) < self.circuit_breaker_cooldown:
+                    return self._circuit_open_result(service_id)
+                cb["state"] = "half_open"
+
+            health_result = await self._run_health_check(service_id)
+            self._cached_result[service_id] = (time.monotonic(), health_result)
+            return _copy_result(health_result)
+
+    def _circuit_open_result(self, service_id: str) -> Dict[str, Any]:
+        """Build the result reported while a service's circuit breaker is open."""
+        return {
+            "service_id": service_id,
+            "status": HealthStatus.UNHEALTHY.value,
+            "message": "Circuit breaker open - skipping endpoint probes",
+            "timestamp": time.time(),
+            "endpoints": [],
+            "circuit_breaker": self.circuit_breakers[service_id].copy(),
+            "recommendations": self._generate_recommendations(service_id, HealthStatus.UNHEALTHY),
+        }
 
+    async def _run_health_check(self, service_id: str) -> Dict[str, Any]:
+        """Probe all endpoints for a service and record the outcome."""
+        config = self._service_configs[service_id]
+        start_time = time.monotonic()
+
+        endpoints = config.get("endpoints", [])
+        if self.circuit_breakers[service_id]["state"] == "half_open":
+            # Half-open: a single trial probe
+            endpoints = endpoints[:1]
+
+        # Local bindings for the per-endpoint fold below
+        HEALTHY, UNHEALTHY = HealthStatus.HEALTHY, HealthStatus.UNHEALTHY
+        severity = _SEVERITY
+        overall_status = HEALTHY
+        overall_severity = severity[HEALTHY]
+
+        # Check all configured endpoints concurrently (results keep endpoint order)
+        semaphore = self._probe_semaphore()
+        self._active_rounds += 1
+        try:
+            raw_results = await asyncio.gather(
+                *(self._check_endpoint(semaphore, endpoint) for endpoint in endpoints),
+                return_exceptions=True,
+            )
+        finally:
+            self._active_rounds -= 1
         results = []
-        overall_status = HealthStatus.HEALTHY
-
-        # Check all configured endpoints
-        for endpoint in config.get("endpoints", []):
-            endpoint_result = await self._check_endpoint(endpoint)
+        for endpoint, endpoint_result in zip(endpoints, raw_results):
+            if isinstance(endpoint_result, BaseException):
+                endpoint_result = {
+                    "endpoint": endpoint.get("url") if isinstance(endpoint, dict) else None,
+                    "type": endpoint.get("type", "http") if isinstance(endpoint, dict) else None,
+                    "status": UNHEALTHY,
+                    "message": f"Check failed: {endpoint_result}",
+                    "response_time_ms": 0,
+                    "error": str(endpoint_result),
+                }
             results.append(endpoint_result)
 
-            # Determine worst status
-            if endpoint_result["status"] == HealthStatus.UNHEALTHY.value:
-                overall_status = HealthStatus.UNHEALTHY
-            elif (
-                endpoint_result["status"] == HealthStatus.DEGRADED.value
-                and overall_status == HealthStatus.HEALTHY
-            ):
-                overall_status = HealthStatus.DEGRADED
+            # Determine worst status, then serialize the endpoint's status
+            endpoint_status = endpoint_result["status"]
+            if severity[endpoint_status] > overall_severity:
+                overall_status = endpoint_status
+                overall_severity = severity[endpoint_status]
+            endpoint_result["status"] = endpoint_status.value
 
         # Apply validation rules
         validation_result = self._validate_health_response(results, config.get("validation", {}))
-        if validation_result["status"] != HealthStatus.HEALTHY.value:
-            overall_status = HealthStatus(validation_result["status"])
+        validation_status = validation_result["status"]
+        if validation_status is not HEALTHY:
+            overall_status = validation_status
 
         # Update circuit breaker
         self._update_circuit_breaker(service_id, overall_status)
@@ -137,127 +323,160 @@ class HealthCheckerStrategy:
             "service_id": service_id,
             "status": overall_status.value,
             "timestamp": time.time(),
-            "response_time_ms": int((time.time() - start_time) * 1000),
+            "response_time_ms": int((time.monotonic() - start_time) * 1000),
             "endpoints": results,
-            "validation": validation_result,
+            "validation": {**validation_result, "status": validation_status.value},
             "circuit_breaker": self.circuit_breakers[service_id].copy(),
             "recommendations": self._generate_recommendations(service_id, overall_status),
         }
 
         # Store in history
-        self._add_to_history(service_id, health_result)
-        self.last_check_time[service_id] = time.time()
+        self._add_to_history(service_id, health_result, overall_status)
 
-        # Trigger recovery actions if needed
-        if overall_status == HealthStatus.UNHEALTHY:
-            await self._trigger_recovery_actions(service_id, health_result)
+        # Trigger recovery actions in the background so webhooks don't delay the result
+        if overall_status is UNHEALTHY:
+            task = asyncio.create_task(self._trigger_recovery_actions(service_id, health_result))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
 
         return health_result
 
-    async def _check_endpoint(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
-        """Check a single endpoint."""
+    async def _check_endpoint(
+        self, semaphore: asyncio.Semaphore, endpoint: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Check a single endpoint once the round's semaphore admits it."""
+        async with semaphore:
+            return await self._probe_endpoint(endpoint)
+
+    async def _probe_endpoint(self, endpoint: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the HTTP probe for a single endpoint.
+
+        The result's status is a HealthStatus member; _run_health_check
+        serializes it once it has been folded into the overall status.
+        """
         url = endpoint["url"]
         check_type = endpoint.get("type", "http")
+        # Bind per-probe lookups once, as in _run_health_check
+        monotonic = time.monotonic
+        timeout = self.timeout_seconds
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                start_time = time.time()
-
-                if check_type == "http":
-                    response = await client.get(url)
-                    response_time = int((time.time() - start_time) * 1000)
-
-                    if response.status_code == 200:
-                        status = HealthStatus.HEALTHY
-                        message = "HTTP check passed"
-                    elif 200 <= response.status_code < 300:
-                        status = HealthStatus.DEGRADED
-                        message = f"HTTP check degraded: {response.status_code}"
-                    else:
-                        status = HealthStatus.UNHEALTHY
-                        message = f"HTTP check failed: {response.status_code}"
-
-                    return {
-                        "endpoint": url,
-                        "type": check_type,
-                        "status": status.value,
-                        "message": message,
-                        "response_time_ms": response_time,
-                        "status_code": response.status_code,
-                        "response_body": response.text[:200] if response.text else None,
-                    }
-
-                elif check_type == "metrics":
-                    # Custom metrics endpoint check
-                    response = await client.get(url)
-                    response_time = int((time.time() - start_time) * 1000)
-
-                    # Parse metrics and determine health based on thresholds
-                    status = HealthStatus.HEALTHY  # Simplified
-                    message = "Metrics check passed"
-
-                    return {
-                        "endpoint": url,
-                        "type": check_type,
-                        "status": status.value,
-                        "message": message,
-                        "response_time_ms": response_time,
-                    }
-
+            client = await self._get_client()
+            start_time = monotonic()
+
+            if check_type == "http":
+                response = await client.get(url, timeout=timeout)
+                response_time = int((monotonic() - start_time) * 1000)
+                status_code = response.status_code
+                text = response.text
+
+                if status_code == 200:
+                    status = HealthStatus.HEALTHY
+                    message = "HTTP check passed"
+                elif 200 <= status_code < 300:
+                    status = HealthStatus.DEGRADED
+                    message = f"HTTP check degraded: {status_code}"
                 else:
-                    # Unknown check type
-                    return {
-                        "endpoint": url,
-                        "type": check_type,
-                        "status": HealthStatus.UNKNOWN.value,
-                        "message": f"Unknown check type: {check_type}",
-                        "response_time_ms": 0,
-                    }
+                    status = HealthStatus.UNHEALTHY
+                    message = f"HTTP check failed: {status_code}"
+
+                return {
+                    "endpoint": url,
+                    "type": check_type,
+                    "status": status,
+                    "message": message,
+                    "response_time_ms": response_time,
+                    "status_code": status_code,
+                    "response_body": text[:200] if text else None,
+                }
+
+            elif check_type == "metrics":
+                # Custom metrics endpoint check
+                response = await client.get(url, timeout=timeout)
+                response_time = int((monotonic() - start_time) * 1000)
+
+                # Parse metrics and determine health based on thresholds
+                status = HealthStatus.HEALTHY  # Simplified
+                message = "Metrics check passed"
+
+                return {
+                    "endpoint": url,
+                    "type": check_type,
+                    "status": status,
+                    "message": message,
+                    "response_time_ms": response_time,
+                }
+
+            else:
+                # Unknown check type
+                return {
+                    "endpoint": url,
+                    "type": check_type,
+                    "status": HealthStatus.UNKNOWN,
+                    "message": f"Unknown check type: {check_type}",
+                    "response_time_ms": 0,
+                }
 
         except Exception as e:
             return {
                 "endpoint": url,
                 "type": check_type,
-                "status": HealthStatus.UNHEALTHY.value,
-                "message": f"Check failed: {str(e)}",
+                "status": HealthStatus.UNHEALTHY,
+                "message": f"Check failed: {e}",
                 "response_time_ms": 0,
                 "error": str(e),
             }
 
     def _validate_health_response(self, results: List[Dict], validation: Dict) -> Dict[str, Any]:
-        """Apply validation rules to health check results."""
+        """Apply validation rules to health check results (status is a HealthStatus member)."""
         if not validation:
-            return {"status": HealthStatus.HEALTHY.value, "message": "No validation rules"}
+            return {"status": HealthStatus.HEALTHY, "message": "No validation rules"}
 
         # Check response time threshold
         max_response_time = validation.get("response_time_ms", 5000)
-        for result in results:
-            if result.get("response_time_ms", 0) > max_response_time:
-                return {
-                    "status": HealthStatus.DEGRADED.value,
-                    "message": f"Response time {result['response_time_ms']}ms exceeds threshold {max_response_time}ms",
-                }
+        response_times = [result.get("response_time_ms", 0) for result in results]
+        worst = max(response_times, default=0)
+        if worst > max_response_time:
+            over = [i for i, rt in enumerate(response_times) if rt > max_response_time]
+            return {
+                "status": HealthStatus.DEGRADED,
+                "message": (
+                    f"Response time {worst}ms exceeds threshold {max_response_time}ms "
+                    f"(endpoints {over})"
+                ),
+                "over_threshold": over,
+            }
 
-        return {"status": HealthStatus.HEALTHY.value, "message": "Validation passed"}
+        return {"status": HealthStatus.HEALTHY, "message": "Validation passed"}
 
     def _update_circuit_breaker(self, service_id: str, status: HealthStatus):
         """Update circuit breaker state based on health status."""
         cb = self.circuit_breakers[service_id]
         current_time = time.time()
 
-        if status == HealthStatus.UNHEALTHY:
+        if cb["state"] == "half_open" and status is not HealthStatus.HEALTHY:
+            # Only a healthy trial probe closes the breaker; anything else
+            # (unhealthy, degraded or unknown) reopens it and restarts the cooldown
+            cb["failure_count"] += 1
+            cb["last_failure_time"] = current_time
+            cb["state"] = "open"
+            self._breaker_opened_at[service_id] = time.monotonic()
+            logger.info("Circuit breaker reopened for %s", service_id)
+
+        elif status is HealthStatus.UNHEALTHY:
             cb["failure_count"] += 1
             cb["last_failure_time"] = current_time
 
             if cb["failure_count"] >= self.failure_threshold and cb["state"] == "closed":
                 cb["state"] = "open"
-                print(f"Circuit breaker opened for {service_id}")
+                self._breaker_opened_at[service_id] = time.monotonic()
+                logger.info("Circuit breaker opened for %s", service_id)
 
-        elif status == HealthStatus.HEALTHY:
+        elif status is HealthStatus.HEALTHY:
             if cb["state"] == "half_open":
                 cb["failure_count"] = 0
                 cb["state"] = "closed"
-                print(f"Circuit breaker closed for {service_id}")
+                logger.info("Circuit breaker closed for %s", service_id)
             elif cb["state"] == "closed":
                 cb["failure_count"] = max(0, cb["failure_count"] - 1)
 
@@ -267,7 +486,7 @@ class HealthCheckerStrategy:
         """Generate recommendations based on health status."""
         recommendations = []
 
-        if status == HealthStatus.UNHEALTHY:
+        if status is HealthStatus.UNHEALTHY:
             recommendations.extend(
                 [
                     "Check service logs for errors",
@@ -277,7 +496,7 @@ class HealthCheckerStrategy:
                 ]
             )
 
-        elif status == HealthStatus.DEGRADED:
+        elif status is HealthStatus.DEGRADED:
             recommendations.extend(
                 [
                     "Monitor service performance closely",
@@ -305,7 +524,7 @@ class HealthCheckerStrategy:
             await self._send_notification(webhook_url, service_id, health_result)
 
         # Log the health issue
-        print(f"Service {service_id} is unhealthy: {health_result}")
+        logger.warning("Service %s is unhealthy: %s", service_id, health_result)
 
     async def _send_notification(
         self, webhook_url: str, service_id: str, health_result: Dict[str, Any]
@@ -320,34 +539,25 @@ class HealthCheckerStrategy:
                 "details": health_result,
             }
 
-            async with httpx.AsyncClient(timeout=5) as client:
-                await client.post(webhook_url, json=payload)
-                print(f"Health notification sent for {service_id}")
+            client = await self._get_client()
+            await client.post(webhook_url, json=payload, timeout=self.timeout_seconds)
+            logger.info("Health notification sent for %s", service_id)
 
         except Exception as e:
-            print(f"Failed to send health notification for {service_id}: {e}")
-
-    def _add_to_history(self, service_id: str, health_result: Dict[str, Any]):
-        """Add health result to history, maintaining a rolling window."""
-        history = self.health_history[service_id]
-        history.append(health_result)
+            logger.warning("Failed to send health notification for %s: %s", service_id, e)
 
-        # Keep only last 100 results
-        if len(history) > 100:
-            history.pop(0)
+    def _add_to_history(self, service_id: str, health_result: Dict[str, Any], status: HealthStatus):
+        """Add health result to history (bounded deque keeps the last 100 results)."""
+        self.health_history[service_id].append(health_result)
 
-    def _get_last_health_result(self, service_id: str) -> Dict[str, Any]:
-        """Get the most recent health result for a service."""
-        history = self.health_history.get(service_id, [])
-        return (
-            history[-1]
-            if history
-            else {
-                "status": HealthStatus.UNKNOWN.value,
-                "message": "No health check performed yet",
-                "timestamp": time.time(),
-            }
-        )
+        recent = self._recent[service_id]
+        healthy = status is HealthStatus.HEALTHY
+        delta = healthy
+        # The oldest flag is evicted from the full window by the append below
+        if len(recent) == recent.maxlen and recent[0]:
+            delta -= 1
+        recent.append(healthy)
+        self._healthy_recent[service_id] += delta
 
     def get_health_summary(self, service_id: str) -> Dict[str, Any]:
         """Get a summary of service health over time."""
@@ -355,22 +565,46 @@ class HealthCheckerStrategy:
         if not history:
             return {"message": "No health data available"}
 
-        recent_checks = history[-10:]  # Last 10 checks
-        healthy_count = sum(
-            1 for check in recent_checks if check["status"] == HealthStatus.HEALTHY.value
-        )
+        recent = self._recent[service_id]  # Last 10 checks
+        healthy_count = self._healthy_recent[service_id]
+        latest = history[-1]
 
         return {
             "service_id": service_id,
             "total_checks": len(history),
-            "recent_success_rate": healthy_count / len(recent_checks),
-            "current_status": history[-1]["status"],
-            "last_check": history[-1]["timestamp"],
+            "recent_success_rate": healthy_count / len(recent),
+            "current_status": latest["status"],
+            "last_check": latest["timestamp"],
             "circuit_breaker": self.circuit_breakers.get(service_id, {}),
         }
 
     def get_strategy_info(self) -> Dict[str, Any]:
-        """Return information about this strategy."""
+        """Return information about this strategy.
+
+        The info is built once per combination of settings; callers get their
+        own copy.
+        """
+        key = (
+            self.name,
+            self.description,
+            self.version,
+            self.check_interval,
+            self.failure_threshold,
+            self.recovery_threshold,
+            self.timeout_seconds,
+            self.circuit_breaker_cooldown,
+            self.max_concurrent_checks,
+        )
+        if self._strategy_info is None or self._strategy_info[0] != key:
+            self._strategy_info = (key, self._build_strategy_info())
+        info = self._strategy_info[1]
+        return {
+            **info,
+            "features": list(info["features"]),
+            "configuration": dict(info["configuration"]),
+        }
+
+    def _build_strategy_info(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
@@ -389,6 +623,8 @@ class HealthCheckerStrategy:
                 "failure_threshold": self.failure_threshold,
                 "recovery_threshold": self.recovery_threshold,
                 "timeout": f"{self.timeout_seconds} seconds",
+                "circuit_breaker_cooldown": f"{self.circuit_breaker_cooldown} seconds",
+                "max_concurrent_checks": self.max_concurrent_checks,
             },
         }
 
@@ -5,9 +5,100 @@ This strategy demonstrates how to implement custom load balancing
 logic for distributing requests across multiple service instances.
 """
 
-from typing import List, Dict, Any, Optional
+from bisect import bisect_right
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+import logging
+import random
 import time
 
+logger = logging.getLogger(__name__)
+
+
+# Key of the overall healthy pool in InstanceTable's cumulative weight cache
+_ALL_REGIONS = object()
+
+
+@dataclass(slots=True)
+class InstanceTable:
+    """Per-service instances stored as parallel arrays indexed by position."""
+
+    instances: List[Dict[str, Any]]
+    urls: List[str]
+    weights: List[Any]
+    regions: List[Optional[str]]
+    healthy: List[bool]
+    last_check: List[float]
+    index: Dict[str, int]  # url -> position
+    # Healthy URLs overall and per region; rebuilt on health changes
+    healthy_urls: List[str] = field(default_factory=list)
+    healthy_by_region: Dict[Optional[str], List[str]] = field(default_factory=dict)
+    # Cumulative weights per healthy pool (region, or _ALL_REGIONS), built on
+    # first weighted selection so round-robin services never touch the weights
+    cum_weights_cache: Dict[Any, List[int]] = field(default_factory=dict)
+
+    def rebuild_healthy(self):
+        """Recompute the healthy URL pools used for selection."""
+        healthy_urls = []
+        by_region: Dict[Optional[str], List[str]] = {}
+        for url, region, healthy in zip(self.urls, self.regions, self.healthy):
+            if healthy:
+                healthy_urls.append(url)
+                by_region.setdefault(region, []).append(url)
+        self.healthy_urls = healthy_urls
+        self.healthy_by_region = by_region
+        self.cum_weights_cache = {}
+
+    def cum_weights(self, region: Any = _ALL_REGIONS) -> List[int]:
+        """Cumulative weights of the overall or a regional healthy pool."""
+        cum_weights = self.cum_weights_cache.get(region)
+        if cum_weights is None:
+            pool = self.healthy_urls if region is _ALL_REGIONS else self.healthy_by_region[region]
+            index, weights = self.index, self.weights
+            cum_weights = list(accumulate(weights[index[url]] for url in pool))
+            self.cum_weights_cache[region] = cum_weights
+        return cum_weights
+
+
+class _ColumnView(MappingABC):
+    """Live, read-only ``url -> value`` view of one column of an instance table."""
+
+    __slots__ = ("_column", "_table")
+
+    def __init__(self, table: InstanceTable, column: str):
+        self._table = table
+        self._column = column
+
+    def __getitem__(self, url: str) -> Any:
+        return getattr(self._table, self._column)[self._table.index[url]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.urls)
+
+    def __len__(self) -> int:
+        return len(self._table.urls)
+
+
+class _TablesView(MappingABC):
+    """Live, read-only ``service_id -> project(table)`` view of the instance tables."""
+
+    __slots__ = ("_project", "_tables")
+
+    def __init__(self, tables: Dict[str, InstanceTable], project: Callable[[InstanceTable], Any]):
+        self._tables = tables
+        self._project = project
+
+    def __getitem__(self, service_id: str) -> Any:
+        return self._project(self._tables[service_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
 
 class LoadBalancerStrategy:
     """
@@ -17,24 +108,62 @@ class LoadBalancerStrategy:
     automatically removing unhealthy instances from rotation.
     """
 
-    def __init__(self):
+    ALGORITHMS = ("round_robin", "weighted_random")
+
+    __slots__ = (
+        "_algorithms",
+        "_health_status_view",
+        "_instances_view",
+        "_last_check_view",
+        "_strategy_info",
+        "_tables",
+        "algorithm",
+        "current_index",
+        "description",
+        "name",
+        "version",
+    )
+
+    def __init__(self, algorithm: str = "round_robin"):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown load balancing algorithm '{algorithm}'")
+
         self.name = "load_balancer"
         self.description = "Round-robin load balancer with health tracking"
         self.version = "1.0.0"
+        self.algorithm = algorithm
+
+        # Per-service algorithm overrides, from each service's routing config
+        self._algorithms: Dict[str, str] = {}
 
         # Track service instances and their health
-        self.service_instances: Dict[str, List[Dict[str, Any]]] = {}
+        self._tables: Dict[str, InstanceTable] = {}
         self.current_index: Dict[str, int] = {}
-        self.health_status: Dict[str, Dict[str, bool]] = {}
-        self.last_health_check: Dict[str, Dict[str, float]] = {}
-
-    def register_service_instances(self, service_id: str, instances: List[Dict[str, Any]]):
+        self._instances_view = _TablesView(self._tables, lambda table: table.instances)
+        self._health_status_view = _TablesView(
+            self._tables, lambda table: _ColumnView(table, "healthy")
+        )
+        self._last_check_view = _TablesView(
+            self._tables, lambda table: _ColumnView(table, "last_check")
+        )
+
+        # (settings key, info) memo for get_strategy_info
+        self._strategy_info: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
+    def register_service_instances(
+        self,
+        service_id: str,
+        instances: List[Dict[str, Any]],
+        algorithm: Optional[str] = None,
+    ):
         """
         Register multiple instances for a service.
 
         Args:
             service_id: Service identifier
             instances: List of instance configs with 'url', 'weight', etc.
+            algorithm: Optional selection algorithm for this service; defaults
+                to the balancer's own algorithm
 
         Example:
             instances = [
@@ -43,31 +172,76 @@ class LoadBalancerStrategy:
                 {"url": "http://ollama-3:11434", "weight": 1, "region": "eu-west"}
             ]
         """
-        self.service_instances[service_id] = instances
+        if algorithm is None:
+            self._algorithms.pop(service_id, None)
+        elif algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown load balancing algorithm '{algorithm}'")
+        else:
+            self._algorithms[service_id] = algorithm
+
+        previous = self._tables.get(service_id)
+
+        # Registration is repeated on every routed request; skip unchanged instance lists.
+        # The table keeps its own copies, so edits made in place to the caller's list
+        # or instance dicts are still detected here.
+        if previous is not None and previous.instances == instances:
+            return
+
+        instances = [dict(instance) for instance in instances]
+        urls = [instance["url"] for instance in instances]
+        table = InstanceTable(
+            instances=instances,
+            urls=urls,
+            weights=[instance.get("weight", 1) for instance in instances],
+            regions=[instance.get("region") for instance in instances],
+            healthy=[True] * len(urls),
+            last_check=[0.0] * len(urls),
+            index={url: i for i, url in enumerate(urls)},
+        )
+
+        # Preserve health tracking for instances that were already registered
+        if previous is not None:
+            for i, url in enumerate(urls):
+                old_i = previous.index.get(url)
+                if old_i is not None:
+                    table.healthy[i] = previous.healthy[old_i]
+                    table.last_check[i] = previous.last_check[old_i]
+
+        table.rebuild_healthy()
+        self._tables[service_id] = table
 
-        # Only initialize if not already present to preserve health status
         if service_id not in self.current_index:
             self.current_index[service_id] = 0
 
-        if service_id not in self.health_status:
-            self.health_status[service_id] = {}
+    def unregister_service(self, service_id: str):
+        """Forget a service's instances, rotation position and algorithm override."""
+        self._tables.pop(service_id, None)
+        self.current_index.pop(service_id, None)
+        self._algorithms.pop(service_id, None)
+
+    # Live read-only views of the per-service tables, in the shape older callers expect.
+    # Change them through register_service_instances and mark_instance_healthy/unhealthy.
 
-        if service_id not in self.last_health_check:
-            self.last_health_check[service_id] = {}
+    @property
+    def service_instances(self) -> Mapping[str, List[Dict[str, Any]]]:
+        """Registered instances per service."""
+        return self._instances_view
 
-        # Add health tracking for new instances, preserve existing status
-        for instance in instances:
-            url = instance["url"]
-            if url not in self.health_status[service_id]:
-                self.health_status[service_id][url] = True
-            if url not in self.last_health_check[service_id]:
-                self.last_health_check[service_id][url] = 0
+    @property
+    def health_status(self) -> Mapping[str, Mapping[str, bool]]:
+        """Health flag per instance URL, per service."""
+        return self._health_status_view
+
+    @property
+    def last_health_check(self) -> Mapping[str, Mapping[str, float]]:
+        """Last health check timestamp per instance URL, per service."""
+        return self._last_check_view
 
     def get_next_instance(
         self, service_id: str, request_context: Optional[Dict] = None
     ) -> Optional[str]:
         """
-        Get the next healthy instance URL using round-robin selection.
+        Get the next healthy instance URL using the configured selection algorithm.
 
         Args:
             service_id: Service identifier
@@ -76,68 +250,108 @@ class LoadBalancerStrategy:
         Returns:
             URL of the selected instance, or None if no healthy instances
         """
-        if service_id not in self.service_instances:
+        table = self._tables.get(service_id)
+        if table is None:
             return None
 
-        instances = self.service_instances[service_id]
-        healthy_instances = [
-            instance
-            for instance in instances
-            if self.health_status[service_id].get(instance["url"], True)
-        ]
-
-        if not healthy_instances:
+        pool = table.healthy_urls
+        if not pool:
             # No healthy instances, return the first one as fallback
-            return instances[0]["url"] if instances else None
+            return table.urls[0] if table.urls else None
+
+        pool_region = _ALL_REGIONS
 
         # Apply regional preference if available in request context
         if request_context and "user_region" in request_context:
             user_region = request_context["user_region"]
-            regional_instances = [
-                instance for instance in healthy_instances if instance.get("region") == user_region
-            ]
-            if regional_instances:
-                healthy_instances = regional_instances
+            regional_pool = table.healthy_by_region.get(user_region)
+            if regional_pool:
+                pool = regional_pool
+                pool_region = user_region
+
+        # Weighted random selection honoring per-instance weights
+        algorithm = self._algorithms.get(service_id, self.algorithm)
+        if algorithm == "weighted_random":
+            cum_weights = table.cum_weights(pool_region)
+            if cum_weights[-1] > 0:
+                return pool[bisect_right(cum_weights, random.random() * cum_weights[-1])]
 
         # Round-robin selection
         current_idx = self.current_index[service_id]
-        selected_instance = healthy_instances[current_idx % len(healthy_instances)]
+        selected_url = pool[current_idx % len(pool)]
 
         # Update index for next request
-        self.current_index[service_id] = (current_idx + 1) % len(healthy_instances)
+        self.current_index[service_id] = (current_idx + 1) % len(pool)
+
+        return selected_url
 
-        return selected_instance["url"]
+    def route_request(
+        self, service_id: str, request_context: Dict[str, Any], config: Any
+    ) -> Optional[str]:
+        """
+        Pick an instance for a service configured with ``strategy: load_balancer``.
+
+        The service's ``instances`` are registered on each call and
+        ``routing.algorithm`` (e.g. "weighted_random") selects the algorithm.
+        """
+        instances = getattr(config, "instances", []) or []
+        if not instances:
+            return None
+
+        routing = getattr(config, "routing", None) or {}
+        self.register_service_instances(service_id, instances, routing.get("algorithm"))
+        return self.get_next_instance(service_id, request_context)
+
+    def _set_instance_health(self, service_id: str, instance_url: str, healthy: bool) -> bool:
+        """Record an instance's health; returns False if the instance is unknown."""
+        table = self._tables.get(service_id)
+        if table is None:
+            return False
+        i = table.index.get(instance_url)
+        if i is None:
+            return False
+        if table.healthy[i] != healthy:
+            table.healthy[i] = healthy
+            table.rebuild_healthy()
+        return True
 
     def mark_instance_unhealthy(self, service_id: str, instance_url: str, error: Exception):
         """Mark an instance as unhealthy after a failed request."""
-        if service_id not in self.health_status:
+        if not self._set_instance_health(service_id, instance_url, False):
             return
-        if instance_url not in self.health_status[service_id]:
-            return
-        self.health_status[service_id][instance_url] = False
-        print(f"Marked {instance_url} as unhealthy for {service_id}: {error}")
+        logger.warning("Marked %s as unhealthy for %s: %s", instance_url, service_id, error)
 
     def mark_instance_healthy(self, service_id: str, instance_url: str):
         """Mark an instance as healthy after a successful request."""
-        if service_id not in self.health_status:
-            return
-        if instance_url not in self.health_status[service_id]:
+        if not self._set_instance_health(service_id, instance_url, True):
             return
-        self.health_status[service_id][instance_url] = True
-        print(f"Marked {instance_url} as healthy for {service_id}")
+        logger.info("Marked %s as healthy for %s", instance_url, service_id)
 
     def should_check_health(
         self, service_id: str, instance_url: str, interval_seconds: int = 30
     ) -> bool:
         """Determine if an instance health should be checked."""
-        if service_id not in self.last_health_check:
+        table = self._tables.get(service_id)
+        if table is None:
             return True
 
-        last_check = self.last_health_check[service_id].get(instance_url, 0)
+        i = table.index.get(instance_url)
+        last_check = table.last_check[i] if i is not None else 0
         return (time.time() - last_check) > interval_seconds
 
     def get_strategy_info(self) -> Dict[str, Any]:
-        """Return information about this strategy."""
+        """Return information about this strategy (cached until its settings change, copied)."""
+        key = (self.name, self.description, self.version, self.algorithm)
+        if self._strategy_info is None or self._strategy_info[0] != key:
+            self._strategy_info = (key, self._build_strategy_info())
+        info = self._strategy_info[1]
+        return {
+            **info,
+            "features": list(info["features"]),
+            "configuration": dict(info["configuration"]),
+        }
+
+    def _build_strategy_info(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
@@ -145,13 +359,14 @@ class LoadBalancerStrategy:
             "type": "load_balancer",
             "features": [
                 "round_robin_selection",
+                "weighted_random_selection",
                 "health_tracking",
                 "regional_preference",
                 "automatic_failover",
             ],
             "configuration": {
                 "health_check_interval": "30 seconds",
-                "selection_algorithm": "round_robin",
+                "selection_algorithm": self.algorithm,
                 "regional_awareness": "enabled",
             },
         }
@@ -9,9 +9,15 @@ so the caller can fallback to service_config.base_url.
 from typing import Any, Dict, Optional, Callable
 
 
+# Sentinel for models with no by_model entry
+_UNMAPPED = object()
+
+
 class ModelRouterStrategy:
     name = "model_router"
 
+    __slots__ = ("_get_lb",)
+
     def __init__(self, load_balancer_factory: Optional[Callable[[], Any]] = None):
         # Lazy dependency to LB; not required, but useful for fallback
         self._get_lb = load_balancer_factory
@@ -19,19 +25,23 @@ class ModelRouterStrategy:
     def route_request(
         self, service_id: str, request_context: Dict[str, Any], config: Any
     ) -> Optional[str]:
+        # The gateway builds a fresh config per request, so the routing tables
+        # are read in place rather than parsed or cached per config object
         routing = getattr(config, "routing", {}) or {}
-        instances = getattr(config, "instances", []) or []
 
         # Determine key name for model
         model_key = routing.get("model_key", "model")
         model_value = request_context.get(model_key) or request_context.get("model")
-        by_model: Dict[str, str] = routing.get("by_model", {}) or {}
 
-        # Prefer explicit by_model mapping
-        if model_value and model_value in by_model:
-            return by_model[model_value]
+        # Prefer explicit by_model mapping (single lookup)
+        if model_value:
+            by_model: Dict[str, str] = routing.get("by_model") or {}
+            target = by_model.get(model_value, _UNMAPPED)
+            if target is not _UNMAPPED:
+                return target
 
         # No explicit mapping; delegate to LB if instances configured
+        instances = getattr(config, "instances", []) or []
         if instances and self._get_lb:
             try:
                 lb = self._get_lb()
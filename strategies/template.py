@@ -5,7 +5,15 @@ Use this template as a starting point for creating your own custom strategies.
 Copy this file and modify it to implement your specific logic.
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Marks configuration keys that are not set
+_MISSING = object()
 
 
 class TemplateStrategy:
@@ -19,6 +27,9 @@ class TemplateStrategy:
     - Configuration options available
     """
 
+    # Configuration keys whose change requires re-running _initialize_strategy
+    _REINIT_KEYS = frozenset({"example_setting"})
+
     def __init__(self, config: Dict[str, Any] | None = None):
         """
         Initialize the strategy with optional configuration.
@@ -34,6 +45,13 @@ class TemplateStrategy:
         # Strategy configuration
         self.config = config or {}
 
+        # Counters reported by get_metrics, incremented in the per-request methods
+        self._counters = {"requests_processed": 0, "responses_processed": 0, "errors_handled": 0}
+        self._processing_time_ms_total = 0.0
+
+        # (settings key, info) memo for get_strategy_info
+        self._strategy_info: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
         # Initialize your strategy state here
         self._initialize_strategy()
 
@@ -51,12 +69,33 @@ class TemplateStrategy:
         required_keys = ["example_setting"]
         for key in required_keys:
             if key not in self.config:
-                print(f"Warning: Missing required configuration key: {key}")
+                logger.warning("Missing required configuration key: %s", key)
 
         # Example: initialize strategy state
         self.example_state = {}
 
-        print(f"Initialized {self.name} strategy with config: {self.config}")
+        # Example: precompute static result templates so the per-request
+        # methods don't rebuild the same values on every call. Callers get
+        # copies, so the templates themselves are never handed out.
+        self._process_result = {
+            "action": "allow",
+            "modifications": {
+                "headers": {"X-Strategy-Processed": self.name, "X-Strategy-Version": self.version}
+            },
+            "metadata": {"strategy": self.name},
+        }
+        self._response_result = {
+            "action": "allow",
+            "modifications": {"headers": {"X-Strategy-Response-Processed": self.name}},
+            "metadata": {"strategy": self.name},
+        }
+        self._error_result = {
+            "action": "retry",  # or "fail", "fallback", etc.
+            "retry_delay_ms": 1000,
+            "max_retries": 3,
+        }
+
+        logger.debug("Initialized %s strategy with config: %s", self.name, self.config)
 
     def process_request(self, service_id: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -76,27 +115,30 @@ class TemplateStrategy:
                 "metadata": {"strategy_version": self.version}
             }
         """
-        # Your strategy logic goes here
+        start = time.perf_counter()
 
-        # Example: log the request
-        print(
-            f"Processing request for {service_id}: {request_data.get('method', 'UNKNOWN')} {request_data.get('path', '/')}"
-        )
+        # Your strategy logic goes here
 
-        # Example: add custom header
-        modifications = {
-            "headers": {"X-Strategy-Processed": self.name, "X-Strategy-Version": self.version}
+        # Example: log the request (the lookups only run when debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            method = request_data.get("method", "UNKNOWN")
+            path = request_data.get("path", "/")
+            logger.debug("Processing request for %s: %s %s", service_id, method, path)
+
+        # Example: copy the precomputed result (adds custom headers) and patch
+        # in the fields that vary per request
+        template = self._process_result
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        result = {
+            "action": template["action"],
+            "modifications": {"headers": dict(template["modifications"]["headers"])},
+            "metadata": {**template["metadata"], "processing_time_ms": elapsed_ms},
         }
 
-        # Example: return processing result
-        return {
-            "action": "allow",
-            "modifications": modifications,
-            "metadata": {
-                "strategy": self.name,
-                "processing_time_ms": 1,  # In real implementation, measure actual time
-            },
-        }
+        # Example: record plain counters; get_metrics derives the average from them
+        self._counters["requests_processed"] += 1
+        self._processing_time_ms_total += elapsed_ms
+        return result
 
     def handle_response(self, service_id: str, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -110,17 +152,19 @@ class TemplateStrategy:
             Dictionary with processing results and any modifications
         """
         # Your response processing logic goes here
+        self._counters["responses_processed"] += 1
 
-        # Example: log the response
-        print(f"Processing response from {service_id}: {response_data.get('status', 'UNKNOWN')}")
-
-        # Example: add custom response header
-        modifications = {"headers": {"X-Strategy-Response-Processed": self.name}}
+        # Example: log the response (the lookup only runs when debug logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            status = response_data.get("status", "UNKNOWN")
+            logger.debug("Processing response from %s: %s", service_id, status)
 
+        # Example: return a copy of the precomputed result (adds a custom response header)
+        template = self._response_result
         return {
-            "action": "allow",
-            "modifications": modifications,
-            "metadata": {"strategy": self.name},
+            "action": template["action"],
+            "modifications": {"headers": dict(template["modifications"]["headers"])},
+            "metadata": dict(template["metadata"]),
         }
 
     def handle_error(
@@ -138,15 +182,14 @@ class TemplateStrategy:
             Dictionary with error handling results
         """
         # Your error handling logic goes here
+        self._counters["errors_handled"] += 1
 
         # Example: log the error
-        print(f"Handling error for {service_id}: {str(error)}")
+        logger.debug("Handling error for %s: %s", service_id, error)
 
-        # Example: return error handling result
+        # Example: return error handling result, patching in the error type
         return {
-            "action": "retry",  # or "fail", "fallback", etc.
-            "retry_delay_ms": 1000,
-            "max_retries": 3,
+            **self._error_result,
             "metadata": {"strategy": self.name, "error_type": type(error).__name__},
         }
 
@@ -158,13 +201,14 @@ class TemplateStrategy:
             Dictionary with metrics data
         """
         # Your metrics collection logic goes here
+        requests_processed = self._counters["requests_processed"]
 
         return {
             "strategy": self.name,
-            "requests_processed": 0,  # Track actual count
-            "responses_processed": 0,  # Track actual count
-            "errors_handled": 0,  # Track actual count
-            "average_processing_time_ms": 0.0,  # Calculate actual average
+            **self._counters,
+            "average_processing_time_ms": (
+                self._processing_time_ms_total / requests_processed if requests_processed else 0.0
+            ),
             "configuration": self.config,
         }
 
@@ -182,17 +226,24 @@ class TemplateStrategy:
             # Validate new configuration
             # Your validation logic goes here
 
+            # Skip updates that would not change anything
+            config = self.config
+            changed = {k: v for k, v in new_config.items() if config.get(k, _MISSING) != v}
+            if not changed:
+                return True
+
             # Apply new configuration
-            self.config.update(new_config)
+            config.update(changed)
 
             # Re-initialize if needed
-            self._initialize_strategy()
+            if changed.keys() & self._REINIT_KEYS:
+                self._initialize_strategy()
 
-            print(f"Updated configuration for {self.name}: {new_config}")
+            logger.debug("Updated configuration for %s: %s", self.name, changed)
             return True
 
         except Exception as e:
-            print(f"Failed to update configuration for {self.name}: {str(e)}")
+            logger.warning("Failed to update configuration for %s: %s", self.name, e)
             return False
 
     def get_strategy_info(self) -> Dict[str, Any]:
@@ -203,8 +254,23 @@ class TemplateStrategy:
         and administrative interfaces.
 
         Returns:
-            Dictionary with strategy information
+            Dictionary with strategy information (built once until name,
+            description or version change; each caller gets a copy)
         """
+        key = (self.name, self.description, self.version)
+        if self._strategy_info is None or self._strategy_info[0] != key:
+            self._strategy_info = (key, self._build_strategy_info())
+        info = self._strategy_info[1]
+        return {
+            **info,
+            "features": list(info["features"]),
+            "configuration_schema": {
+                name: dict(schema) for name, schema in info["configuration_schema"].items()
+            },
+            "supported_events": list(info["supported_events"]),
+        }
+
+    def _build_strategy_info(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "description": self.description,
@@ -225,7 +291,13 @@ class TemplateStrategy:
                     "default": "default_value",
                 }
             },
-            "supported_events": ["request", "response", "error", "service_start", "service_stop"],
+            "supported_events": [
+                "request",
+                "response",
+                "error",
+                "service_start",
+                "service_stop",
+            ],
             "author": "Your Name",
             "license": "MIT",
             "documentation_url": "https://github.com/yourusername/your-strategy",
@@ -241,10 +313,12 @@ def register_strategy(registry):
     You can also perform any global initialization here.
     """
     # Example: load configuration from environment or file
-    config = {"example_setting": "example_value"}
+    # (read-only view, so instances can't mutate the shared defaults)
+    config = MappingProxyType({"example_setting": "example_value"})
 
-    def create_template_strategy():
-        return TemplateStrategy(config)
+    def create_template_strategy(_config=config):
+        # Each instance gets its own mutable copy for update_configuration
+        return TemplateStrategy(dict(_config))
 
     registry.register("template_strategy", create_template_strategy)
 
@@ -309,7 +383,7 @@ if __name__ == "__main__":
 # 3. Error Handling:
 #    - Always handle exceptions gracefully
 #    - Provide meaningful error messages
-#    - Implement proper logging
+#    - Implement proper logging (lazy %-style arguments, not f-strings)
 #    - Consider retry and fallback mechanisms
 #
 # 4. Performance Considerations:
@@ -0,0 +1,149 @@
+import threading
+from typing import Optional
+
+import pytest
+
+# Heavy dependencies (fastapi, sqlalchemy) are imported inside the fixtures
+# that need them, so collecting a narrow selection of tests stays cheap
+
+
+@pytest.fixture(scope="session")
+def _session_client():
+    # Import the real application (expected to exist)
+    from fastapi.testclient import TestClient  # noqa: WPS433
+    from hestia.app import app  # noqa: WPS433
+
+    # Entered so the app's startup and shutdown hooks run (the startup hook
+    # captures the event loop the idle reaper schedules Semaphore shutdowns on)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def client(_session_client):
+    """Shared TestClient; dependency overrides are reset after each test."""
+    yield _session_client
+    _session_client.app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def async_client():
+    """AsyncClient that calls the ASGI app directly on the test's event loop.
+
+    ASGITransport holds no connections, so the client needs no closing and the
+    fixture can stay synchronous.
+    """
+    import httpx  # noqa: WPS433
+    from hestia.app import app  # noqa: WPS433
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class FakeSemaphoreClient:
+    """In-process stand-in for ``SemaphoreClient`` that answers without HTTP.
+
+    Set ``start_task``/``stop_task`` to ``None`` to simulate Semaphore rejecting
+    the task, and ``final_status`` to the status task polling should report.
+    Every call is recorded in ``calls`` as ``(method, service_id or task_id)``;
+    ``stopped`` is set once a stop has been requested.
+    """
+
+    def __init__(self):
+        self.start_task: Optional[str] = "start-task"
+        self.stop_task: Optional[str] = "stop-task"
+        self.final_status = "success"
+        self.calls: list[tuple[str, str]] = []
+        self.stopped = threading.Event()
+
+    @staticmethod
+    def _task(task_id: Optional[str], status: str):
+        from hestia.semaphore_client import SemaphoreTaskResponse  # noqa: WPS433
+
+        return SemaphoreTaskResponse(task_id=task_id, status=status) if task_id else None
+
+    async def start_service(self, service_id, machine_id, template_id=1, environment=None):
+        self.calls.append(("start_service", service_id))
+        return self._task(self.start_task, "running")
+
+    async def stop_service(self, service_id, machine_id, template_id=2, environment=None):
+        self.calls.append(("stop_service", service_id))
+        self.stopped.set()
+        return self._task(self.stop_task, "running")
+
+    async def get_task_status(self, task_id):
+        self.calls.append(("get_task_status", task_id))
+        return self._task(task_id, self.final_status)
+
+    async def wait_for_task_completion(self, task_id, timeout_seconds=300, poll_interval=2.0):
+        return await self.get_task_status(task_id)
+
+
+@pytest.fixture
+def fake_semaphore(monkeypatch):
+    """Route the gateway's Semaphore calls to a ``FakeSemaphoreClient``."""
+    fake = FakeSemaphoreClient()
+    monkeypatch.setattr("hestia.app.get_semaphore_client", lambda *args, **kwargs: fake)
+    return fake
+
+
+@pytest.fixture
+def virtual_sleep(monkeypatch):
+    """Make warmup, retry and poll delays return immediately.
+
+    Returns the ``AsyncMock`` standing in for ``clock.delay``; its
+    ``await_args_list`` records the delays the gateway asked for.
+    """
+    from unittest.mock import AsyncMock  # noqa: WPS433
+
+    from hestia import clock  # noqa: WPS433
+
+    delay = AsyncMock()
+    monkeypatch.setattr(clock, "delay", delay)
+    monkeypatch.setattr(clock, "delay_blocking", lambda seconds: None)
+    return delay
+
+
+@pytest.fixture(scope="session")
+def _engine():
+    """In-memory SQLite engine with the schema created once per session."""
+    from sqlalchemy import create_engine, event  # noqa: WPS433
+    from sqlalchemy.pool import StaticPool  # noqa: WPS433
+
+    from hestia.models import Base  # noqa: WPS433
+
+    # StaticPool keeps every checkout on the same connection, so the
+    # in-memory database outlives individual tests
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(_engine):
+    """Session whose commits are rolled back when the test finishes."""
+    from sqlalchemy.orm import Session  # noqa: WPS433
+
+    connection = _engine.connect()
+    transaction = connection.begin()
+    # Session commits release a SAVEPOINT inside the outer transaction
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
@@ -1,15 +1,6 @@
-import pytest
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def client():
-    # Import the real application (expected to exist)
-    from hestia.app import app  # noqa: WPS433
-
-    return TestClient(app)
-
-
 def test_openapi_contract_routes_exist(client: TestClient):
     # These endpoint stubs must exist in the FastAPI app per contracts/openapi.yaml
     # 1) Transparent proxy under /services/{serviceId}/{proxyPath}
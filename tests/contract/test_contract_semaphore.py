@@ -1,192 +1,101 @@
 import pytest
 from fastapi.testclient import TestClient
 
-
-@pytest.fixture
-def client():
-    # Import the real application (expected to exist)
-    from hestia.app import app  # noqa: WPS433
-
-    return TestClient(app)
-
-
-def test_semaphore_start_endpoint_exists(client: TestClient):
-    """Test that /v1/semaphore/start endpoint exists and accepts POST requests"""
-    # Test with minimal required fields for service start request
-    resp = client.post(
-        "/v1/semaphore/start",
-        json={
-            "serviceId": "test-service",
-            "machineId": "test-machine",
-        },
-    )
-    # Expect 501 (stub) or appropriate success/error codes when implemented
-    assert resp.status_code in {501, 200, 202, 400, 404, 500}
-
-
-def test_semaphore_start_validates_required_fields(client: TestClient):
-    """Test that /v1/semaphore/start validates required fields"""
-    # Test missing serviceId
-    resp = client.post(
-        "/v1/semaphore/start",
-        json={"machineId": "test-machine"},
-    )
-    assert resp.status_code in {
-        501,
-        400,
-        422,
-        404,
-    }  # 422 is FastAPI validation error, 404 when endpoint doesn't exist
-
-    # Test missing machineId
-    resp = client.post(
-        "/v1/semaphore/start",
-        json={"serviceId": "test-service"},
-    )
-    assert resp.status_code in {501, 400, 422, 404}
-
-    # Test empty request body
-    resp = client.post("/v1/semaphore/start", json={})
-    assert resp.status_code in {501, 400, 422, 404}
-
-
-def test_semaphore_start_rejects_invalid_methods(client: TestClient):
-    """Test that /v1/semaphore/start only accepts POST method"""
-    # GET should not be allowed
-    resp = client.get("/v1/semaphore/start")
-    assert resp.status_code in {405, 404}
-
-    # PUT should not be allowed
-    resp = client.put("/v1/semaphore/start", json={"serviceId": "test", "machineId": "test"})
-    assert resp.status_code in {405, 404}
-
-    # DELETE should not be allowed
-    resp = client.delete("/v1/semaphore/start")
-    assert resp.status_code in {405, 404}
-
-
-def test_semaphore_stop_endpoint_exists(client: TestClient):
-    """Test that /v1/semaphore/stop endpoint exists and accepts POST requests"""
-    # Test with minimal required fields for service stop request
-    resp = client.post(
-        "/v1/semaphore/stop",
-        json={
-            "serviceId": "test-service",
-            "machineId": "test-machine",
-        },
-    )
-    # Expect 501 (stub) or appropriate success/error codes when implemented
-    assert resp.status_code in {501, 200, 202, 400, 404, 500}
-
-
-def test_semaphore_stop_validates_required_fields(client: TestClient):
-    """Test that /v1/semaphore/stop validates required fields"""
-    # Test missing serviceId
-    resp = client.post(
-        "/v1/semaphore/stop",
-        json={"machineId": "test-machine"},
-    )
-    assert resp.status_code in {501, 400, 422, 404}
-
-    # Test missing machineId
-    resp = client.post(
-        "/v1/semaphore/stop",
-        json={"serviceId": "test-service"},
-    )
-    assert resp.status_code in {501, 400, 422, 404}
-
-    # Test empty request body
-    resp = client.post("/v1/semaphore/stop", json={})
-    assert resp.status_code in {501, 400, 422, 404}
-
-
-def test_semaphore_stop_rejects_invalid_methods(client: TestClient):
-    """Test that /v1/semaphore/stop only accepts POST method"""
-    # GET should not be allowed
-    resp = client.get("/v1/semaphore/stop")
-    assert resp.status_code in {405, 404}
-
-    # PUT should not be allowed
-    resp = client.put("/v1/semaphore/stop", json={"serviceId": "test", "machineId": "test"})
-    assert resp.status_code in {405, 404}
-
-    # DELETE should not be allowed
-    resp = client.delete("/v1/semaphore/stop")
-    assert resp.status_code in {405, 404}
-
-
-def test_semaphore_status_endpoint_exists(client: TestClient):
-    """Test that /v1/semaphore/status endpoint exists and accepts GET requests"""
-    # Test status check with query parameters
-    resp = client.get(
-        "/v1/semaphore/status", params={"serviceId": "test-service", "machineId": "test-machine"}
-    )
-    # Expect 501 (stub) or appropriate success/error codes when implemented
-    assert resp.status_code in {501, 200, 400, 404, 500}
-
-
-def test_semaphore_status_validates_required_params(client: TestClient):
+# Expect 501 (stub) or appropriate success/error codes when implemented
+ACCEPTED = {501, 200, 202, 400, 404, 500}
+STATUS_ACCEPTED = {501, 200, 400, 404, 500}
+# 422 is FastAPI validation error, 404 when endpoint doesn't exist
+INVALID = {501, 400, 422, 404}
+NOT_ALLOWED = {405, 404}
+
+START_STOP_BODY = {"serviceId": "test-service", "machineId": "test-machine"}
+
+
+@pytest.mark.parametrize(
+    "method,path,kwargs,expected",
+    [
+        # Minimal required fields for service start/stop and status requests
+        ("POST", "/v1/semaphore/start", {"json": START_STOP_BODY}, ACCEPTED),
+        ("POST", "/v1/semaphore/stop", {"json": START_STOP_BODY}, ACCEPTED),
+        ("GET", "/v1/semaphore/status", {"params": START_STOP_BODY}, STATUS_ACCEPTED),
+        # Optional configuration fields that might be needed for startup/shutdown
+        (
+            "POST",
+            "/v1/semaphore/start",
+            {
+                "json": {
+                    **START_STOP_BODY,
+                    "taskId": "startup-task-123",
+                    "environment": {"ENV_VAR": "value"},
+                    "timeout": 300,
+                }
+            },
+            ACCEPTED,
+        ),
+        (
+            "POST",
+            "/v1/semaphore/stop",
+            {
+                "json": {
+                    **START_STOP_BODY,
+                    "taskId": "shutdown-task-123",
+                    "force": True,
+                    "timeout": 60,
+                }
+            },
+            ACCEPTED,
+        ),
+    ],
+    ids=["start", "stop", "status", "start-optional-fields", "stop-optional-fields"],
+)
+def test_semaphore_endpoint_contract(client: TestClient, method, path, kwargs, expected):
+    """Test that Semaphore endpoints exist and accept well-formed requests"""
+    resp = client.request(method, path, **kwargs)
+    assert resp.status_code in expected
+
+
+@pytest.mark.parametrize("path", ["/v1/semaphore/start", "/v1/semaphore/stop"])
+@pytest.mark.parametrize(
+    "body",
+    [{"machineId": "test-machine"}, {"serviceId": "test-service"}, {}],
+    ids=["missing-serviceId", "missing-machineId", "empty"],
+)
+def test_semaphore_start_stop_validate_required_fields(client: TestClient, path, body):
+    """Test that /v1/semaphore/start and /stop validate required fields"""
+    resp = client.post(path, json=body)
+    assert resp.status_code in INVALID
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"machineId": "test-machine"}, {"serviceId": "test-service"}, None],
+    ids=["missing-serviceId", "missing-machineId", "none"],
+)
+def test_semaphore_status_validates_required_params(client: TestClient, params):
     """Test that /v1/semaphore/status validates required query parameters"""
-    # Test missing serviceId
-    resp = client.get("/v1/semaphore/status", params={"machineId": "test-machine"})
-    assert resp.status_code in {501, 400, 422, 404}
-
-    # Test missing machineId
-    resp = client.get("/v1/semaphore/status", params={"serviceId": "test-service"})
-    assert resp.status_code in {501, 400, 422, 404}
-
-    # Test no parameters
-    resp = client.get("/v1/semaphore/status")
-    assert resp.status_code in {501, 400, 422, 404}
-
-
-def test_semaphore_status_rejects_invalid_methods(client: TestClient):
-    """Test that /v1/semaphore/status only accepts GET method"""
-    # POST should not be allowed
-    resp = client.post("/v1/semaphore/status", json={"serviceId": "test", "machineId": "test"})
-    assert resp.status_code in {405, 404}
-
-    # PUT should not be allowed
-    resp = client.put("/v1/semaphore/status", json={"serviceId": "test", "machineId": "test"})
-    assert resp.status_code in {405, 404}
-
-    # DELETE should not be allowed
-    resp = client.delete("/v1/semaphore/status")
-    assert resp.status_code in {405, 404}
-
-
-def test_semaphore_start_with_optional_fields(client: TestClient):
-    """Test that /v1/semaphore/start accepts optional configuration fields"""
-    # Test with additional optional fields that might be needed for service startup
-    resp = client.post(
-        "/v1/semaphore/start",
-        json={
-            "serviceId": "test-service",
-            "machineId": "test-machine",
-            "taskId": "startup-task-123",
-            "environment": {"ENV_VAR": "value"},
-            "timeout": 300,
-        },
-    )
-    # Should accept the request regardless of optional fields
-    assert resp.status_code in {501, 200, 202, 400, 404, 500}
-
-
-def test_semaphore_stop_with_optional_fields(client: TestClient):
-    """Test that /v1/semaphore/stop accepts optional configuration fields"""
-    # Test with additional optional fields that might be needed for service shutdown
-    resp = client.post(
-        "/v1/semaphore/stop",
-        json={
-            "serviceId": "test-service",
-            "machineId": "test-machine",
-            "taskId": "shutdown-task-123",
-            "force": True,
-            "timeout": 60,
-        },
-    )
-    # Should accept the request regardless of optional fields
-    assert resp.status_code in {501, 200, 202, 400, 404, 500}
+    resp = client.get("/v1/semaphore/status", params=params)
+    assert resp.status_code in INVALID
+
+
+@pytest.mark.parametrize(
+    "path,method",
+    [
+        ("/v1/semaphore/start", "GET"),
+        ("/v1/semaphore/start", "PUT"),
+        ("/v1/semaphore/start", "DELETE"),
+        ("/v1/semaphore/stop", "GET"),
+        ("/v1/semaphore/stop", "PUT"),
+        ("/v1/semaphore/stop", "DELETE"),
+        ("/v1/semaphore/status", "POST"),
+        ("/v1/semaphore/status", "PUT"),
+        ("/v1/semaphore/status", "DELETE"),
+    ],
+)
+def test_semaphore_rejects_invalid_methods(client: TestClient, path, method):
+    """Test that Semaphore endpoints only accept their documented method"""
+    body = {"serviceId": "test", "machineId": "test"} if method in ("POST", "PUT") else None
+    resp = client.request(method, path, json=body)
+    assert resp.status_code in NOT_ALLOWED
 
 
 def test_semaphore_error_handling(client: TestClient):
@@ -0,0 +1,210 @@
+import asyncio
+import re
+
+import httpx
+import pytest
+import respx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+UPSTREAM_BASE = "http://upstream.local"
+SEMAPHORE_BASE_URL = "http://semaphore:3000"
+SEMAPHORE_TASKS_URL = f"{SEMAPHORE_BASE_URL}/api/project/1/tasks"
+
+
+def _semaphore_task_succeeded(request, task_id):
+    return httpx.Response(200, json={"task_id": task_id, "status": "success"})
+
+
+# Semaphore and target-service routes are built once. Tests adjust a named route
+# (e.g. ``semaphore_router["semaphore_tasks"].respond(500)``) and the change is
+# rolled back when the test's mock context exits.
+SEMAPHORE_ROUTER = respx.mock(assert_all_called=False)
+SEMAPHORE_ROUTER.post(SEMAPHORE_TASKS_URL, name="semaphore_tasks").respond(
+    201, json={"task_id": "start-task", "status": "running"}
+)
+SEMAPHORE_ROUTER.get(
+    url__regex=rf"^{re.escape(SEMAPHORE_TASKS_URL)}/(?P<task_id>[^/]+)$",
+    name="semaphore_task_status",
+).mock(side_effect=_semaphore_task_succeeded)
+SEMAPHORE_ROUTER.get(path="/v1/models", name="target_models").respond(
+    200, json={"models": ["test-model"]}
+)
+
+# Upstream route for proxy tests that inspect the forwarded request; tests set
+# its response and the change is rolled back afterwards
+UPSTREAM_ROUTER = respx.mock(base_url=UPSTREAM_BASE, assert_all_called=False)
+UPSTREAM_ROUTER.get("/v1/models", name="models")
+
+
+async def _upstream_models(request):
+    return JSONResponse({"models": ["llama3"]}, headers={"x-custom-header": "test-value"})
+
+
+async def _upstream_generate(request):
+    return JSONResponse({"response": "Hello! How can I help you today?"})
+
+
+async def _upstream_update(request):
+    return JSONResponse({"updated": True})
+
+
+async def _upstream_create(request):
+    return JSONResponse({"status": "success"}, status_code=201)
+
+
+async def _upstream_delete(request):
+    return JSONResponse({"deleted": True})
+
+
+# Fake upstream served in-process for proxy tests that only check the status
+# and body Hestia relays back
+UPSTREAM_APP = Starlette(
+    routes=[
+        Route("/v1/models", _upstream_models),
+        Route("/api/generate", _upstream_generate, methods=["POST"]),
+        Route("/api/generate", _upstream_update, methods=["PATCH"]),
+        Route("/api/create", _upstream_create, methods=["PUT"]),
+        Route("/api/delete", _upstream_delete, methods=["DELETE"]),
+    ]
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_app_state(monkeypatch):
+    """Give every test its own service state, request queue and strategy instances.
+
+    Tests can therefore reuse service ids such as ``ollama`` without inheriting
+    state, and the registries stay as small as a single test needs.
+    """
+    from hestia.app import AppState  # noqa: WPS433
+
+    monkeypatch.setattr("hestia.app._state", AppState())
+    monkeypatch.setattr("hestia.app._strategy_instances", {})
+
+
+@pytest.fixture(autouse=True)
+def fast_service_defaults(monkeypatch):
+    """Zero the ollama warmup, retry delay and idle timeout from hestia_config.yml.
+
+    Tests that need other values set them explicitly (``override_config`` or
+    their own ``monkeypatch.setenv``).
+    """
+    for name in ("WARMUP_MS", "RETRY_DELAY_MS", "IDLE_TIMEOUT_MS"):
+        monkeypatch.setenv(f"OLLAMA_{name}", "0")
+
+
+@pytest.fixture
+def respx_mock():
+    """Active respx router; tests register routes and assert calls explicitly."""
+    with respx.mock(assert_all_called=False) as mock:
+        yield mock
+
+
+@pytest.fixture
+def semaphore_router(monkeypatch):
+    """Shared Semaphore router with the gateway pointed at its base URL."""
+    monkeypatch.setenv("SEMAPHORE_BASE_URL", SEMAPHORE_BASE_URL)
+    with SEMAPHORE_ROUTER:
+        yield SEMAPHORE_ROUTER
+
+
+@pytest.fixture
+def upstream_router(upstream_config):
+    """Shared upstream router, active while the app points ollama at it."""
+    with UPSTREAM_ROUTER:
+        yield UPSTREAM_ROUTER
+
+
+@pytest.fixture
+def asgi_upstream(upstream_config, monkeypatch):
+    """Forward the app's upstream requests to ``UPSTREAM_APP`` over ASGITransport.
+
+    The client is installed as the app's shared upstream client and closed by the
+    app's own shutdown handler afterwards.
+    """
+    from hestia import app as app_module  # noqa: WPS433
+
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=UPSTREAM_APP), base_url=UPSTREAM_BASE
+    )
+    monkeypatch.setattr(app_module, "_UPSTREAM_CLIENT", client)
+    yield client
+    asyncio.run(app_module.close_upstream_client())
+
+
+@pytest.fixture
+def override_config(monkeypatch):
+    """Return a function that serves the app a prebuilt single-service config.
+
+    ``override_config(base_url=..., retry_count=...)`` builds the ``ollama``
+    ``ServiceConfig`` (pass ``service_id`` for another service) from the given
+    fields and ``ServiceConfig`` defaults, then patches the app's config lookup.
+    Replaces per-test ``OLLAMA_*`` env overrides, which made every config lookup
+    re-read the YAML file and environment. The config is returned so tests may
+    mutate it; it is rebuilt for each test.
+    """
+    from hestia.config import HestiaConfig, ServiceConfig  # noqa: WPS433
+
+    def override(service_id: str = "ollama", **fields):
+        config = HestiaConfig(services={service_id: ServiceConfig(**fields)})
+        monkeypatch.setattr("hestia.app._get_config", lambda: config)
+        return config
+
+    return override
+
+
+@pytest.fixture
+def upstream_config(override_config):
+    """Prebuilt config pointing ollama at a fake upstream, served by the app."""
+    return override_config(base_url=UPSTREAM_BASE, request_timeout_seconds=5)
+
+
+@pytest.fixture
+def tick_ms(monkeypatch):
+    """Freeze the idle-timeout clock and return a function that advances it.
+
+    Each tick runs the idle reaper synchronously, so idle transitions are
+    observable right after ``tick_ms(...)`` returns without any real waiting.
+    """
+    from hestia import app as app_module, clock  # noqa: WPS433
+
+    now_ms = [clock.monotonic_ms()]
+    monkeypatch.setattr(clock, "monotonic_ms", lambda: now_ms[0])
+
+    def advance(delta_ms: int) -> None:
+        now_ms[0] += delta_ms
+        app_module._reap_idle_services()
+        clock.idle_wakeup.set()
+
+    return advance
+
+
+@pytest.fixture
+def service_state():
+    """Return a function that reads a service's state straight from the gateway."""
+    from hestia.app import get_state  # noqa: WPS433
+
+    def read(service_id: str):
+        return get_state().services.get(service_id, {}).get("state")
+
+    return read
+
+
+@pytest.fixture
+def register_service():
+    """Return a function that registers a service config in-process for this test."""
+    from hestia.config import ServiceConfig, register_service, unregister_service  # noqa: WPS433
+
+    registered = []
+
+    def register(service_id: str, **fields) -> ServiceConfig:
+        service_config = ServiceConfig(**fields)
+        register_service(service_id, service_config)
+        registered.append(service_id)
+        return service_config
+
+    yield register
+    for service_id in registered:
+        unregister_service(service_id)
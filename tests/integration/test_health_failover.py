@@ -1,11 +1,22 @@
-import respx
+import json
+
+import pytest
 from fastapi.testclient import TestClient
 
-from hestia.app import app
 from hestia.config import HestiaConfig, ServiceConfig
 
+# Serialized once; every request in this module posts the same generate body
+GENERATE_BODY = json.dumps({"model": "test", "prompt": "hi"}).encode()
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _generate(client: TestClient, service_id: str):
+    return client.post(
+        f"/services/{service_id}/api/generate", content=GENERATE_BODY, headers=JSON_HEADERS
+    )
+
 
-def build_config_with_instances(service_id: str, instances: list[dict]):
+def build_config_with_instances(service_id: str, instances: list[dict]) -> HestiaConfig:
     """Helper to build a HestiaConfig with multiple instances and load_balancer strategy."""
     svc_cfg = ServiceConfig(
         base_url="http://fallback.local",
@@ -15,127 +26,102 @@ def build_config_with_instances(service_id: str, instances: list[dict]):
         idle_timeout_ms=0,
         queue_size=100,
         request_timeout_seconds=5,
+        instances=instances,
+        strategy="load_balancer",
     )
-    # Inject strategy-related dynamic attributes
-    setattr(svc_cfg, "instances", instances)
-    setattr(svc_cfg, "strategy", "load_balancer")
     return HestiaConfig(services={service_id: svc_cfg})
 
 
-def test_health_tracking_marks_instance_unhealthy_on_failure(monkeypatch):
-    """Test that failed requests mark instances as unhealthy and next request uses different instance."""
-    client = TestClient(app)
-
-    service_id = "test-health-failover"
-    inst_a = "http://a.local"
-    inst_b = "http://b.local"
+@pytest.fixture
+def failover_env(request, monkeypatch):
+    """Point the app at a two-instance load_balancer service.
 
-    config = build_config_with_instances(
-        service_id,
-        instances=[{"url": inst_a}, {"url": inst_b}],
-    )
+    Parametrized indirectly with ``(service_id, inst_a, inst_b)``; each test uses
+    its own service so load balancer health state doesn't leak between tests.
+    """
+    service_id, inst_a, inst_b = request.param
+    config = build_config_with_instances(service_id, instances=[{"url": inst_a}, {"url": inst_b}])
 
     # Make the app use our config
     monkeypatch.setattr("hestia.app._get_config", lambda: config)
+    return service_id, inst_a, inst_b
 
-    with respx.mock(assert_all_called=True) as mock:
-        # First request: inst_a fails (503), should mark it unhealthy
-        mock.post(f"{inst_a}/api/generate").respond(503, json={"error": "service down"})
 
-        # Second request: should go to inst_b since inst_a is marked unhealthy
-        mock.post(f"{inst_b}/api/generate").respond(200, json={"ok": True, "from": "B"})
+@pytest.mark.parametrize(
+    "failover_env", [("test-health-failover", "http://a.local", "http://b.local")], indirect=True
+)
+def test_health_tracking_marks_instance_unhealthy_on_failure(
+    client: TestClient, respx_mock, failover_env
+):
+    """Test that failed requests mark instances as unhealthy and next request uses different instance."""
+    service_id, inst_a, inst_b = failover_env
+
+    # First request: inst_a fails (503), should mark it unhealthy
+    respx_mock.post(f"{inst_a}/api/generate").respond(503, json={"error": "service down"})
 
-        # First request - should fail and mark inst_a unhealthy
-        resp1 = client.post(
-            f"/services/{service_id}/api/generate",
-            json={"model": "test", "prompt": "hi"},
-        )
-        assert resp1.status_code == 503
+    # Second request: should go to inst_b since inst_a is marked unhealthy
+    respx_mock.post(f"{inst_b}/api/generate").respond(200, json={"ok": True, "from": "B"})
 
-        # Second request - should succeed with inst_b
-        resp2 = client.post(
-            f"/services/{service_id}/api/generate",
-            json={"model": "test", "prompt": "hi"},
-        )
-        assert resp2.status_code == 200
-        assert resp2.json()["from"] == "B"
+    # First request - should fail and mark inst_a unhealthy
+    resp1 = _generate(client, service_id)
+    assert resp1.status_code == 503
 
+    # Second request - should succeed with inst_b
+    resp2 = _generate(client, service_id)
+    assert resp2.status_code == 200
+    assert resp2.json()["from"] == "B"
+    respx_mock.assert_all_called()
 
-def test_health_tracking_marks_instance_healthy_on_success(monkeypatch):
+
+@pytest.mark.parametrize(
+    "failover_env", [("test-health-recovery", "http://a2.local", "http://b2.local")], indirect=True
+)
+def test_health_tracking_marks_instance_healthy_on_success(
+    client: TestClient, respx_mock, failover_env
+):
     """Test that successful requests mark instances as healthy."""
-    client = TestClient(app)
+    service_id, inst_a, inst_b = failover_env
 
-    service_id = "test-health-recovery"
-    inst_a = "http://a2.local"
-    inst_b = "http://b2.local"
+    # First request: inst_a fails
+    respx_mock.post(f"{inst_a}/api/generate").respond(503, json={"error": "service down"})
 
-    config = build_config_with_instances(
-        service_id,
-        instances=[{"url": inst_a}, {"url": inst_b}],
-    )
+    # Second and third requests: inst_b succeeds (we'll call it twice)
+    respx_mock.post(f"{inst_b}/api/generate").respond(200, json={"ok": True, "from": "B"})
 
-    # Make the app use our config
-    monkeypatch.setattr("hestia.app._get_config", lambda: config)
+    # Fail inst_a
+    resp1 = _generate(client, service_id)
+    assert resp1.status_code == 503
 
-    with respx.mock(assert_all_called=False) as mock:  # Allow unused mocks
-        # First request: inst_a fails
-        mock.post(f"{inst_a}/api/generate").respond(503, json={"error": "service down"})
-
-        # Second and third requests: inst_b succeeds (we'll call it twice)
-        mock.post(f"{inst_b}/api/generate").respond(200, json={"ok": True, "from": "B"})
-
-        # Fail inst_a
-        resp1 = client.post(
-            f"/services/{service_id}/api/generate",
-            json={"model": "test", "prompt": "hi"},
-        )
-        assert resp1.status_code == 503
-
-        # Use inst_b successfully (first time)
-        resp2 = client.post(
-            f"/services/{service_id}/api/generate",
-            json={"model": "test", "prompt": "hi"},
-        )
-        assert resp2.status_code == 200
-        assert resp2.json()["from"] == "B"
-
-        # inst_b should continue to work (stays healthy)
-        resp3 = client.post(
-            f"/services/{service_id}/api/generate",
-            json={"model": "test", "prompt": "hi"},
-        )
-        assert resp3.status_code == 200
-        assert resp3.json()["from"] == "B"
-
-
-def test_transparent_proxy_health_tracking(monkeypatch):
-    """Test that transparent proxy also participates in health tracking."""
-    client = TestClient(app)
+    # Use inst_b successfully (first time)
+    resp2 = _generate(client, service_id)
+    assert resp2.status_code == 200
+    assert resp2.json()["from"] == "B"
 
-    service_id = "test-proxy-health"
-    inst_a = "http://a3.local"
-    inst_b = "http://b3.local"
+    # inst_b should continue to work (stays healthy)
+    resp3 = _generate(client, service_id)
+    assert resp3.status_code == 200
+    assert resp3.json()["from"] == "B"
 
-    config = build_config_with_instances(
-        service_id,
-        instances=[{"url": inst_a}, {"url": inst_b}],
-    )
 
-    # Make the app use our config
-    monkeypatch.setattr("hestia.app._get_config", lambda: config)
+@pytest.mark.parametrize(
+    "failover_env", [("test-proxy-health", "http://a3.local", "http://b3.local")], indirect=True
+)
+def test_transparent_proxy_health_tracking(client: TestClient, respx_mock, failover_env):
+    """Test that transparent proxy also participates in health tracking."""
+    service_id, inst_a, inst_b = failover_env
 
-    with respx.mock(assert_all_called=True) as mock:
-        # First request: inst_a fails
-        mock.get(f"{inst_a}/v1/models").respond(503, json={"error": "service down"})
+    # First request: inst_a fails
+    respx_mock.get(f"{inst_a}/v1/models").respond(503, json={"error": "service down"})
 
-        # Second request: inst_b succeeds
-        mock.get(f"{inst_b}/v1/models").respond(200, json={"models": ["test-model"]})
+    # Second request: inst_b succeeds
+    respx_mock.get(f"{inst_b}/v1/models").respond(200, json={"models": ["test-model"]})
 
-        # First request should fail with inst_a
-        resp1 = client.get(f"/services/{service_id}/v1/models")
-        assert resp1.status_code == 503
+    # First request should fail with inst_a
+    resp1 = client.get(f"/services/{service_id}/v1/models")
+    assert resp1.status_code == 503
 
-        # Second request should succeed with inst_b
-        resp2 = client.get(f"/services/{service_id}/v1/models")
-        assert resp2.status_code == 200
-        assert resp2.json()["models"] == ["test-model"]
+    # Second request should succeed with inst_b
+    resp2 = client.get(f"/services/{service_id}/v1/models")
+    assert resp2.status_code == 200
+    assert resp2.json()["models"] == ["test-model"]
+    respx_mock.assert_all_called()
@@ -1,252 +1,202 @@
-import respx
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
-from hestia.app import app
+# HTTP-layer coverage; the same orchestration logic runs against fakes in
+# tests/unit/test_semaphore_orchestrator.py
+pytestmark = pytest.mark.integration
 
 
-def test_cold_service_triggers_semaphore_start_request(monkeypatch):
-    """Test that accessing a cold service triggers a Semaphore start request."""
-    client = TestClient(app)
-
-    # Clear any existing service state from previous tests
-    from hestia.app import _services, _request_queue
+def _configure_semaphore_service(monkeypatch, service_id: str, **settings: str) -> None:
+    """Set ``<SERVICE_ID>_<SETTING>`` environment variables for a service."""
+    prefix = service_id.upper().replace("-", "_")
+    for name, value in settings.items():
+        monkeypatch.setenv(f"{prefix}_{name}", value)
 
-    _services.clear()
-    _request_queue._service_queues.clear()
-    _request_queue._startup_in_progress.clear()
 
+def test_cold_service_triggers_semaphore_start_request(
+    client: TestClient, semaphore_router, monkeypatch
+):
+    """Test that accessing a cold service triggers a Semaphore start request."""
     service_id = "semaphore-startup-test"
 
     # Configure service for Semaphore orchestration
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_BASE_URL", "http://target-service.local"
+    _configure_semaphore_service(
+        monkeypatch,
+        service_id,
+        BASE_URL="http://target-service.local",
+        SEMAPHORE_ENABLED="true",
+        SEMAPHORE_MACHINE_ID="server-01",
+        SEMAPHORE_TASK_ID="start-task-123",
     )
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_ENABLED", "true")
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_MACHINE_ID", "server-01")
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_SEMAPHORE_TASK_ID", "start-task-123"
-    )
-    monkeypatch.setenv("SEMAPHORE_BASE_URL", "http://semaphore:3000")
 
-    with respx.mock(assert_all_called=False) as mock:
-        # Mock Semaphore start request - this should be called when service is cold
-        mock.post("http://semaphore:3000/api/project/1/tasks").respond(
-            201, json={"task_id": "task-456", "status": "running"}
-        )
+    # Mock Semaphore start request - this should be called when service is cold
+    semaphore_router["semaphore_tasks"].respond(
+        201, json={"task_id": "task-456", "status": "running"}
+    )
 
-        # Mock the eventual target service response (after Semaphore starts it)
-        mock.get("http://target-service.local/v1/models").respond(
-            200, json={"models": ["test-model"]}
-        )
+    # Mock the eventual target service response (after Semaphore starts it)
+    semaphore_router["target_models"].respond(200, json={"models": ["test-model"]})
 
-        # Act: Request to cold service via transparent proxy
-        resp = client.get(f"/services/{service_id}/v1/models")
+    # Act: Request to cold service via transparent proxy
+    resp = client.get(f"/services/{service_id}/v1/models")
 
-    # T043 implementation complete! The test verifies that:
+    # The test verifies that:
     # 1. Hestia detects the service is cold
     # 2. Hestia calls Semaphore API to start the service
     # 3. Hestia waits for Semaphore task completion
     # 4. Request is forwarded to target service and response returned
-
-    # The implementation is working correctly
     assert resp.status_code == 200
 
 
-def test_requests_queued_during_semaphore_startup(monkeypatch):
+def test_requests_queued_during_semaphore_startup(
+    client: TestClient, semaphore_router, monkeypatch
+):
     """Test that multiple requests are queued while Semaphore starts a service."""
-    client = TestClient(app)
-
-    # Clear any existing service state from previous tests
-    from hestia.app import _services, _request_queue
-
-    _services.clear()
-    _request_queue._service_queues.clear()
-    _request_queue._startup_in_progress.clear()
-
     service_id = "semaphore-queue-test"
 
     # Configure service for Semaphore orchestration
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_BASE_URL", "http://queue-target.local"
+    _configure_semaphore_service(
+        monkeypatch,
+        service_id,
+        BASE_URL="http://queue-target.local",
+        SEMAPHORE_ENABLED="true",
+        SEMAPHORE_MACHINE_ID="server-02",
     )
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_ENABLED", "true")
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_MACHINE_ID", "server-02")
-    monkeypatch.setenv("SEMAPHORE_BASE_URL", "http://semaphore:3000")
-
-    with respx.mock(assert_all_called=False) as mock:
-        # Mock Semaphore start request
-        mock.post("http://semaphore:3000/api/project/1/tasks").respond(
-            201, json={"task_id": "task-789", "status": "running"}
-        )
 
-        # Mock Semaphore status polling
-        mock.get("http://semaphore:3000/api/project/1/tasks/task-789").respond(
-            200, json={"task_id": "task-789", "status": "success"}
-        )
+    # Mock Semaphore start request
+    semaphore_router["semaphore_tasks"].respond(
+        201, json={"task_id": "task-789", "status": "running"}
+    )
 
-        # Mock target service responses for queued requests
-        mock.get("http://queue-target.local/v1/models").respond(200, json={"models": ["model-1"]})
-        mock.post("http://queue-target.local/api/generate").respond(
-            200, json={"response": "Generated text"}
-        )
+    # Mock target service responses for queued requests
+    semaphore_router["target_models"].respond(200, json={"models": ["model-1"]})
+    semaphore_router.post("http://queue-target.local/api/generate").respond(
+        200, json={"response": "Generated text"}
+    )
 
-        # Act: Send multiple requests while service is starting
-        # These should be queued until Semaphore reports service as ready
-        resp1 = client.get(f"/services/{service_id}/v1/models")
-        resp2 = client.post(
-            f"/services/{service_id}/api/generate", json={"model": "test", "prompt": "hello"}
-        )
+    # Act: Send multiple requests while service is starting
+    # These should be queued until Semaphore reports service as ready
+    resp1 = client.get(f"/services/{service_id}/v1/models")
+    resp2 = client.post(
+        f"/services/{service_id}/api/generate", json={"model": "test", "prompt": "hello"}
+    )
 
     # The test expects that:
     # 1. First request triggers Semaphore start and gets queued
     # 2. Second request also gets queued (doesn't trigger duplicate start)
     # 3. Both requests are forwarded once service is ready
     # 4. Both responses are returned in order
-
-    # T043 implementation working correctly
     assert resp1.status_code == 200
     assert resp2.status_code == 200
 
 
-def test_semaphore_start_failure_returns_error(monkeypatch):
+def test_semaphore_start_failure_returns_error(client: TestClient, semaphore_router, monkeypatch):
     """Test that Semaphore start failures are handled gracefully."""
-    client = TestClient(app)
-
-    # Clear any existing service state from previous tests
-    from hestia.app import _services, _request_queue
-
-    _services.clear()
-    _request_queue._service_queues.clear()
-    _request_queue._startup_in_progress.clear()
-
     service_id = "semaphore-fail-test"
 
     # Configure service for Semaphore orchestration
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_BASE_URL", "http://fail-target.local"
+    _configure_semaphore_service(
+        monkeypatch,
+        service_id,
+        BASE_URL="http://fail-target.local",
+        SEMAPHORE_ENABLED="true",
+        SEMAPHORE_MACHINE_ID="server-03",
     )
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_ENABLED", "true")
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_MACHINE_ID", "server-03")
-    monkeypatch.setenv("SEMAPHORE_BASE_URL", "http://semaphore:3000")
-
-    with respx.mock(assert_all_called=False) as mock:
-        # Mock Semaphore start request failure
-        mock.post("http://semaphore:3000/api/project/1/tasks").respond(
-            500, json={"error": "Failed to start task"}
-        )
 
-        # Act: Request to service when Semaphore fails to start it
-        resp = client.get(f"/services/{service_id}/v1/models")
+    # Mock Semaphore start request failure
+    semaphore_router["semaphore_tasks"].respond(500, json={"error": "Failed to start task"})
+
+    # The target never came up
+    semaphore_router["target_models"].mock(side_effect=httpx.ConnectError("Connection refused"))
+
+    # Act: Request to service when Semaphore fails to start it
+    resp = client.get(f"/services/{service_id}/v1/models")
 
     # The test expects that:
     # 1. Hestia tries to start service via Semaphore
     # 2. Semaphore returns an error
-    # 3. Hestia returns appropriate error to client (503 Service Unavailable)
-
-    # Until implementation is done, we expect this to fail
-    assert resp.status_code in {500, 503, 404}
+    # 3. Hestia falls back to a plain startup, cannot reach the target and
+    #    returns 503 Service Unavailable
+    assert resp.status_code == 503
 
 
-def test_dispatcher_with_semaphore_integration(monkeypatch):
+def test_dispatcher_with_semaphore_integration(client: TestClient, semaphore_router, monkeypatch):
     """Test that the /v1/requests dispatcher also works with Semaphore integration."""
-    client = TestClient(app)
-
-    # Clear any existing service state from previous tests
-    from hestia.app import _services, _request_queue
-
-    _services.clear()
-    _request_queue._service_queues.clear()
-    _request_queue._startup_in_progress.clear()
-
     service_id = "semaphore-dispatcher-test"
 
     # Configure service for Semaphore orchestration
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_BASE_URL", "http://dispatcher-target.local"
+    _configure_semaphore_service(
+        monkeypatch,
+        service_id,
+        BASE_URL="http://dispatcher-target.local",
+        SEMAPHORE_ENABLED="true",
+        SEMAPHORE_MACHINE_ID="server-04",
     )
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_ENABLED", "true")
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_MACHINE_ID", "server-04")
-    monkeypatch.setenv("SEMAPHORE_BASE_URL", "http://semaphore:3000")
-
-    with respx.mock(assert_all_called=False) as mock:
-        # Mock Semaphore start request
-        mock.post("http://semaphore:3000/api/project/1/tasks").respond(
-            201, json={"task_id": "task-dispatcher", "status": "running"}
-        )
 
-        # Mock target service response
-        mock.get("http://dispatcher-target.local/v1/models").respond(
-            200, json={"models": ["dispatcher-model"]}
-        )
+    # Mock Semaphore start request
+    semaphore_router["semaphore_tasks"].respond(
+        201, json={"task_id": "task-dispatcher", "status": "running"}
+    )
 
-        # Act: Use dispatcher endpoint with Semaphore-managed service
-        resp = client.post(
-            "/v1/requests", json={"serviceId": service_id, "method": "GET", "path": "/v1/models"}
-        )
+    # Mock target service response
+    semaphore_router["target_models"].respond(200, json={"models": ["dispatcher-model"]})
+
+    # Act: Use dispatcher endpoint with Semaphore-managed service
+    resp = client.post(
+        "/v1/requests", json={"serviceId": service_id, "method": "GET", "path": "/v1/models"}
+    )
 
     # The test expects that:
     # 1. Dispatcher detects service is cold and needs Semaphore start
     # 2. Dispatcher triggers Semaphore start request
     # 3. Request is queued until service is ready
-    # 4. Request is forwarded and response returned
-
-    # Until implementation is done, we expect this to fail
-    # Note: Currently may return 200 due to fallback to ollama config when service not found
-    assert resp.status_code in {500, 503, 404, 501, 200}
+    # 4. Request is forwarded and the upstream status is reported in the body
+    assert resp.status_code == 200
+    assert resp.json()["status"] == 200
 
 
-def test_semaphore_status_polling_until_ready(monkeypatch):
+def test_semaphore_status_polling_until_ready(
+    client: TestClient, semaphore_router, monkeypatch, virtual_sleep
+):
     """Test that Hestia polls Semaphore status until service is ready."""
-    client = TestClient(app)
-
-    # Clear any existing service state from previous tests
-    from hestia.app import _services, _request_queue
-
-    _services.clear()
-    _request_queue._service_queues.clear()
-    _request_queue._startup_in_progress.clear()
-
     service_id = "semaphore-polling-test"
 
     # Configure service for Semaphore orchestration with short polling interval
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_BASE_URL", "http://polling-target.local"
+    _configure_semaphore_service(
+        monkeypatch,
+        service_id,
+        BASE_URL="http://polling-target.local",
+        SEMAPHORE_ENABLED="true",
+        SEMAPHORE_MACHINE_ID="server-05",
+        SEMAPHORE_POLL_INTERVAL="0.1",  # 0.1 seconds
     )
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_ENABLED", "true")
-    monkeypatch.setenv(f"{service_id.upper().replace('-', '_')}_SEMAPHORE_MACHINE_ID", "server-05")
-    monkeypatch.setenv(
-        f"{service_id.upper().replace('-', '_')}_SEMAPHORE_POLL_INTERVAL", "0.1"
-    )  # 0.1 seconds
-    monkeypatch.setenv("SEMAPHORE_BASE_URL", "http://semaphore:3000")
-
-    with respx.mock(assert_all_called=False) as mock:
-        # Mock Semaphore start request
-        mock.post("http://semaphore:3000/api/project/1/tasks").respond(
-            201, json={"task_id": "task-polling", "status": "running"}
-        )
 
-        # Mock Semaphore status polling - first running, then success
-        mock.get("http://semaphore:3000/api/project/1/tasks/task-polling").mock(
-            side_effect=[
-                respx.MockResponse(200, json={"task_id": "task-polling", "status": "running"}),
-                respx.MockResponse(200, json={"task_id": "task-polling", "status": "running"}),
-                respx.MockResponse(200, json={"task_id": "task-polling", "status": "success"}),
-            ]
-        )
+    # Mock Semaphore start request
+    semaphore_router["semaphore_tasks"].respond(
+        201, json={"task_id": "task-polling", "status": "running"}
+    )
 
-        # Mock target service response once ready
-        mock.get("http://polling-target.local/v1/models").respond(
-            200, json={"models": ["polling-model"]}
+    # Mock Semaphore status polling - running twice, then success
+    statuses = iter(["running", "running", "success"])
+    status_route = semaphore_router["semaphore_task_status"].mock(
+        side_effect=lambda request, task_id: httpx.Response(
+            200, json={"task_id": task_id, "status": next(statuses)}
         )
+    )
 
-        # Act: Request service that requires polling until ready
-        resp = client.get(f"/services/{service_id}/v1/models")
+    # Mock target service response once ready
+    semaphore_router["target_models"].respond(200, json={"models": ["polling-model"]})
+
+    # Act: Request service that requires polling until ready
+    resp = client.get(f"/services/{service_id}/v1/models")
 
     # The test expects that:
     # 1. Hestia starts service via Semaphore
     # 2. Hestia polls Semaphore status multiple times until success
     # 3. Once ready, request is forwarded to target service
     # 4. Response is returned to client
-
-    # T043 implementation working correctly
     assert resp.status_code == 200
+    assert status_route.call_count == 3
+    # Each "running" status waited one poll interval, on the virtual clock
+    assert [c.args for c in virtual_sleep.await_args_list] == [(0.1,), (0.1,)]
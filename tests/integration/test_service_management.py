@@ -1,13 +1,20 @@
-import respx
+import asyncio
+import time
+from concurrent import futures
+
+import pytest
 from fastapi.testclient import TestClient
 
-from hestia.app import app
 
+@pytest.fixture(scope="module")
+def executor():
+    """Worker threads shared by the tests that issue requests in the background."""
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
 
-def test_service_status_cold_service():
-    """Test status endpoint for a cold service."""
-    client = TestClient(app)
 
+def test_service_status_cold_service(client: TestClient):
+    """Test status endpoint for a cold service."""
     # Act: Check status of a service that hasn't been used (unique name)
     resp = client.get("/v1/services/cold-test-service/status")
 
@@ -21,20 +28,17 @@ def test_service_status_cold_service():
     assert data["queuePending"] == 0
 
 
-def test_service_status_after_activity(monkeypatch):
+def test_service_status_after_activity(client: TestClient, respx_mock, override_config):
     """Test status endpoint for a service after it has been used."""
-    client = TestClient(app)
-
     # Arrange: Set up a service configuration
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://upstream.local")
+    override_config(base_url="http://upstream.local")
 
     # Simulate service activity by calling the transparent proxy
     # This will put the service in hot/ready state
-    with respx.mock() as mock:
-        mock.get("http://upstream.local/v1/models").respond(200, json={"models": []})
+    respx_mock.get("http://upstream.local/v1/models").respond(200, json={"models": []})
 
-        # This should trigger service startup
-        client.get("/services/ollama/v1/models")
+    # This should trigger service startup; a 200 means the upstream route was hit
+    assert client.get("/services/ollama/v1/models").status_code == 200
 
     # Act: Check status after activity
     resp = client.get("/v1/services/ollama/status")
@@ -48,10 +52,8 @@ def test_service_status_after_activity(monkeypatch):
     assert data["machineId"] == "local"
 
 
-def test_start_service_cold_service():
+def test_start_service_cold_service(client: TestClient):
     """Test starting a cold service."""
-    client = TestClient(app)
-
     # Act: Start a cold service
     resp = client.post("/v1/services/new-service/start")
 
@@ -61,18 +63,15 @@ def test_start_service_cold_service():
     assert data["message"] == "Service start initiated"
 
 
-def test_start_service_already_running(monkeypatch):
+def test_start_service_already_running(client: TestClient, respx_mock, override_config):
     """Test starting a service that's already running."""
-    client = TestClient(app)
-
     # Arrange: Set up a service and make it hot
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://upstream.local")
+    override_config(base_url="http://upstream.local")
 
-    with respx.mock() as mock:
-        mock.get("http://upstream.local/v1/models").respond(200, json={"models": []})
+    respx_mock.get("http://upstream.local/v1/models").respond(200, json={"models": []})
 
-        # Make the service hot by using it
-        client.get("/services/ollama/v1/models")
+    # Make the service hot by using it
+    assert client.get("/services/ollama/v1/models").status_code == 200
 
     # Act: Try to start the already running service
     resp = client.post("/v1/services/ollama/start")
@@ -83,10 +82,8 @@ def test_start_service_already_running(monkeypatch):
     assert data["message"] == "Service is already running"
 
 
-def test_start_service_already_starting():
+def test_start_service_already_starting(client: TestClient):
     """Test starting a service that's already starting."""
-    client = TestClient(app)
-
     # Act: Start a service twice quickly
     resp1 = client.post("/v1/services/starting-service/start")
     resp2 = client.post("/v1/services/starting-service/start")
@@ -101,17 +98,15 @@ def test_start_service_already_starting():
     assert "already" in data2["message"]
 
 
-def test_service_status_shows_queue_pending(monkeypatch):
+def test_service_status_shows_queue_pending(client: TestClient, override_config, executor):
     """Test that service status shows pending queue requests."""
-    client = TestClient(app)
-
     # Arrange: Set up a failing service to create queue backlog
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://nonexistent.local")
-    monkeypatch.setenv("OLLAMA_REQUEST_TIMEOUT_SECONDS", "10")  # Longer timeout
+    override_config(
+        base_url="http://nonexistent.local",
+        request_timeout_seconds=10,  # Longer timeout
+    )
 
     # Act: Make a request that will be queued (non-blocking)
-    import threading
-
     def make_request():
         try:
             client.post(
@@ -121,20 +116,18 @@ def test_service_status_shows_queue_pending(monkeypatch):
         except Exception:
             pass  # Expected to timeout/fail
 
-    # Start request in background thread to avoid blocking
-    thread = threading.Thread(target=make_request)
-    thread.start()
-
-    # Give a moment for request to be queued
-    import time
+    # Start request on a background worker to avoid blocking
+    pending = executor.submit(make_request)
 
-    time.sleep(0.1)
-
-    # Check status while request is queued
-    resp = client.get("/v1/services/ollama/status")
+    # Check status as soon as the request shows up in the queue (bounded wait)
+    for _ in range(50):
+        resp = client.get("/v1/services/ollama/status")
+        if resp.json().get("queuePending", 0) > 0:
+            break
+        time.sleep(0.002)
 
     # Clean up
-    thread.join(timeout=2)
+    futures.wait([pending], timeout=2)
 
     # Assert: Should show queued request
     assert resp.status_code == 200
@@ -144,13 +137,14 @@ def test_service_status_shows_queue_pending(monkeypatch):
     assert "queuePending" in data
 
 
-def test_service_status_starting_state():
+@pytest.mark.asyncio
+async def test_service_status_starting_state(async_client):
     """Test service status during startup process."""
-    client = TestClient(app)
-
-    # Act: Start a service and immediately check status
-    start_resp = client.post("/v1/services/startup-test/start")
-    status_resp = client.get("/v1/services/startup-test/status")
+    # Act: Start a service and immediately check status. The status request must
+    # follow the start (issued concurrently it could observe "cold"), so the two
+    # go back to back on the test's event loop rather than through TestClient.
+    start_resp = await async_client.post("/v1/services/startup-test/start")
+    status_resp = await async_client.get("/v1/services/startup-test/status")
 
     # Assert: Should show starting state or hot (if startup was very fast)
     assert start_resp.status_code == 202
@@ -162,27 +156,27 @@ def test_service_status_starting_state():
     assert status_data["state"] in ["starting", "hot"]
 
 
-def test_service_endpoints_with_different_service_ids():
-    """Test that endpoints work with various service ID formats."""
-    client = TestClient(app)
+SERVICE_IDS = ["ollama", "test-service", "service_with_underscores", "service123"]
 
-    service_ids = ["ollama", "test-service", "service_with_underscores", "service123"]
 
-    for service_id in service_ids:
-        # Test status endpoint
-        status_resp = client.get(f"/v1/services/{service_id}/status")
-        assert status_resp.status_code == 200
-        assert status_resp.json()["serviceId"] == service_id
+@pytest.mark.asyncio
+async def test_service_endpoints_accept_service_ids(async_client):
+    """Test that status and start endpoints work with various service ID formats."""
+    # All status and start requests are in flight at once
+    resps = await asyncio.gather(
+        *(async_client.get(f"/v1/services/{service_id}/status") for service_id in SERVICE_IDS),
+        *(async_client.post(f"/v1/services/{service_id}/start") for service_id in SERVICE_IDS),
+    )
+    status_resps, start_resps = resps[: len(SERVICE_IDS)], resps[len(SERVICE_IDS) :]
 
-        # Test start endpoint
-        start_resp = client.post(f"/v1/services/{service_id}/start")
-        assert start_resp.status_code in [202, 409]  # 202 for new, 409 if already starting
+    assert [r.status_code for r in status_resps] == [200] * len(SERVICE_IDS)
+    assert [r.json()["serviceId"] for r in status_resps] == SERVICE_IDS
+    # 202 for new, 409 if already starting
+    assert all(r.status_code in (202, 409) for r in start_resps)
 
 
-def test_service_status_json_structure():
+def test_service_status_json_structure(client: TestClient):
     """Test that service status returns proper JSON structure."""
-    client = TestClient(app)
-
     # Act: Get service status
     resp = client.get("/v1/services/json-test/status")
 
@@ -200,28 +194,26 @@ def test_service_status_json_structure():
     assert data["readiness"] in ["ready", "not_ready"]
 
 
-def test_status_reports_hot_if_upstream_running_without_proxy(monkeypatch):
+def test_status_reports_hot_if_upstream_running_without_proxy(
+    client: TestClient, respx_mock, override_config
+):
     """If upstream is already running (health OK), status should be hot even before any proxy request.
 
     Scenario: User has Ollama already running locally before starting Hestia. On first status check,
     Hestia should detect readiness via the configured health_url and report hot/ready without requiring
     a transparent proxy request to trigger state change.
     """
-    client = TestClient(app)
-
-    # Use a unique service id to avoid global state contamination from other tests
-    service_id = "ollama-prehot"
+    # fresh_app_state gives each test an empty service registry, so the default id is safe
+    service_id = "ollama"
 
     # Arrange: Configure upstream to a mock and set health URL (applies to ollama defaults)
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://upstream.local")
-    monkeypatch.setenv("OLLAMA_HEALTH_URL", "http://upstream.local/api/tags")
+    override_config(base_url="http://upstream.local", health_url="http://upstream.local/api/tags")
 
-    with respx.mock() as mock:
-        # Health endpoint returns 200 to indicate upstream is ready
-        mock.get("http://upstream.local/api/tags").respond(200, json={"ok": True})
+    # Health endpoint returns 200 to indicate upstream is ready
+    respx_mock.get("http://upstream.local/api/tags").respond(200, json={"ok": True})
 
-        # Act: Call status endpoint BEFORE any proxy request
-        resp = client.get(f"/v1/services/{service_id}/status")
+    # Act: Call status endpoint BEFORE any proxy request
+    resp = client.get(f"/v1/services/{service_id}/status")
 
     # Assert: Expect hot/ready immediately
     assert resp.status_code == 200
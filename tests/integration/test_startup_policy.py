@@ -1,64 +1,46 @@
+import logging
+
+import httpx
 import respx
 from fastapi.testclient import TestClient
 
-from hestia.app import app
-
+POLICY_EVENTS = {"proxy_retry", "proxy_fallback", "proxy_terminal_error"}
 
-def test_startup_policy_retry_fallback_then_error(monkeypatch):
-    client = TestClient(app)
 
+def test_startup_policy_retry_fallback_then_error(client: TestClient, override_config, caplog):
     # Configure retry attempts and fallback URL
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://primary.local")
-    monkeypatch.setenv("OLLAMA_RETRY_COUNT", "2")
-    monkeypatch.setenv("OLLAMA_RETRY_DELAY_MS", "0")
-    monkeypatch.setenv("OLLAMA_FALLBACK_URL", "http://fallback.local")
-
-    with respx.mock(assert_all_called=False) as mock:
-        primary_route = mock.get("http://primary.local/v1/models").mock(
-            side_effect=Exception("connect error")
-        )
-        fallback_route = mock.get("http://fallback.local/v1/models").mock(
-            side_effect=Exception("connect error")
-        )
-
-        resp = client.get("/services/ollama/v1/models")
+    override_config(
+        base_url="http://primary.local",
+        retry_count=2,
+        retry_delay_ms=0,
+        fallback_url="http://fallback.local",
+    )
+
+    # The gateway logger doesn't propagate to the root logger, so capture it directly
+    gateway_logger = logging.getLogger("hestia.app")
+    gateway_logger.addHandler(caplog.handler)
+    try:
+        with respx.mock(assert_all_called=False) as mock:
+            primary_route = mock.get("http://primary.local/v1/models").mock(
+                side_effect=httpx.ConnectError("connect error")
+            )
+            fallback_route = mock.get("http://fallback.local/v1/models").mock(
+                side_effect=httpx.ConnectError("connect error")
+            )
+
+            resp = client.get("/services/ollama/v1/models")
+    finally:
+        gateway_logger.removeHandler(caplog.handler)
 
     # Expect 503 after 2 retries on primary and 1 attempt on fallback
     assert resp.status_code == 503
     assert primary_route.call_count == 2
     assert fallback_route.call_count == 1
 
-
-def test_startup_policy_with_event_logging(monkeypatch, caplog):
-    """Test that startup policy events are logged correctly."""
-    client = TestClient(app)
-
-    # Configure retry attempts and fallback URL
-    monkeypatch.setenv("OLLAMA_BASE_URL", "http://primary-log.local")
-    monkeypatch.setenv("OLLAMA_RETRY_COUNT", "2")
-    monkeypatch.setenv("OLLAMA_RETRY_DELAY_MS", "0")
-    monkeypatch.setenv("OLLAMA_FALLBACK_URL", "http://fallback-log.local")
-
-    with respx.mock(assert_all_called=False) as mock:
-        primary_route = mock.get("http://primary-log.local/v1/models").mock(
-            side_effect=Exception("connect error")
-        )
-        fallback_route = mock.get("http://fallback-log.local/v1/models").mock(
-            side_effect=Exception("connect error")
-        )
-
-        resp = client.get("/services/ollama/v1/models")
-
-    # Expect 503 after retries and fallback
-    assert resp.status_code == 503
-    assert primary_route.call_count == 2
-    assert fallback_route.call_count == 1
-
-    # This test verifies that retry, fallback, and terminal error event logging
-    # is working by checking the request behavior. The actual event logs can be
-    # seen in the test output (JSON structured logs) showing:
-    # - proxy_retry: Retry attempts with attempt numbers
-    # - proxy_fallback: Fallback endpoint attempts
-    # - proxy_terminal_error: Final failure with list of attempted URLs
-    #
-    # The structured event logging is implemented and working correctly.
+    # One retry on primary, then the fallback, then the terminal error are logged
+    events = [getattr(record, "event_type", None) for record in caplog.records]
+    assert [event for event in events if event in POLICY_EVENTS] == [
+        "proxy_retry",
+        "proxy_fallback",
+        "proxy_terminal_error",
+    ]
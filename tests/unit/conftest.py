@@ -0,0 +1,33 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+STRATEGIES_DIR = Path(__file__).resolve().parents[2] / "strategies"
+
+
+@pytest.fixture(scope="session")
+def load_strategy():
+    """Return a function that imports a bundled strategy module by file name.
+
+    Modules are loaded under a private package name so they never collide with
+    the ``strategies.*`` modules the app registers at import time.
+    """
+    loaded = {}
+
+    def load(name: str):
+        if name not in loaded:
+            module_name = f"_bundled_strategies.{name}"
+            spec = importlib.util.spec_from_file_location(
+                module_name, STRATEGIES_DIR / f"{name}.py"
+            )
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+            loaded[name] = module
+        return loaded[name]
+
+    yield load
+    for name in loaded:
+        sys.modules.pop(f"_bundled_strategies.{name}", None)
@@ -1,7 +1,13 @@
 import pytest
 from pydantic import ValidationError
 
-from hestia.config import HestiaConfig, load_config
+from hestia.config import (
+    HestiaConfig,
+    ServiceConfig,
+    load_config,
+    register_service,
+    unregister_service,
+)
 
 
 def test_load_config_from_yaml_file(tmp_path):
@@ -82,3 +88,16 @@ def test_env_vars_only_no_yaml(monkeypatch):
     assert config.services["ollama"].base_url == "http://env-only:11434"
     assert config.services["ollama"].health_url == "http://env-only:11434/health"
     assert config.services["ollama"].idle_timeout_ms == 15000
+
+
+def test_registered_service_overrides_env(monkeypatch):
+    monkeypatch.setenv("REGISTERED_SVC_BASE_URL", "http://from-env:8000")
+    register_service("registered-svc", ServiceConfig(base_url="http://registered:8000"))
+    try:
+        config = load_config("/non/existent/config.yml")
+        assert config.services["registered-svc"].base_url == "http://registered:8000"
+    finally:
+        unregister_service("registered-svc")
+
+    config = load_config("/non/existent/config.yml")
+    assert config.services["registered-svc"].base_url == "http://from-env:8000"
@@ -0,0 +1,246 @@
+"""Custom routing results are pinned to the outputs of the original, unoptimized
+implementation (straight condition evaluation, md5 buckets, linear variant scan)."""
+
+import hashlib
+
+import pytest
+
+SERVICE_ID = "svc"
+
+RULES = [
+    {
+        "name": "premium",
+        "condition": {"user_tier": "premium", "user_region": "eu"},
+        "target": "P",
+        "weight": 100,
+    },
+    {"name": "big", "condition": {"model": ["llama-70b", "gpt-4"]}, "target": "G"},
+    {
+        "name": "size",
+        "condition": {"request_size": {"operator": "gt", "value": 1000}},
+        "target": "S",
+        "weight": 10,
+    },
+    {"name": "anon", "condition": {"user_id": None}, "target": "N"},
+    {"name": "default", "condition": {}, "target": "D", "weight": 50},
+]
+
+
+@pytest.fixture
+def custom_routing(load_strategy):
+    return load_strategy("custom_routing")
+
+
+@pytest.fixture
+def router(custom_routing):
+    return custom_routing.CustomRoutingStrategy()
+
+
+def _ab_test(variants, **extra):
+    return {
+        "name": "t",
+        "variants": [
+            {"name": name, "target": target, "traffic": traffic}
+            for name, target, traffic in variants
+        ],
+        **extra,
+    }
+
+
+def _linear_pick(variants, assignment_value):
+    """Variant selection as originally written: first cumulative bound above the value."""
+    cumulative = 0
+    for name, _target, traffic in variants:
+        cumulative += traffic
+        if assignment_value < cumulative:
+            return name
+    return None
+
+
+@pytest.mark.parametrize(
+    "context, expected_rule, expected_target",
+    [
+        ({"user_tier": "premium", "user_region": "eu", "user_id": "u"}, "premium", "P"),
+        (
+            {"user_tier": "premium", "user_region": "us", "user_id": "u", "request_size": 0},
+            "default",
+            "D",
+        ),
+        ({"model": "gpt-4", "user_id": "u"}, "big", "G"),
+        ({"request_size": 5000, "user_id": "u"}, "size", "S"),
+        # A missing key compares as None, so it matches a None condition
+        ({"user_tier": "free", "request_size": 0}, "anon", "N"),
+        ({"user_id": "u", "request_size": 0}, "default", "D"),
+    ],
+)
+def test_rule_matching_matches_original_results(router, context, expected_rule, expected_target):
+    router.register_routing_rules(SERVICE_ID, RULES)
+
+    result = router.route_request(SERVICE_ID, context)
+
+    assert result == {
+        "target_url": expected_target,
+        "routing_strategy": "rule_based",
+        "metadata": {
+            "rule_name": expected_rule,
+            "condition": next(r["condition"] for r in RULES if r["name"] == expected_rule),
+            "weight": next(r.get("weight", 100) for r in RULES if r["name"] == expected_rule),
+        },
+    }
+
+
+def test_compile_rule_precomputes_scalar_equality(router):
+    single = {"name": "one", "condition": {"model": "llama"}, "target": "A"}
+    multi = {"name": "two", "condition": {"user_tier": "premium", "region": "eu"}, "target": "B"}
+
+    compiled_single = router._compile_rule(single)
+    compiled_multi = router._compile_rule(multi)
+
+    assert compiled_single["_expected"] == "llama"
+    assert compiled_single["_getter"]({"model": "llama"}) == "llama"
+    assert compiled_multi["_expected"] == ("premium", "eu")
+    assert compiled_multi["_getter"]({"user_tier": "premium", "region": "eu"}) == ("premium", "eu")
+    # The caller's rule is left untouched
+    assert "_getter" not in single and "_getter" not in multi
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [{}, {"model": ["a", "b"]}, {"size": {"operator": "gt", "value": 1}}],
+    ids=["empty", "list", "complex"],
+)
+def test_compile_rule_leaves_other_conditions_alone(router, condition):
+    rule = {"name": "r", "condition": condition, "target": "A"}
+
+    assert router._compile_rule(rule) is rule
+
+
+@pytest.mark.parametrize(
+    "condition, value, expected",
+    [
+        ({"operator": "gt", "value": 5}, 6, True),
+        ({"operator": "gte", "value": 5}, 5, True),
+        ({"operator": "lt", "value": 5}, 5, False),
+        ({"operator": "lte", "value": 5}, 5, True),
+        ({"operator": "contains", "value": "23"}, 12345, True),
+        ({"operator": "contains", "value": "x"}, "abc", False),
+        ({"operator": "regex", "value": r"^llama-\d+b$"}, "llama-70b", True),
+        ({"operator": "regex", "value": "^gpt"}, "llama", False),
+        ({"range": [1, 10]}, 10, True),
+        ({"range": [1, 10]}, 11, False),
+        ({"operator": "eq", "value": 5}, 5, False),
+        ({}, 5, False),
+    ],
+)
+def test_operator_table_matches_original_results(router, condition, value, expected):
+    assert router._evaluate_complex_condition(condition, value) is expected
+
+
+@pytest.mark.parametrize("user_id", ["user123", "user456", "alice", "anonymous", ""])
+def test_hash_bucket_matches_md5_of_user_and_service(custom_routing, user_id):
+    expected = int(hashlib.md5(f"{user_id}_{SERVICE_ID}".encode()).hexdigest(), 16) % 100
+
+    assert custom_routing._hash_bucket(user_id, f"_{SERVICE_ID}".encode()) == expected
+
+
+@pytest.mark.parametrize(
+    "user_id, variant, assignment_value",
+    [
+        ("user123", "control", 20),
+        ("user456", "treatment", 89),
+        ("user789", "control", 51),
+        ("alice", "control", 13),
+        ("bob", "treatment", 88),
+        (42, "control", 28),
+    ],
+)
+def test_ab_assignment_matches_original_results(router, user_id, variant, assignment_value):
+    router.setup_ab_test(
+        "ollama",
+        _ab_test([("control", "http://v1", 80), ("treatment", "http://v2", 20)]),
+    )
+
+    result = router.route_request("ollama", {"user_id": user_id})
+
+    assert result["routing_strategy"] == "ab_test"
+    assert result["metadata"] == {
+        "test_name": "t",
+        "variant": variant,
+        "assignment_value": assignment_value,
+    }
+
+
+@pytest.mark.parametrize(
+    "variants",
+    [
+        [("a", "A", 80), ("b", "B", 20)],
+        [("a", "A", 30), ("b", "B", 30), ("c", "C", 30)],  # 90-99 match no variant
+        [("a", "A", 0), ("b", "B", 50), ("c", "C", 50)],  # empty variant is never picked
+    ],
+    ids=["80-20", "under-allocated", "zero-traffic"],
+)
+def test_bisect_variant_pick_matches_linear_scan(router, custom_routing, monkeypatch, variants):
+    router.setup_ab_test(SERVICE_ID, _ab_test(variants))
+
+    for assignment_value in range(100):
+        monkeypatch.setattr(
+            custom_routing, "_hash_bucket", lambda user_id, salt, value=assignment_value: value
+        )
+        result = router.route_request(SERVICE_ID, {"user_id": "u"})
+
+        expected = _linear_pick(variants, assignment_value)
+        if expected is None:
+            assert result["routing_strategy"] == "ab_test_fallback"
+        else:
+            assert result["metadata"]["variant"] == expected
+
+
+def test_inactive_ab_test_falls_through_to_rules(router):
+    router.register_routing_rules(SERVICE_ID, RULES)
+    router.setup_ab_test(SERVICE_ID, _ab_test([("a", "A", 100)], start_time=0, end_time=1))
+
+    result = router.route_request(SERVICE_ID, {"user_id": "u", "request_size": 0})
+
+    assert result["target_url"] == "D"
+
+
+def test_default_fallback_is_not_shared(router):
+    first = router.route_request(SERVICE_ID, {})
+    first["metadata"]["reason"] = "mutated"
+
+    assert router.route_request(SERVICE_ID, {})["metadata"]["reason"] == "No custom rules defined"
+
+
+def test_inactive_ab_test_decision_is_not_shared(router):
+    router.setup_ab_test(SERVICE_ID, _ab_test([("a", "A", 100)], start_time=0, end_time=1))
+    test_config = router._service_state[SERVICE_ID].ab_test
+
+    first = router._route_ab_test(test_config, {})
+    first["metadata"]["reason"] = "mutated"
+
+    second = router._route_ab_test(test_config, {})
+    assert second["metadata"]["reason"] == "A/B test not currently active"
+
+
+def test_registered_configuration_is_exposed_as_given(router):
+    test_config = _ab_test([("a", "A", 100)])
+    router.register_routing_rules(SERVICE_ID, RULES)
+    router.setup_ab_test("other", test_config)
+
+    assert router.routing_rules == {SERVICE_ID: RULES}
+    assert router.ab_test_configs == {"other": test_config}
+    assert "_getter" not in router.routing_rules[SERVICE_ID][0]
+
+
+def test_registered_configuration_views_are_read_only_and_live(router):
+    rules_view = router.routing_rules
+
+    with pytest.raises(TypeError):
+        rules_view[SERVICE_ID] = RULES
+    with pytest.raises(TypeError):
+        router.ab_test_configs["other"] = _ab_test([("a", "A", 100)])
+
+    router.register_routing_rules(SERVICE_ID, RULES)
+
+    assert router.routing_rules is rules_view
+    assert rules_view[SERVICE_ID] is RULES
@@ -0,0 +1,271 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+
+SERVICE_ID = "svc"
+HEALTH_URL = "http://svc.local/health"
+
+
+@pytest.fixture
+def health_checker(load_strategy):
+    return load_strategy("health_checker")
+
+
+@pytest.fixture
+def checker(health_checker):
+    hc = health_checker.HealthCheckerStrategy()
+    hc.register_service(SERVICE_ID, {"endpoints": [{"url": HEALTH_URL, "type": "http"}]})
+    return hc
+
+
+@pytest.fixture
+def upstream():
+    with respx.mock(assert_all_called=False) as mock:
+        yield mock
+
+
+def _open_breaker(hc, cooled_down: bool = True) -> None:
+    """Put the service's breaker in the open state, optionally past its cooldown."""
+    cb = hc.circuit_breakers[SERVICE_ID]
+    cb["state"] = "open"
+    cb["failure_count"] = hc.failure_threshold
+    elapsed = hc.circuit_breaker_cooldown + 1 if cooled_down else 0
+    cb["last_failure_time"] = time.time() - elapsed
+    hc._breaker_opened_at[SERVICE_ID] = time.monotonic() - elapsed
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_probes_during_cooldown(checker, upstream):
+    route = upstream.get(HEALTH_URL).respond(200)
+    _open_breaker(checker, cooled_down=False)
+
+    result = await checker.check_service_health(SERVICE_ID)
+
+    assert result["status"] == "unhealthy"
+    assert result["endpoints"] == []
+    assert not route.called
+
+
+@pytest.mark.asyncio
+async def test_healthy_half_open_probe_closes_breaker(checker, upstream):
+    """open -> half_open -> closed when the trial probe is healthy."""
+    route = upstream.get(HEALTH_URL).respond(200)
+    _open_breaker(checker)
+
+    result = await checker.check_service_health(SERVICE_ID)
+
+    assert route.call_count == 1
+    assert result["status"] == "healthy"
+    assert checker.circuit_breakers[SERVICE_ID]["state"] == "closed"
+    assert checker.circuit_breakers[SERVICE_ID]["failure_count"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [503, 204], ids=["unhealthy", "degraded"])
+async def test_non_healthy_half_open_probe_reopens_breaker(checker, upstream, status_code):
+    """open -> half_open -> open, with a fresh cooldown, unless the probe is healthy."""
+    upstream.get(HEALTH_URL).respond(status_code)
+    _open_breaker(checker)
+    before = time.monotonic()
+
+    await checker.check_service_health(SERVICE_ID)
+
+    assert checker.circuit_breakers[SERVICE_ID]["state"] == "open"
+    assert checker._breaker_opened_at[SERVICE_ID] >= before
+
+
+@pytest.mark.asyncio
+async def test_breaker_cooldown_ignores_wall_clock_jumps(
+    checker, upstream, health_checker, monkeypatch
+):
+    route = upstream.get(HEALTH_URL).respond(200)
+    _open_breaker(checker, cooled_down=False)
+
+    # Jump the wall clock a day ahead; the cooldown runs on the monotonic clock
+    day_ahead = SimpleNamespace(time=lambda: time.time() + 86400, monotonic=time.monotonic)
+    monkeypatch.setattr(health_checker, "time", day_ahead)
+    await checker.check_service_health(SERVICE_ID)
+
+    assert not route.called
+    assert checker.circuit_breakers[SERVICE_ID]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_result_is_cached_until_check_interval_expires(checker, upstream):
+    route = upstream.get(HEALTH_URL).respond(200)
+
+    first = await checker.check_service_health(SERVICE_ID)
+    assert await checker.check_service_health(SERVICE_ID) == first
+    assert route.call_count == 1
+
+    # Age the cached entry past the check interval
+    checked_at, result = checker._cached_result[SERVICE_ID]
+    checker._cached_result[SERVICE_ID] = (checked_at - checker.check_interval, result)
+
+    await checker.check_service_health(SERVICE_ID)
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_share_one_probe(checker, upstream):
+    route = upstream.get(HEALTH_URL).respond(200)
+
+    results = await asyncio.gather(*(checker.check_service_health(SERVICE_ID) for _ in range(5)))
+
+    assert route.call_count == 1
+    assert {result["status"] for result in results} == {"healthy"}
+
+
+@pytest.mark.asyncio
+async def test_mutating_a_result_does_not_corrupt_the_cache(checker, upstream):
+    upstream.get(HEALTH_URL).respond(200)
+
+    result = await checker.check_service_health(SERVICE_ID)
+    result["status"] = "unhealthy"
+    result["endpoints"][0]["status"] = "unhealthy"
+    result["circuit_breaker"]["state"] = "open"
+    result["endpoints"].clear()
+
+    cached = await checker.check_service_health(SERVICE_ID)
+    assert cached["status"] == "healthy"
+    assert len(cached["endpoints"]) == 1
+    assert cached["endpoints"][0]["status"] == "healthy"
+    assert cached["circuit_breaker"]["state"] == "closed"
+    assert checker.get_health_summary(SERVICE_ID)["current_status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_success_rate_covers_the_last_ten_checks(checker, upstream):
+    checker.check_interval = 0  # probe on every call
+    upstream.get(HEALTH_URL).mock(side_effect=[httpx.Response(503)] * 2 + [httpx.Response(200)] * 9)
+
+    for _ in range(11):
+        await checker.check_service_health(SERVICE_ID)
+
+    # The first failure has left the 10-check window; one failure remains
+    summary = checker.get_health_summary(SERVICE_ID)
+    assert summary["total_checks"] == 11
+    assert summary["recent_success_rate"] == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_probe_uses_the_current_timeout(checker, upstream):
+    route = upstream.get(HEALTH_URL).respond(200)
+    checker.check_interval = 0
+    await checker.check_service_health(SERVICE_ID)
+
+    # Changing the setting applies to the already-created shared client
+    checker.timeout_seconds = 1
+    await checker.check_service_health(SERVICE_ID)
+
+    assert route.calls.last.request.extensions["timeout"]["read"] == 1
+    await checker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_changing_max_concurrent_checks_resizes_the_probe_limit(checker, upstream):
+    upstream.get(HEALTH_URL).respond(200)
+    checker.check_interval = 0  # probe on every call
+    await checker.check_service_health(SERVICE_ID)
+    semaphore = checker._check_semaphore
+
+    checker.max_concurrent_checks = 2
+    await checker.check_service_health(SERVICE_ID)
+
+    assert checker._check_semaphore is not semaphore
+    assert checker._check_semaphore._value == 2
+    assert checker.get_strategy_info()["configuration"]["max_concurrent_checks"] == 2
+    await checker.aclose()
+
+
+@pytest.mark.asyncio
+async def test_probe_limit_change_waits_for_rounds_in_flight(checker, upstream):
+    probing, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_probe(request):
+        probing.set()
+        await release.wait()
+        return httpx.Response(200)
+
+    upstream.get(HEALTH_URL).mock(side_effect=slow_probe)
+    check = asyncio.create_task(checker.check_service_health(SERVICE_ID))
+    await probing.wait()
+    semaphore = checker._check_semaphore
+
+    # A round is holding the semaphore, so the new limit is not applied yet
+    checker.max_concurrent_checks = 1
+    assert checker._probe_semaphore() is semaphore
+
+    release.set()
+    await check
+    assert checker._probe_semaphore()._value == 1
+    await checker.aclose()
+
+
+def test_strategy_info_is_cached_and_copied(checker):
+    info = checker.get_strategy_info()
+    cached = checker._strategy_info
+
+    info["configuration"]["failure_threshold"] = 99
+    info["features"].clear()
+
+    fresh = checker.get_strategy_info()
+    assert checker._strategy_info is cached
+    assert "circuit_breaker_pattern" in fresh["features"]
+    assert fresh["configuration"]["failure_threshold"] == checker.failure_threshold
+
+
+def test_health_status_values_are_strings(health_checker):
+    status = health_checker.HealthStatus
+
+    assert [s.value for s in status] == ["healthy", "degraded", "unhealthy", "unknown"]
+    assert all(bool(s) for s in status)
+    assert status("healthy") is status.HEALTHY
+
+
+@pytest.mark.asyncio
+async def test_health_summary_format_is_unchanged(checker, upstream):
+    upstream.get(HEALTH_URL).respond(200)
+    await checker.check_service_health(SERVICE_ID)
+
+    summary = checker.get_health_summary(SERVICE_ID)
+
+    assert set(summary) == {
+        "service_id",
+        "total_checks",
+        "recent_success_rate",
+        "current_status",
+        "last_check",
+        "circuit_breaker",
+    }
+    assert summary["service_id"] == SERVICE_ID
+    assert summary["total_checks"] == 1
+    assert summary["recent_success_rate"] == 1.0
+    assert summary["current_status"] == "healthy"
+    assert isinstance(summary["last_check"], float)
+    assert summary["circuit_breaker"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_validation_details_are_reported_in_full(health_checker, upstream):
+    hc = health_checker.HealthCheckerStrategy()
+    hc.register_service(
+        SERVICE_ID,
+        {
+            "endpoints": [{"url": HEALTH_URL, "type": "http"}],
+            "validation": {"response_time_ms": -1},  # every probe is over the threshold
+        },
+    )
+    upstream.get(HEALTH_URL).respond(200)
+
+    result = await hc.check_service_health(SERVICE_ID)
+
+    assert result["status"] == "degraded"
+    assert result["endpoints"][0]["status"] == "healthy"
+    assert result["validation"]["status"] == "degraded"
+    assert result["validation"]["over_threshold"] == [0]
+    assert "exceeds threshold" in result["validation"]["message"]
@@ -0,0 +1,179 @@
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+SERVICE_ID = "ollama"
+
+
+@pytest.fixture
+def load_balancer(load_strategy):
+    return load_strategy("load_balancer")
+
+
+@pytest.fixture
+def instances():
+    return [
+        {"url": "http://a:11434", "weight": 1, "region": "us-east"},
+        {"url": "http://b:11434", "weight": 2, "region": "us-west"},
+        {"url": "http://c:11434", "weight": 1, "region": "us-east"},
+    ]
+
+
+@pytest.fixture
+def lb(load_balancer, instances):
+    balancer = load_balancer.LoadBalancerStrategy()
+    balancer.register_service_instances(SERVICE_ID, instances)
+    return balancer
+
+
+def test_in_place_edits_to_instances_rebuild_the_table(lb, instances):
+    instances.append({"url": "http://d:11434", "weight": 1, "region": "eu-west"})
+    lb.register_service_instances(SERVICE_ID, instances)
+    assert lb.service_instances[SERVICE_ID][-1]["url"] == "http://d:11434"
+
+    instances[0]["weight"] = 5
+    lb.register_service_instances(SERVICE_ID, instances)
+    assert lb._tables[SERVICE_ID].weights[0] == 5
+
+
+def test_reregistration_preserves_health_of_known_instances(lb, instances):
+    lb.mark_instance_unhealthy(SERVICE_ID, "http://b:11434", RuntimeError("down"))
+
+    lb.register_service_instances(SERVICE_ID, instances + [{"url": "http://d:11434"}])
+
+    assert lb.health_status[SERVICE_ID] == {
+        "http://a:11434": True,
+        "http://b:11434": False,
+        "http://c:11434": True,
+        "http://d:11434": True,
+    }
+
+
+def test_round_robin_skips_unhealthy_instances(lb):
+    lb.mark_instance_unhealthy(SERVICE_ID, "http://b:11434", RuntimeError("down"))
+
+    picks = [lb.get_next_instance(SERVICE_ID) for _ in range(4)]
+
+    assert picks == ["http://a:11434", "http://c:11434"] * 2
+
+
+def test_regional_preference_uses_healthy_regional_subset(lb):
+    lb.mark_instance_unhealthy(SERVICE_ID, "http://a:11434", RuntimeError("down"))
+
+    picks = {lb.get_next_instance(SERVICE_ID, {"user_region": "us-east"}) for _ in range(3)}
+
+    assert picks == {"http://c:11434"}
+
+
+def test_marking_healthy_returns_instance_to_rotation(lb):
+    lb.mark_instance_unhealthy(SERVICE_ID, "http://b:11434", RuntimeError("down"))
+    lb.mark_instance_healthy(SERVICE_ID, "http://b:11434")
+
+    picks = {lb.get_next_instance(SERVICE_ID) for _ in range(3)}
+
+    assert picks == {"http://a:11434", "http://b:11434", "http://c:11434"}
+
+
+def test_all_unhealthy_falls_back_to_first_instance(lb, instances):
+    for instance in instances:
+        lb.mark_instance_unhealthy(SERVICE_ID, instance["url"], RuntimeError("down"))
+
+    assert lb.get_next_instance(SERVICE_ID) == "http://a:11434"
+
+
+def test_compat_views_match_registered_state(lb, instances):
+    assert lb.service_instances == {SERVICE_ID: instances}
+    assert lb.last_health_check == {SERVICE_ID: {instance["url"]: 0.0 for instance in instances}}
+
+
+def test_compat_views_are_read_only_and_live(lb):
+    health_status = lb.health_status
+
+    with pytest.raises(TypeError):
+        health_status[SERVICE_ID] = {}
+    with pytest.raises(TypeError):
+        health_status[SERVICE_ID]["http://b:11434"] = False
+    with pytest.raises(TypeError):
+        lb.service_instances["other"] = []
+
+    lb.mark_instance_unhealthy(SERVICE_ID, "http://b:11434", RuntimeError("down"))
+    lb.register_service_instances("other", [{"url": "http://e:11434"}])
+
+    assert lb.health_status is health_status
+    assert health_status[SERVICE_ID]["http://b:11434"] is False
+    assert dict(health_status["other"]) == {"http://e:11434": True}
+
+
+def test_route_request_reads_algorithm_from_routing_config(
+    lb, load_balancer, instances, monkeypatch
+):
+    monkeypatch.setattr(load_balancer, "random", random.Random(1234))
+    config = SimpleNamespace(instances=instances, routing={"algorithm": "weighted_random"})
+
+    picks = Counter(lb.route_request(SERVICE_ID, {}, config) for _ in range(4000))
+
+    # Weights are 1:2:1, so b should get about half of the traffic
+    assert set(picks) == {"http://a:11434", "http://b:11434", "http://c:11434"}
+    assert picks["http://b:11434"] / 4000 == pytest.approx(0.5, abs=0.03)
+    assert picks["http://a:11434"] / 4000 == pytest.approx(0.25, abs=0.03)
+    assert picks["http://c:11434"] / 4000 == pytest.approx(0.25, abs=0.03)
+
+
+def test_route_request_defaults_to_round_robin(lb, instances):
+    config = SimpleNamespace(instances=instances, routing={})
+
+    picks = [lb.route_request(SERVICE_ID, {}, config) for _ in range(3)]
+
+    assert picks == ["http://a:11434", "http://b:11434", "http://c:11434"]
+
+
+def test_unknown_algorithm_is_rejected(lb, instances):
+    with pytest.raises(ValueError):
+        lb.register_service_instances(SERVICE_ID, instances, algorithm="fastest")
+
+
+def test_strategy_info_is_copied_and_tracks_algorithm(load_balancer):
+    balancer = load_balancer.LoadBalancerStrategy("weighted_random")
+    info = balancer.get_strategy_info()
+    assert info["configuration"]["selection_algorithm"] == "weighted_random"
+
+    info["configuration"]["selection_algorithm"] = "round_robin"
+
+    assert balancer.get_strategy_info()["configuration"]["selection_algorithm"] == (
+        "weighted_random"
+    )
+    balancer.algorithm = "round_robin"
+    assert balancer.get_strategy_info()["configuration"]["selection_algorithm"] == "round_robin"
+
+
+def test_round_robin_accepts_instances_without_numeric_weights(load_balancer):
+    balancer = load_balancer.LoadBalancerStrategy()
+    balancer.register_service_instances(
+        SERVICE_ID, [{"url": "http://a:11434", "weight": None}, {"url": "http://b:11434"}]
+    )
+
+    picks = [balancer.get_next_instance(SERVICE_ID) for _ in range(2)]
+
+    assert picks == ["http://a:11434", "http://b:11434"]
+
+
+def test_reregistering_without_algorithm_drops_the_override(lb, instances):
+    lb.register_service_instances(SERVICE_ID, instances, algorithm="weighted_random")
+    lb.register_service_instances(SERVICE_ID, instances)
+
+    picks = [lb.get_next_instance(SERVICE_ID) for _ in range(3)]
+
+    assert picks == ["http://a:11434", "http://b:11434", "http://c:11434"]
+
+
+def test_unregistering_a_service_forgets_its_state(lb, instances):
+    lb.register_service_instances(SERVICE_ID, instances, algorithm="weighted_random")
+
+    lb.unregister_service(SERVICE_ID)
+
+    assert SERVICE_ID not in lb.service_instances
+    assert lb.get_next_instance(SERVICE_ID) is None
+    assert SERVICE_ID not in lb._algorithms
+    assert SERVICE_ID not in lb.current_index
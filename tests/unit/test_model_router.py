@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def model_router(load_strategy):
+    return load_strategy("model_router")
+
+
+class FakeLoadBalancer:
+    def __init__(self):
+        self.registered = []
+
+    def register_service_instances(self, service_id, instances):
+        self.registered.append((service_id, instances))
+
+    def get_next_instance(self, service_id, request_context):
+        return "http://lb.local"
+
+
+def _config(by_model=None, model_key=None, instances=None):
+    routing = {"by_model": by_model or {}}
+    if model_key:
+        routing["model_key"] = model_key
+    return SimpleNamespace(routing=routing, instances=instances or [])
+
+
+def test_routes_mapped_model(model_router):
+    router = model_router.ModelRouterStrategy()
+    config = _config(by_model={"llama3": "http://a.local"})
+
+    assert router.route_request("svc", {"model": "llama3"}, config) == "http://a.local"
+
+
+def test_routes_by_custom_model_key(model_router):
+    router = model_router.ModelRouterStrategy()
+    config = _config(by_model={"mistral": "http://b.local"}, model_key="engine")
+
+    assert router.route_request("svc", {"engine": "mistral"}, config) == "http://b.local"
+
+
+def test_unmapped_model_delegates_to_load_balancer(model_router):
+    lb = FakeLoadBalancer()
+    router = model_router.ModelRouterStrategy(load_balancer_factory=lambda: lb)
+    instances = [{"url": "http://a.local"}]
+    config = _config(by_model={"llama3": "http://a.local"}, instances=instances)
+
+    assert router.route_request("svc", {"model": "other"}, config) == "http://lb.local"
+    assert lb.registered == [("svc", instances)]
+
+
+def test_unmapped_model_without_instances_returns_none(model_router):
+    router = model_router.ModelRouterStrategy(load_balancer_factory=FakeLoadBalancer)
+
+    assert router.route_request("svc", {"model": "other"}, _config()) is None
+
+
+def test_routing_tables_are_not_copied(model_router):
+    """Routing is read straight from the config, so edits apply on the next call."""
+    router = model_router.ModelRouterStrategy()
+    config = _config(by_model={"llama3": "http://a.local"})
+    router.route_request("svc", {"model": "llama3"}, config)
+
+    config.routing["by_model"]["llama3"] = "http://moved.local"
+
+    assert router.route_request("svc", {"model": "llama3"}, config) == "http://moved.local"
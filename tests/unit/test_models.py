@@ -1,20 +1,6 @@
-import pytest
 from datetime import datetime, UTC
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from hestia.models import Base, Service, Machine, RoutingRule, Activity, AuthKey
-
-
-@pytest.fixture
-def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
+from hestia.models import Service, Machine, RoutingRule, Activity, AuthKey
 
 
 def test_service_model_creation(db_session):
@@ -0,0 +1,106 @@
+import pytest
+
+from hestia import app as gateway
+from hestia.config import ServiceConfig, register_service, unregister_service
+from hestia.semaphore_client import SemaphoreClient, SemaphoreTaskResponse
+
+SERVICE_ID = "semaphore-unit-test"
+
+
+@pytest.fixture
+def semaphore_service(monkeypatch, fake_semaphore):
+    """Semaphore-orchestrated service on a fresh gateway state."""
+    monkeypatch.setattr(gateway, "_state", gateway.AppState())
+    service_config = ServiceConfig(
+        base_url="http://target.local",
+        semaphore_enabled=True,
+        semaphore_machine_id="server-01",
+        idle_timeout_ms=50,
+    )
+    register_service(SERVICE_ID, service_config)
+    yield service_config
+    unregister_service(SERVICE_ID)
+
+
+def _state(service_id: str = SERVICE_ID):
+    return gateway.get_state().services.get(service_id, {}).get("state")
+
+
+@pytest.mark.asyncio
+async def test_semaphore_start_marks_service_hot(semaphore_service, fake_semaphore):
+    """A successful Semaphore start task leaves the service hot and ready."""
+    await gateway._start_service_with_semaphore(SERVICE_ID, semaphore_service)
+
+    assert _state() == "hot"
+    assert fake_semaphore.calls == [
+        ("start_service", SERVICE_ID),
+        ("get_task_status", "start-task"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_semaphore_start_rejected_falls_back_to_traditional(
+    semaphore_service, fake_semaphore
+):
+    """If Semaphore rejects the start task the service is started without it."""
+    fake_semaphore.start_task = None
+
+    await gateway._start_service_with_semaphore(SERVICE_ID, semaphore_service)
+
+    assert _state() == "hot"
+    assert fake_semaphore.calls == [("start_service", SERVICE_ID)]
+
+
+@pytest.mark.asyncio
+async def test_semaphore_start_task_failure_leaves_service_cold(semaphore_service, fake_semaphore):
+    """A start task that finishes in error does not mark the service ready."""
+    fake_semaphore.final_status = "error"
+
+    await gateway._start_service_with_semaphore(SERVICE_ID, semaphore_service)
+
+    assert _state() != "hot"
+
+
+@pytest.mark.parametrize(
+    "idle_ms,expected_state", [(60, "cold"), (10, "hot")], ids=["expired", "within-timeout"]
+)
+def test_idle_reaper_flips_expired_service_cold(semaphore_service, idle_ms, expected_state):
+    """The reaper only flips services idle for at least their timeout."""
+    gateway._mark_service_hot(SERVICE_ID)
+    gateway.get_state().services[SERVICE_ID]["last_used_ms"] -= idle_ms
+
+    next_expiry_ms = gateway._reap_idle_services()
+
+    assert _state() == expected_state
+    if expected_state == "hot":
+        assert 0 < next_expiry_ms <= 50 - idle_ms
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stop_task", ["stop-task", None], ids=["accepted", "rejected"])
+async def test_semaphore_shutdown_requests_stop_task(semaphore_service, fake_semaphore, stop_task):
+    """Shutdown asks Semaphore to stop the service and tolerates a rejected task."""
+    fake_semaphore.stop_task = stop_task
+
+    await gateway._shutdown_service_with_semaphore(SERVICE_ID, semaphore_service)
+
+    assert fake_semaphore.calls == [("stop_service", SERVICE_ID)]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_completion_polls_until_done(monkeypatch):
+    """Task polling stops at the first terminal status."""
+    client = SemaphoreClient("http://semaphore:3000")
+    statuses = iter(["running", "running", "success"])
+    polled = []
+
+    async def get_task_status(task_id):
+        polled.append(task_id)
+        return SemaphoreTaskResponse(task_id=task_id, status=next(statuses))
+
+    monkeypatch.setattr(client, "get_task_status", get_task_status)
+
+    result = await client.wait_for_task_completion("task-polling", poll_interval=0)
+
+    assert result.status == "success"
+    assert polled == ["task-polling"] * 3
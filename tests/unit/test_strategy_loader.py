@@ -1,6 +1,14 @@
+import os
+import sys
+
 import pytest
 
-from hestia.strategy_loader import StrategyRegistry, load_strategies
+from hestia.strategy_loader import (
+    StrategyRegistry,
+    _plugin_package_name,
+    get_registry,
+    load_strategies,
+)
 
 
 def test_strategy_registry_singleton():
@@ -10,6 +18,12 @@ def test_strategy_registry_singleton():
     assert reg1 is reg2
 
 
+def test_get_registry_returns_singleton():
+    """Test that get_registry returns the same instance as StrategyRegistry()."""
+    assert get_registry() is StrategyRegistry()
+    assert get_registry() is get_registry()
+
+
 def test_register_strategy():
     """Test registering a strategy."""
     registry = StrategyRegistry()
@@ -126,3 +140,200 @@ def test_load_strategies_nonexistent_directory():
 
     # No strategies should be loaded
     assert len(registry.list_strategies()) == 0
+
+
+def test_load_strategies_path_is_file(tmp_path):
+    """Test loading from a path that is a file rather than a directory."""
+    not_a_dir = tmp_path / "strategies.py"
+    not_a_dir.write_text("")
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    # Should not raise an exception
+    load_strategies(str(not_a_dir))
+
+    assert len(registry.list_strategies()) == 0
+
+
+def test_load_strategies_reuses_unchanged_modules(tmp_path):
+    """Test that reloading skips re-executing modules whose files are unchanged."""
+    strategies_dir = tmp_path / "strategies"
+    strategies_dir.mkdir()
+    exec_log = tmp_path / "exec.log"
+
+    strategy_file = strategies_dir / "cached_strategy.py"
+    strategy_file.write_text(f"""
+with open({str(exec_log)!r}, "a") as f:
+    f.write("x")
+
+def register_strategy(registry):
+    registry.register("cached", lambda: "cached")
+""")
+
+    registry = StrategyRegistry()
+
+    registry.clear()
+    load_strategies(str(strategies_dir))
+    registry.clear()
+    load_strategies(str(strategies_dir))
+
+    # Module body ran once, but the strategy was re-registered after clear()
+    assert exec_log.read_text() == "x"
+    assert "cached" in registry.list_strategies()
+
+    # Touching the file forces a fresh load
+    stat = strategy_file.stat()
+    os.utime(strategy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    registry.clear()
+    load_strategies(str(strategies_dir))
+
+    assert exec_log.read_text() == "xx"
+
+
+def _plugin_modules(strategies_dir):
+    """Return the plugin package name for a directory and the modules loaded under it."""
+    package = _plugin_package_name(str(strategies_dir))
+    return package, {n for n in sys.modules if n == package or n.startswith(f"{package}.")}
+
+
+@pytest.fixture
+def forget_plugins():
+    """Collect plugin directories; drop their modules from sys.modules at teardown."""
+    dirs = []
+    yield dirs.append
+    for strategies_dir in dirs:
+        for name in _plugin_modules(strategies_dir)[1]:
+            del sys.modules[name]
+
+
+def test_load_strategies_leaves_sys_path_untouched(tmp_path, forget_plugins):
+    """Test that plugins are loaded without mutating sys.path."""
+    strategies_dir = tmp_path / "strategies"
+    strategies_dir.mkdir()
+    forget_plugins(strategies_dir)
+    (strategies_dir / "path_strategy.py").write_text("""
+def register_strategy(registry):
+    registry.register("path_strategy", lambda: "path")
+""")
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    path_before = list(sys.path)
+    load_strategies(str(strategies_dir))
+
+    assert sys.path == path_before
+    assert "path_strategy" in registry.list_strategies()
+    package, modules = _plugin_modules(strategies_dir)
+    assert f"{package}.path_strategy" in modules
+
+
+def test_load_strategies_supports_relative_imports(tmp_path, forget_plugins):
+    """Test that a plugin can import a sibling module relatively."""
+    strategies_dir = tmp_path / "relative_plugins"
+    strategies_dir.mkdir()
+    forget_plugins(strategies_dir)
+    (strategies_dir / "helper.py").write_text("VALUE = 'from helper'\n")
+    (strategies_dir / "uses_helper.py").write_text("""
+from .helper import VALUE
+
+def register_strategy(registry):
+    registry.register("uses_helper", lambda: VALUE)
+""")
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    load_strategies(str(strategies_dir))
+
+    assert registry.get_strategy("uses_helper")() == "from helper"
+
+
+def test_load_strategies_waits_for_slow_sibling_imports(tmp_path, forget_plugins, capsys):
+    """Test that a plugin importing a sibling sees it fully executed despite parallel loading."""
+    strategies_dir = tmp_path / "slow_plugins"
+    strategies_dir.mkdir()
+    forget_plugins(strategies_dir)
+    (strategies_dir / "helper.py").write_text("""
+import time
+
+time.sleep(0.2)
+X = "ready"
+""")
+    (strategies_dir / "alpha.py").write_text("""
+from .helper import X
+
+def register_strategy(registry):
+    registry.register("alpha", lambda: X)
+""")
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    load_strategies(str(strategies_dir))
+
+    assert "Warning" not in capsys.readouterr().out
+    assert registry.get_strategy("alpha")() == "ready"
+    assert sys.modules[f"{_plugin_package_name(str(strategies_dir))}.alpha"].X == "ready"
+
+
+def test_load_strategies_never_shadows_existing_modules(tmp_path, forget_plugins):
+    """Test that a plugin directory named like a stdlib module leaves that module alone."""
+    import logging
+
+    strategies_dir = tmp_path / "logging"
+    strategies_dir.mkdir()
+    forget_plugins(strategies_dir)
+    (strategies_dir / "shadow.py").write_text("""
+def register_strategy(registry):
+    registry.register("shadow", lambda: "shadow")
+""")
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    load_strategies(str(strategies_dir))
+
+    assert sys.modules["logging"] is logging
+    assert "shadow" in registry.list_strategies()
+
+
+def test_load_strategies_keeps_modules_it_did_not_create(tmp_path, monkeypatch, capsys):
+    """Test that an unrelated module holding the plugin package name is not replaced."""
+    strategies_dir = tmp_path / "taken"
+    strategies_dir.mkdir()
+    (strategies_dir / "taken_strategy.py").write_text("""
+def register_strategy(registry):
+    registry.register("taken", lambda: "taken")
+""")
+    package = _plugin_package_name(str(strategies_dir))
+    monkeypatch.setitem(sys.modules, package, os)
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    load_strategies(str(strategies_dir))
+
+    assert sys.modules[package] is os
+    assert "already in use" in capsys.readouterr().out
+    assert "taken" not in registry.list_strategies()
+
+
+def test_load_strategies_accepts_trailing_separator(tmp_path, forget_plugins, capsys):
+    """Test that a directory path ending in a separator loads like the bare path."""
+    strategies_dir = tmp_path / "plugins"
+    strategies_dir.mkdir()
+    forget_plugins(strategies_dir)
+    (strategies_dir / "slash_strategy.py").write_text("""
+def register_strategy(registry):
+    registry.register("slash", lambda: "slash")
+""")
+
+    registry = StrategyRegistry()
+    registry.clear()
+
+    load_strategies(str(strategies_dir) + os.sep)
+
+    assert "Warning" not in capsys.readouterr().out
+    assert "slash" in registry.list_strategies()
@@ -0,0 +1,162 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+SERVICE_ID = "svc"
+REQUEST = {"method": "GET", "path": "/api/test"}
+RESPONSE = {"status": 200}
+
+
+@pytest.fixture
+def template(load_strategy):
+    return load_strategy("template")
+
+
+@pytest.fixture
+def strategy(template):
+    return template.TemplateStrategy({"example_setting": "value"})
+
+
+class _NoGetDict(dict):
+    """Request/response data that fails the test if it is read."""
+
+    def get(self, *args):
+        raise AssertionError("data read while debug logging is off")
+
+
+def test_results_are_independent_copies(strategy):
+    first = strategy.process_request(SERVICE_ID, REQUEST)
+    first["modifications"]["headers"]["X-Injected"] = "1"
+    first["metadata"]["strategy"] = "mutated"
+    response = strategy.handle_response(SERVICE_ID, RESPONSE)
+    response["modifications"]["headers"].clear()
+
+    second = strategy.process_request(SERVICE_ID, REQUEST)
+    assert second["modifications"]["headers"] == {
+        "X-Strategy-Processed": "template_strategy",
+        "X-Strategy-Version": "1.0.0",
+    }
+    assert second["metadata"]["strategy"] == "template_strategy"
+    assert strategy.handle_response(SERVICE_ID, RESPONSE)["modifications"]["headers"] == {
+        "X-Strategy-Response-Processed": "template_strategy"
+    }
+
+
+def test_processing_time_is_measured(strategy, template, monkeypatch):
+    clock = iter([10.0, 10.0025])
+    monkeypatch.setattr(template, "time", SimpleNamespace(perf_counter=lambda: next(clock)))
+
+    result = strategy.process_request(SERVICE_ID, REQUEST)
+
+    assert result["metadata"]["processing_time_ms"] == pytest.approx(2.5)
+    assert strategy.get_metrics()["average_processing_time_ms"] == pytest.approx(2.5)
+
+
+def test_metrics_count_calls(strategy):
+    strategy.process_request(SERVICE_ID, REQUEST)
+    strategy.process_request(SERVICE_ID, REQUEST)
+    strategy.handle_response(SERVICE_ID, RESPONSE)
+    error_result = strategy.handle_error(SERVICE_ID, ValueError("boom"), {})
+
+    metrics = strategy.get_metrics()
+    assert metrics["requests_processed"] == 2
+    assert metrics["responses_processed"] == 1
+    assert metrics["errors_handled"] == 1
+    assert error_result["metadata"] == {"strategy": "template_strategy", "error_type": "ValueError"}
+
+
+def test_activity_is_logged_not_printed(strategy, template, caplog, capsys):
+    caplog.set_level(logging.DEBUG, logger=template.logger.name)
+
+    strategy.process_request(SERVICE_ID, REQUEST)
+    strategy.handle_response(SERVICE_ID, RESPONSE)
+    strategy.handle_error(SERVICE_ID, ValueError("boom"), {})
+
+    assert capsys.readouterr().out == ""
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Processing request for svc: GET /api/test" in messages
+    assert "Processing response from svc: 200" in messages
+    assert "Handling error for svc: boom" in messages
+
+
+def test_log_fields_are_not_read_when_debug_is_off(strategy, template, caplog):
+    caplog.set_level(logging.INFO, logger=template.logger.name)
+
+    strategy.process_request(SERVICE_ID, _NoGetDict(REQUEST))
+    strategy.handle_response(SERVICE_ID, _NoGetDict(RESPONSE))
+
+    assert caplog.records == []
+
+
+def test_strategy_info_is_cached_until_metadata_changes(strategy):
+    info = strategy.get_strategy_info()
+    assert strategy._build_strategy_info() == info
+    cached = strategy._strategy_info
+
+    strategy.get_strategy_info()
+    assert strategy._strategy_info is cached
+
+    strategy.version = "2.0.0"
+
+    updated = strategy.get_strategy_info()
+    assert strategy._strategy_info is not cached
+    assert updated["version"] == "2.0.0"
+
+
+def test_strategy_info_copies_do_not_share_state(strategy):
+    info = strategy.get_strategy_info()
+
+    info["name"] = "mutated"
+    info["features"].append("mutated")
+    info["configuration_schema"]["example_setting"]["required"] = False
+
+    fresh = strategy.get_strategy_info()
+    assert fresh["name"] == "template_strategy"
+    assert "mutated" not in fresh["features"]
+    assert fresh["configuration_schema"]["example_setting"]["required"] is True
+    assert isinstance(fresh["supported_events"], list)
+
+
+def test_noop_configuration_update_keeps_state(strategy):
+    strategy.example_state["warm"] = True
+    process_result = strategy._process_result
+
+    assert strategy.update_configuration({"example_setting": "value"}) is True
+
+    assert strategy.example_state == {"warm": True}
+    assert strategy._process_result is process_result
+
+
+def test_unrelated_configuration_update_does_not_reinitialize(strategy):
+    strategy.example_state["warm"] = True
+    process_result = strategy._process_result
+
+    assert strategy.update_configuration({"other_setting": 1}) is True
+
+    assert strategy.config == {"example_setting": "value", "other_setting": 1}
+    assert strategy.example_state == {"warm": True}
+    assert strategy._process_result is process_result
+
+
+def test_changed_setting_reinitializes(strategy):
+    strategy.example_state["warm"] = True
+    process_result = strategy._process_result
+
+    assert strategy.update_configuration({"example_setting": "new"}) is True
+
+    assert strategy.config["example_setting"] == "new"
+    assert strategy.example_state == {}
+    assert strategy._process_result is not process_result
+
+
+def test_factory_gives_each_instance_its_own_config(template):
+    factories = {}
+    template.register_strategy(SimpleNamespace(register=factories.__setitem__))
+    create = factories["template_strategy"]
+
+    first, second = create(), create()
+    first.update_configuration({"example_setting": "changed"})
+
+    assert second.config == {"example_setting": "example_value"}
+    assert create().config == {"example_setting": "example_value"}
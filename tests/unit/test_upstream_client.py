@@ -0,0 +1,51 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from hestia import app as gateway
+
+
+def test_upstream_client_is_shared(monkeypatch):
+    """Proxied requests reuse one upstream client until it is closed."""
+    monkeypatch.setattr(gateway, "_UPSTREAM_CLIENT", None)
+
+    try:
+        assert gateway._upstream_client() is gateway._upstream_client()
+    finally:
+        asyncio.run(gateway.close_upstream_client())
+
+
+def test_app_shutdown_closes_upstream_client(monkeypatch):
+    """Shutting the app down closes the shared client; the next use gets a new one."""
+    monkeypatch.setattr(gateway, "_UPSTREAM_CLIENT", None)
+    # Startup captures its event loop; don't leave the closed loop behind
+    monkeypatch.setattr(gateway, "_MAIN_LOOP", None)
+
+    with TestClient(gateway.app):
+        client = gateway._upstream_client()
+        assert not client.is_closed
+
+    assert client.is_closed
+    assert gateway._UPSTREAM_CLIENT is None
+    try:
+        assert gateway._upstream_client() is not client
+    finally:
+        asyncio.run(gateway.close_upstream_client())
+
+
+def test_app_shutdown_closes_strategy_instances(monkeypatch):
+    """Strategy instances holding resources are closed with the app."""
+    closed = []
+
+    class ClosableStrategy:
+        async def aclose(self):
+            closed.append(self)
+
+    strategy = ClosableStrategy()
+    monkeypatch.setattr(gateway, "_strategy_instances", {"closable": strategy, "plain": object()})
+    monkeypatch.setattr(gateway, "_MAIN_LOOP", None)
+
+    with TestClient(gateway.app):
+        pass
+
+    assert closed == [strategy]